@@ -0,0 +1,92 @@
+import os
+
+# --- Konfigurasi aplikasi ---
+# Semua nilai dapat diubah melalui environment variable.
+
+# Jumlah maksimum fungsi terkompilasi yang disimpan di cache
+COMPILED_CACHE_SIZE = int(os.getenv("COMPILED_CACHE_SIZE", "256"))
+
+# Jumlah maksimum hasil parsing LaTeX (dan konversi sympy) yang disimpan di cache
+PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", "1024"))
+
+# Isi 1 untuk memanaskan parser LaTeX dan cache saat aplikasi mulai, 0 untuk menonaktifkan
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "1") == "1"
+
+# Ekspresi LaTeX yang dipanaskan saat startup (parsing, kompilasi, turunan, dan
+# antiturunan), dipisahkan titik koma. Kosongkan untuk memakai daftar bawaan.
+WARMUP_LATEX = [
+    latex.strip() for latex in os.getenv("WARMUP_LATEX", "").split(";") if latex.strip()
+]
+
+# Jumlah maksimum node AST dalam satu ekspresi fungsi
+EXPR_MAX_NODES = int(os.getenv("EXPR_MAX_NODES", "500"))
+
+# Nilai absolut maksimum pangkat konstan dalam ekspresi fungsi (misal x**1000)
+EXPR_MAX_EXPONENT = float(os.getenv("EXPR_MAX_EXPONENT", "1000"))
+
+# Jumlah maksimum baris tabel iterasi yang dicatat saat tracing aktif
+TRACE_MAX_ROWS = int(os.getenv("TRACE_MAX_ROWS", "1000"))
+
+# Jumlah maksimum hasil simbolik (turunan/antiturunan) yang disimpan di memori
+SYMBOLIC_CACHE_SIZE = int(os.getenv("SYMBOLIC_CACHE_SIZE", "512"))
+
+# Lokasi file SQLite yang dipakai bersama oleh semua worker server (mode multi-worker)
+# untuk cache hasil parsing LaTeX dan hasil simbolik. Kosongkan untuk menonaktifkan.
+SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", "")
+
+# Lokasi file SQLite untuk cache simbolik persisten. Kosongkan untuk menonaktifkan.
+# Default: sama dengan SHARED_CACHE_PATH.
+SYMBOLIC_CACHE_PATH = os.getenv("SYMBOLIC_CACHE_PATH", SHARED_CACHE_PATH)
+
+# Jumlah proses worker untuk komputasi simbolik (parse_latex, diff, integrate, latex).
+# Isi 0 untuk menjalankan komputasi simbolik langsung di proses server tanpa batas waktu.
+SYMBOLIC_POOL_SIZE = int(os.getenv("SYMBOLIC_POOL_SIZE", "2"))
+
+# Jumlah maksimum tugas simbolik yang boleh menunggu di antrian pool
+SYMBOLIC_QUEUE_DEPTH = int(os.getenv("SYMBOLIC_QUEUE_DEPTH", "16"))
+
+# Batas waktu (detik) satu komputasi simbolik sebelum dibatalkan
+SYMBOLIC_TIMEOUT = float(os.getenv("SYMBOLIC_TIMEOUT", "5"))
+
+# Metode start proses worker: "spawn", "forkserver", atau "fork".
+# Hindari "fork": worker akan mewarisi socket koneksi klien yang sedang terbuka.
+SYMBOLIC_POOL_START_METHOD = os.getenv("SYMBOLIC_POOL_START_METHOD", "spawn")
+
+# Jumlah thread untuk komputasi numerik di luar event loop
+COMPUTE_WORKERS = int(os.getenv("COMPUTE_WORKERS", "4"))
+
+# Jumlah maksimum permintaan yang boleh menunggu thread komputasi.
+# Jika penuh, server membalas HTTP 503 dengan header Retry-After.
+COMPUTE_QUEUE_DEPTH = int(os.getenv("COMPUTE_QUEUE_DEPTH", "32"))
+
+# Nilai header Retry-After (detik) saat antrian komputasi penuh
+COMPUTE_RETRY_AFTER = int(os.getenv("COMPUTE_RETRY_AFTER", "1"))
+
+# Isi 1 untuk menambahkan header Server-Timing (durasi per tahap) pada respons
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "0") == "1"
+
+# Jumlah maksimum respons /turunan/ dan /integral/ yang disimpan di cache respons.
+# Isi 0 untuk menonaktifkan cache (permintaan identik yang bersamaan tetap digabung).
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+
+# Masa berlaku (detik) entri cache respons, juga dipakai untuk header Cache-Control
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+
+# Jumlah titik maksimum per panel untuk integral dengan N sangat besar.
+# Jika N + 1 melebihi nilai ini, interval dibagi menjadi panel yang dievaluasi
+# paralel sehingga memori puncak dibatasi ukuran panel, bukan N.
+INTEGRAL_CHUNK_SIZE = int(os.getenv("INTEGRAL_CHUNK_SIZE", "1048576"))
+
+# Jumlah thread untuk mengevaluasi panel integral secara paralel
+INTEGRAL_WORKERS = int(os.getenv("INTEGRAL_WORKERS", str(os.cpu_count() or 1)))
+
+# Jumlah maksimum evaluasi fungsi untuk integral lipat (/integral/multi):
+# jumlah titik grid (N+1)^d atau jumlah sampel quasi-Monte Carlo
+MULTI_MAX_EVALUASI = int(os.getenv("MULTI_MAX_EVALUASI", "16777216"))
+
+# Jumlah sampel quasi-Monte Carlo yang dievaluasi per batch. Memori puncak
+# sebanding dengan ukuran batch, dan estimasi error diperbarui setiap batch.
+QMC_BATCH_SIZE = int(os.getenv("QMC_BATCH_SIZE", "65536"))
+
+# Jumlah maksimum kombinasi perhitungan dalam satu permintaan batch
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "10000"))
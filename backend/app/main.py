@@ -1,11 +1,65 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from routers import derivative_routes, integral_routes
 from fastapi.middleware.cors import CORSMiddleware
 
+from config import COMPUTE_RETRY_AFTER, WARMUP_ON_STARTUP
+from services.executor import ComputeQueueFullError, compute_stats, run_compute
+from services.metrics import DURASI_TAHAP, EVALUASI_FUNGSI, render_gauge
+from services.respons_cache import respons_cache_stats
+from services.symbolic import pemanasan_simbolik, symbolic_cache_stats
+from services.symbolic_pool import SymbolicUnavailableError, tanpa_pool
+from services.utils import compiled_cache_stats, parse_cache_stats, pemanasan
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Memanaskan parser LaTeX, cache parsing, dan cache simbolik sebelum server
+    menerima permintaan.
+
+    Dalam mode multi-worker yang sudah dipramuat (lihat `pramuat`), langkah ini
+    hampir seluruhnya cache hit; yang tersisa hanya memuat parser di worker simbolik.
+    """
+    if WARMUP_ON_STARTUP:
+        try:
+            await run_compute(pemanasan)
+            await run_compute(pemanasan_simbolik)
+        except Exception as e:
+            # Server tetap berjalan; permintaan pertama saja yang lebih lambat
+            logger.warning("Pemanasan gagal: %s", e)
+    yield
+
+
+def pramuat(daftar_latex=None):
+    """
+    Memuat modul berat dan memanaskan cache di proses master sebelum worker di-fork.
+
+    Dipanggil oleh profil gunicorn (`gunicorn.conf.py`, `preload_app`). Sympy,
+    parser ANTLR, serta isi cache parsing, kompilasi, dan simbolik lalu dibagi
+    ke semua worker secara copy-on-write, sehingga worker baru langsung panas.
+    Komputasi simbolik dijalankan langsung di master agar tidak ada process pool
+    atau thread yang ikut ter-fork.
+
+    Args:
+        daftar_latex (list[str], optional): Ekspresi LaTeX yang dipanaskan.
+            Default: `LATEX_PEMANASAN`.
+    """
+    with tanpa_pool():
+        pemanasan(daftar_latex)
+        pemanasan_simbolik(daftar_latex)
+
+
 app = FastAPI(
     title="API Metode Numerik",
     description="API untuk menyelesaikan turunan dan integral menggunakan berbagai metode numerik.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 origins = [
     "http://localhost",
@@ -18,12 +72,38 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Cache"],
 )
 
 app.include_router(derivative_routes.router)
 app.include_router(integral_routes.router)
 
 
+@app.exception_handler(ComputeQueueFullError)
+async def compute_queue_full_handler(request: Request, exc: ComputeQueueFullError):
+    """
+    Membalas HTTP 503 jika antrian komputasi penuh.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(COMPUTE_RETRY_AFTER)},
+    )
+
+
+@app.exception_handler(SymbolicUnavailableError)
+async def symbolic_unavailable_handler(request: Request, exc: SymbolicUnavailableError):
+    """
+    Membalas HTTP 503 jika parsing LaTeX tidak dapat dijalankan karena worker
+    simbolik sibuk, berhenti, atau melebihi batas waktu.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(COMPUTE_RETRY_AFTER)},
+    )
+
+
 # --- Endpoint Health Check ---
 @app.get("/", tags=["Health Check"])
 async def health_check():
@@ -34,3 +114,61 @@ async def health_check():
         "message": "Selamat datang di API Metode Numerik!",
         "status": "healthy",
     }
+
+
+@app.get("/statistik", tags=["Health Check"])
+async def statistik():
+    """
+    Statistik cache (parsing LaTeX, fungsi terkompilasi, hasil simbolik, respons) dan antrian komputasi.
+    """
+    return {
+        "parse_latex": parse_cache_stats(),
+        "fungsi_terkompilasi": compiled_cache_stats(),
+        "simbolik": symbolic_cache_stats(),
+        "respons": respons_cache_stats(),
+        "komputasi": compute_stats(),
+    }
+
+
+@app.get("/metrics", tags=["Health Check"], response_class=PlainTextResponse)
+async def metrics():
+    """
+    Metrik dalam format teks Prometheus: histogram durasi per tahap, jumlah
+    evaluasi fungsi, statistik cache, dan antrian komputasi.
+    """
+    cache = {
+        "parse_latex": parse_cache_stats(),
+        "fungsi_terkompilasi": compiled_cache_stats(),
+        "simbolik": symbolic_cache_stats(),
+        "respons": respons_cache_stats(),
+    }
+    bagian = [DURASI_TAHAP.render(), EVALUASI_FUNGSI.render()]
+    for kolom, jenis, deskripsi in [
+        ("hits", "counter", "Jumlah cache hit."),
+        ("misses", "counter", "Jumlah cache miss."),
+        ("evictions", "counter", "Jumlah entri yang dibuang dari cache."),
+        ("size", "gauge", "Jumlah entri di cache."),
+    ]:
+        nama = f"metode_numerik_cache_{kolom}" + (
+            "_total" if jenis == "counter" else ""
+        )
+        nilai = {(("cache", c),): stats[kolom] for c, stats in cache.items()}
+        bagian.append(render_gauge(nama, deskripsi, nilai, jenis))
+    bagian.append(
+        render_gauge(
+            "metode_numerik_respons_digabung_total",
+            "Jumlah permintaan yang digabung dengan komputasi identik yang sedang berjalan.",
+            {(): cache["respons"]["coalesced"]},
+            "counter",
+        )
+    )
+    bagian.append(
+        render_gauge(
+            "metode_numerik_komputasi_aktif",
+            "Jumlah permintaan yang sedang berjalan atau menunggu thread komputasi.",
+            {(): compute_stats()["aktif"]},
+        )
+    )
+    return PlainTextResponse(
+        "\n".join(bagian) + "\n", media_type="text/plain; version=0.0.4"
+    )
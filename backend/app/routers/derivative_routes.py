@@ -1,83 +1,490 @@
-from fastapi import APIRouter, HTTPException, Form
-from pydantic import BaseModel
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Form, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional
+import logging
 import numpy as np
 
-from services.utils import hitung_error_persen, parse_latex_to_python
+from config import BATCH_MAX_ITEMS
+from services.analisis import AnalisisFungsi, analisis_fungsi
+from services.executor import iter_compute, run_compute
+from services.metrics import PengukurTahap, respons_terukur
+from services.respons_cache import kunci_permintaan, respons_tercache
+from services.symbolic import turunan_tercache
+from services.streaming import (
+    FORMAT_STREAM,
+    EventSelesai,
+    respons_stream,
+)
+from services.symbolic_pool import SymbolicUnavailableError
+from services.tracing import BarisTrace, Tracer
+from services.utils import (
+    compile_func,
+    fungsi_tercompile,
+    hitung_error_persen,
+    hitung_error_persen_array,
+    latex_tercache,
+    parse_latex_to_python,
+)
 from services.derivative_module import (
+    JENIS_STENSIL,
+    barisan_turunan,
+    h_optimal,
+    selisih_array,
     selisih_maju,
     selisih_mundur,
     selisih_tengahan,
-    turunan_analitik,
+    turunan_analitik_array,
+    turunan_analitik_cepat,
+    turunan_kompleks,
+    turunan_kompleks_array,
+    turunan_richardson,
+    turunan_stensil,
 )
 
+logger = logging.getLogger(__name__)
+
 # --- Router Setup ---
 router = APIRouter(prefix="/turunan", tags=["Metode Numerik Turunan"])
 
+METODE_VALID = [
+    "selisih-maju",
+    "selisih-tengahan",
+    "selisih-mundur",
+    "langkah-kompleks",
+]
+REFERENSI_VALID = ["simbolik", "kompleks"]
+METODE_KONVERGENSI = [
+    "selisih-maju",
+    "selisih-tengahan",
+    "selisih-mundur",
+    "richardson",
+]
+
 
 # --- Response Model ---
 class DerivativeCalcResponse(BaseModel):
     metode: str
     input_fungsi: str
-    turunan_fungsi: str
+    turunan_fungsi: Optional[str] = None
     input_x: float
     input_h: float
+    orde_turunan: int = 1
     hasil_numerik: float
     hasil_analitik: Optional[float] = None
     error_relatif: Optional[str] = None
+    alasan_analitik: Optional[str] = None
+    estimasi_error: Optional[float] = None
+    jumlah_evaluasi: Optional[int] = None
+    trace: Optional[List[BarisTrace]] = None
+    trace_terpotong: Optional[bool] = None
+    analisis: Optional[AnalisisFungsi] = None
+    jalur_analitik: Optional[str] = None
+
+
+# --- Batch Model ---
+class DerivativeBatchRequest(BaseModel):
+    fungsi_latex: str = Field(
+        description="Fungsi matematika dalam format LaTex. Contoh: _x^2_"
+    )
+    metode: List[str] = Field(
+        min_length=1,
+        description="Daftar metode: _selisih-maju_, _selisih-tengahan_, _selisih-mundur_, _langkah-kompleks_",
+    )
+    x: List[float] = Field(min_length=1, description="Daftar nilai x.")
+    h: List[float] = Field(
+        min_length=1,
+        description="Daftar ukuran langkah. Semua harus lebih besar dari 0.",
+    )
+    referensi: str = Field(
+        "simbolik",
+        description="Sumber nilai analitik: _simbolik_ (sympy) atau _kompleks_ (langkah kompleks, tanpa sympy).",
+    )
+
+
+# --- Streaming Model ---
+class KonvergensiTurunanMulai(BaseModel):
+    jenis: str = "mulai"
+    metode: str
+    input_fungsi: str
+    turunan_fungsi: Optional[str] = None
+    input_x: float
+    orde_turunan: int = 1
+    hasil_analitik: Optional[float] = None
+    alasan_analitik: Optional[str] = None
+
+
+class KonvergensiTurunanLangkah(BaseModel):
+    jenis: str = "langkah"
+    langkah: int
+    h: float
+    hasil_numerik: float
+    error_absolut: Optional[float] = None
+    estimasi_error: Optional[float] = None
+    jumlah_evaluasi: int
+
+
+class DerivativeBatchResponse(BaseModel):
+    input_fungsi: str
+    turunan_fungsi: Optional[str] = None
+    metode: List[str]
+    x: List[float]
+    h: List[float]
+    hasil_numerik: List[Optional[float]]
+    hasil_analitik: Optional[List[Optional[float]]] = None
+    error_relatif: Optional[List[Optional[float]]] = None
+    alasan_analitik: Optional[str] = None
+    alasan_titik: List[Optional[str]]
 
 
 # --- Endpoints ---
 @router.post("/", response_model=DerivativeCalcResponse)
 async def solve_derivative_form(
+    request: Request,
     metode: str = Form(
-        description="Metode turunan numerik yang akan digunakan: _selisih-maju_, _selisih_tengahan_, _selisih-mundur_"
+        description="Metode turunan numerik yang akan digunakan: _selisih-maju_, _selisih_tengahan_, _selisih-mundur_, _stensil_, _richardson_, _langkah-kompleks_"
     ),
     fungsi_latex: str = Form(
         description="Fungsi matematika dalam format LaTex. Contoh: _x^2_ atau _\\frac{1}{2}x_"
     ),
     x: float = Form(description="Nilai x di mana turunan akan dihitung."),
-    h_step: float = Form(
+    h_step: Optional[float] = Form(
+        None,
         alias="h",
-        description="Ukuran langkah (step size). Harus lebih besar dari 0.",
+        description="Ukuran langkah (step size). Harus lebih besar dari 0. Jika kosong, h optimal dipilih otomatis.",
         gt=0,  # h > 0
     ),
+    orde_turunan: int = Form(
+        1,
+        description="Orde turunan untuk metode _stensil_ dan _richardson_ (1 untuk f', 2 untuk f'', dst.).",
+        ge=1,
+        le=6,
+    ),
+    orde_akurasi: int = Form(
+        2,
+        description="Orde akurasi stensil untuk metode _stensil_. Harus genap untuk stensil tengahan.",
+        ge=1,
+        le=10,
+    ),
+    jenis_stensil: str = Form(
+        "tengahan",
+        description="Jenis stensil untuk metode _stensil_: _tengahan_, _maju_, _mundur_.",
+    ),
+    level: int = Form(
+        4,
+        description="Jumlah ukuran langkah (h, h/2, ...) untuk metode _richardson_.",
+        ge=2,
+        le=10,
+    ),
+    referensi: str = Form(
+        "simbolik",
+        description="Sumber nilai analitik: _simbolik_ (sympy) atau _kompleks_ (langkah kompleks, tanpa sympy; hanya turunan pertama).",
+    ),
+    trace: bool = Form(
+        False,
+        description="Jika _true_, sertakan tabel iterasi (i, x_i, f(x_i), bobot) pada respons.",
+    ),
 ):
     """
     Menghitung turunan dari suatu fungsi menggunakan metode numerik yang dipilih.
     """
+    return await _jawab_turunan(
+        request,
+        metode,
+        fungsi_latex,
+        x,
+        h_step,
+        orde_turunan,
+        orde_akurasi,
+        jenis_stensil,
+        level,
+        referensi,
+        trace,
+    )
+
+
+@router.get("/", response_model=DerivativeCalcResponse)
+async def solve_derivative_query(
+    request: Request,
+    metode: str = Query(
+        description="Metode turunan numerik yang akan digunakan: _selisih-maju_, _selisih_tengahan_, _selisih-mundur_, _stensil_, _richardson_, _langkah-kompleks_"
+    ),
+    fungsi_latex: str = Query(
+        description="Fungsi matematika dalam format LaTex. Contoh: _x^2_ atau _\\frac{1}{2}x_"
+    ),
+    x: float = Query(description="Nilai x di mana turunan akan dihitung."),
+    h_step: Optional[float] = Query(
+        None,
+        alias="h",
+        description="Ukuran langkah (step size). Harus lebih besar dari 0. Jika kosong, h optimal dipilih otomatis.",
+        gt=0,  # h > 0
+    ),
+    orde_turunan: int = Query(
+        1,
+        description="Orde turunan untuk metode _stensil_ dan _richardson_ (1 untuk f', 2 untuk f'', dst.).",
+        ge=1,
+        le=6,
+    ),
+    orde_akurasi: int = Query(
+        2,
+        description="Orde akurasi stensil untuk metode _stensil_. Harus genap untuk stensil tengahan.",
+        ge=1,
+        le=10,
+    ),
+    jenis_stensil: str = Query(
+        "tengahan",
+        description="Jenis stensil untuk metode _stensil_: _tengahan_, _maju_, _mundur_.",
+    ),
+    level: int = Query(
+        4,
+        description="Jumlah ukuran langkah (h, h/2, ...) untuk metode _richardson_.",
+        ge=2,
+        le=10,
+    ),
+    referensi: str = Query(
+        "simbolik",
+        description="Sumber nilai analitik: _simbolik_ (sympy) atau _kompleks_ (langkah kompleks, tanpa sympy; hanya turunan pertama).",
+    ),
+    trace: bool = Query(
+        False,
+        description="Jika _true_, sertakan tabel iterasi (i, x_i, f(x_i), bobot) pada respons.",
+    ),
+):
+    """
+    Sama dengan `POST /turunan/`, dengan parameter di query string sehingga
+    respons dapat di-cache oleh browser dan proxy (header ETag dan Cache-Control).
+    """
+    return await _jawab_turunan(
+        request,
+        metode,
+        fungsi_latex,
+        x,
+        h_step,
+        orde_turunan,
+        orde_akurasi,
+        jenis_stensil,
+        level,
+        referensi,
+        trace,
+    )
+
+
+async def _jawab_turunan(
+    request: Request,
+    metode: str,
+    fungsi_latex: str,
+    x: float,
+    h_step: Optional[float],
+    orde_turunan: int,
+    orde_akurasi: int,
+    jenis_stensil: str,
+    level: int,
+    referensi: str,
+    trace: bool,
+):
+    """
+    Validasi input, lalu ambil respons dari cache atau hitung sekali untuk semua
+    permintaan identik yang bersamaan.
+    """
+    if referensi not in REFERENSI_VALID:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Referensi '{referensi}' tidak valid. Gunakan 'simbolik' atau 'kompleks'.",
+        )
+    if (
+        referensi == "kompleks"
+        and metode in ["stensil", "richardson"]
+        and orde_turunan != 1
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Referensi langkah kompleks hanya untuk turunan pertama.",
+        )
+    if jenis_stensil not in JENIS_STENSIL:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Jenis stensil '{jenis_stensil}' tidak valid. Gunakan 'tengahan', 'maju', atau 'mundur'.",
+        )
+
+    # Hanya parameter yang memengaruhi hasil metode ini yang masuk ke kunci cache
+    parameter_metode = {
+        "stensil": {
+            "orde_turunan": orde_turunan,
+            "orde_akurasi": orde_akurasi,
+            "jenis_stensil": jenis_stensil,
+        },
+        "richardson": {"orde_turunan": orde_turunan, "level": level},
+    }.get(metode, {})
+    kunci = kunci_permintaan(
+        "/turunan/",
+        fungsi_latex,
+        metode=metode,
+        x=x,
+        h=h_step,
+        referensi=referensi,
+        trace=trace,
+        **parameter_metode,
+    )
+
+    async def hitung():
+        pengukur = PengukurTahap()
+        respons = await run_compute(
+            _hitung_turunan,
+            metode,
+            fungsi_latex,
+            x,
+            h_step,
+            trace,
+            orde_turunan=orde_turunan,
+            orde_akurasi=orde_akurasi,
+            jenis_stensil=jenis_stensil,
+            level=level,
+            referensi=referensi,
+            pengukur=pengukur,
+        )
+        return respons_terukur(
+            respons, pengukur, "/turunan/", metode, respons.jumlah_evaluasi
+        )
+
+    return await respons_tercache(kunci, hitung, request.headers.get("if-none-match"))
+
+
+def _hitung_turunan(
+    metode: str,
+    fungsi_latex: str,
+    x: float,
+    h_step: Optional[float],
+    trace: bool,
+    orde_turunan: int = 1,
+    orde_akurasi: int = 2,
+    jenis_stensil: str = "tengahan",
+    level: int = 4,
+    referensi: str = "simbolik",
+    pengukur: Optional[PengukurTahap] = None,
+) -> DerivativeCalcResponse:
+    """
+    Bagian komputasi dari endpoint turunan; dijalankan di thread pool komputasi.
+    """
+    pengukur = pengukur if pengukur is not None else PengukurTahap()
 
     # Parsing fungsi LaTeX ke ekspresi Python
     try:
-        fungsi_python = parse_latex_to_python(fungsi_latex)
+        with pengukur.tahap("parse", cache=latex_tercache(fungsi_latex)):
+            fungsi_python = parse_latex_to_python(fungsi_latex)
+        with pengukur.tahap("compile", cache=fungsi_tercompile(fungsi_python)):
+            compile_func(fungsi_python, np)
+        with pengukur.tahap("analisis"):
+            analisis = analisis_fungsi(fungsi_python)
+    except SymbolicUnavailableError:
+        # Worker simbolik sibuk/berhenti bukan kesalahan input (dibalas 503)
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=400, detail=f"Gagal mem-parsing fungsi LaTeX: {str(e)}"
         )
     hasil_numerik = 0.0
+    estimasi_error = None
+    # Tanpa trace, tracer berkapasitas 0 hanya menghitung jumlah evaluasi fungsi
+    tracer = Tracer() if trace else Tracer(kapasitas=0)
+    if metode not in ["stensil", "richardson"]:
+        orde_turunan = 1
+    if h_step is None and metode == "langkah-kompleks":
+        # Tanpa pengurangan, h boleh jauh di bawah epsilon mesin
+        h_step = 1e-20
+    elif h_step is None:
+        # Orde akurasi: 1 untuk selisih maju/mundur, 2 untuk tengahan,
+        # 2 * level untuk tabel Richardson
+        akurasi = {
+            "selisih-maju": 1,
+            "selisih-mundur": 1,
+            "stensil": orde_akurasi,
+            "richardson": 2 * level,
+        }.get(metode, 2)
+        h_step = h_optimal(x, orde_turunan, akurasi)
     # Pemilihan metode dan perhitungan
     try:
-        if metode == "selisih-maju":
-            hasil_numerik = selisih_maju(fungsi_python, x, h_step, np_alias=np)
-        elif metode == "selisih-tengahan":
-            hasil_numerik = selisih_tengahan(fungsi_python, x, h_step, np_alias=np)
-        elif metode == "selisih-mundur":
-            hasil_numerik = selisih_mundur(fungsi_python, x, h_step, np_alias=np)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Metode '{metode}' tidak valid. Gunakan 'selisih-maju', 'selisih-tengahan', atau 'selisih-mundur'.",
-            )
+        with pengukur.tahap("numerik"):
+            if metode == "selisih-maju":
+                hasil_numerik = selisih_maju(
+                    fungsi_python, x, h_step, np_alias=np, tracer=tracer
+                )
+            elif metode == "selisih-tengahan":
+                hasil_numerik = selisih_tengahan(
+                    fungsi_python, x, h_step, np_alias=np, tracer=tracer
+                )
+            elif metode == "selisih-mundur":
+                hasil_numerik = selisih_mundur(
+                    fungsi_python, x, h_step, np_alias=np, tracer=tracer
+                )
+            elif metode == "stensil":
+                hasil_numerik = turunan_stensil(
+                    fungsi_python,
+                    x,
+                    h_step,
+                    orde_turunan=orde_turunan,
+                    orde_akurasi=orde_akurasi,
+                    jenis=jenis_stensil,
+                    np_alias=np,
+                    tracer=tracer,
+                )
+            elif metode == "richardson":
+                hasil_numerik, estimasi_error = turunan_richardson(
+                    fungsi_python,
+                    x,
+                    h_step,
+                    orde_turunan=orde_turunan,
+                    level=level,
+                    np_alias=np,
+                    tracer=tracer,
+                )
+            elif metode == "langkah-kompleks":
+                hasil_numerik = turunan_kompleks(
+                    fungsi_python, x, h_step, np_alias=np, tracer=tracer
+                )
+            else:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Metode '{metode}' tidak valid. Gunakan 'selisih-maju', 'selisih-tengahan', 'selisih-mundur', 'stensil', 'richardson', atau 'langkah-kompleks'.",
+                )
         # Hitung metode analitik dan cari error
+        alasan_analitik = jalur_analitik = alasan_kompleks = None
         try:
-            hasil_analitik, turunan_fungsi_latex = turunan_analitik(fungsi_python, x)
-            error_relatif = hitung_error_persen(hasil_numerik, hasil_analitik)
-            print(f"Hasil analitik =  {hasil_analitik}")
-            print(f"Error = {error_relatif}%")
+            if referensi == "kompleks":
+                try:
+                    with pengukur.tahap("analitik"):
+                        hasil_analitik = turunan_kompleks(fungsi_python, x, np_alias=np)
+                    turunan_fungsi_latex, jalur_analitik = None, "kompleks"
+                except ValueError as e:
+                    # Langkah kompleks tidak berlaku di sini: pakai acuan simbolik
+                    referensi, alasan_kompleks = "simbolik", str(e)
+            if referensi != "kompleks":
+                with pengukur.tahap(
+                    "analitik", cache=turunan_tercache(fungsi_python, orde_turunan)
+                ):
+                    (
+                        hasil_analitik,
+                        turunan_fungsi_latex,
+                        jalur_analitik,
+                    ) = turunan_analitik_cepat(fungsi_python, x, orde_turunan)
+            with pengukur.tahap("error"):
+                error_relatif = (
+                    str(hitung_error_persen(hasil_numerik, hasil_analitik)) + "%"
+                )
+        except SymbolicUnavailableError as e:
+            # Kembalikan hasil numerik saja jika komputasi simbolik gagal/timeout
+            hasil_analitik, turunan_fungsi_latex, error_relatif = None, None, None
+            alasan_analitik = str(e)
+            pengukur.sementara = True
         except ValueError as ve_analitik:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Turunan analitik tidak dapat dihitung: {str(ve_analitik)}",
+            if alasan_kompleks is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Turunan analitik tidak dapat dihitung: {str(ve_analitik)}",
+                )
+            # Kedua acuan gagal: hasil numerik tetap dikembalikan
+            hasil_analitik, turunan_fungsi_latex, error_relatif = None, None, None
+            alasan_analitik = (
+                f"{alasan_kompleks} Acuan simbolik juga gagal: {ve_analitik}"
             )
 
         return DerivativeCalcResponse(
@@ -86,15 +493,323 @@ async def solve_derivative_form(
             turunan_fungsi=turunan_fungsi_latex,
             input_x=x,
             input_h=h_step,
+            orde_turunan=orde_turunan,
             hasil_numerik=hasil_numerik,
             hasil_analitik=hasil_analitik,
-            error_relatif=str(error_relatif) + "%",
+            error_relatif=error_relatif,
+            alasan_analitik=alasan_analitik,
+            estimasi_error=estimasi_error,
+            jumlah_evaluasi=tracer.total_baris,
+            trace=tracer.tabel() if trace else None,
+            trace_terpotong=tracer.terpotong if trace else None,
+            analisis=analisis,
+            jalur_analitik=jalur_analitik,
         )
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
-    except HTTPException as e:
-        print("Error:", e)
-        raise HTTPException(status_code=400)
+    except HTTPException:
+        raise
     except Exception as e:
-        print("Terjadi error:", e)
+        logger.exception("Terjadi error: %s", e)
         raise HTTPException(status_code=500, detail="Terjadi kesalahan di server.")
+
+
+@router.post("/konvergensi", response_class=StreamingResponse)
+async def konvergensi_turunan(
+    metode: str = Form(
+        description="Metode turunan numerik: _selisih-maju_, _selisih-tengahan_, _selisih-mundur_, _richardson_."
+    ),
+    fungsi_latex: str = Form(
+        description="Fungsi matematika dalam format LaTex. Contoh: _x^2_ atau _\\frac{1}{2}x_"
+    ),
+    x: float = Form(description="Nilai x di mana turunan akan dihitung."),
+    h_step: float = Form(
+        0.1,
+        alias="h",
+        description="Ukuran langkah awal; dibagi dua di setiap langkah.",
+        gt=0,
+    ),
+    orde_turunan: int = Form(
+        1,
+        description="Orde turunan untuk metode _richardson_.",
+        ge=1,
+        le=6,
+    ),
+    maks_langkah: int = Form(
+        10,
+        description="Jumlah langkah maksimum (h terkecil = h / 2^(maks_langkah - 1)).",
+        ge=1,
+        le=40,
+    ),
+    toleransi: Optional[float] = Form(
+        None,
+        description="Berhenti lebih awal jika selisih dua langkah berurutan <= toleransi.",
+        gt=0,
+    ),
+    format: str = Form(
+        "ndjson",
+        description="Format aliran: _ndjson_ (satu JSON per baris) atau _sse_ (Server-Sent Events).",
+    ),
+):
+    """
+    Mengalirkan hasil turunan numerik untuk h, h/2, h/4, ...
+
+    Event `mulai` berisi nilai turunan analitik (dari cache simbolik), lalu satu
+    event `langkah` per ukuran langkah dengan error absolut terhadap nilai analitik,
+    dan event `selesai`. Nilai pada aliran tidak dibulatkan sehingga error
+    pemotongan (turun seiring h) dan error pembulatan (naik saat h sangat kecil)
+    sama-sama terlihat.
+    """
+    if metode not in METODE_KONVERGENSI:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Metode '{metode}' tidak valid. Gunakan 'selisih-maju', 'selisih-tengahan', 'selisih-mundur', atau 'richardson'.",
+        )
+    if format not in FORMAT_STREAM:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Format '{format}' tidak valid. Gunakan 'ndjson' atau 'sse'.",
+        )
+    if metode != "richardson":
+        orde_turunan = 1
+
+    fungsi_python, mulai = await run_compute(
+        _mulai_konvergensi_turunan, metode, fungsi_latex, x, orde_turunan
+    )
+    langkah = iter_compute(
+        _langkah_konvergensi_turunan(
+            metode,
+            fungsi_python,
+            x,
+            h_step,
+            orde_turunan,
+            maks_langkah,
+            toleransi,
+            mulai.hasil_analitik,
+        )
+    )
+    return respons_stream([mulai], langkah, format)
+
+
+def _mulai_konvergensi_turunan(
+    metode: str, fungsi_latex: str, x: float, orde_turunan: int
+):
+    """
+    Mem-parsing fungsi dan menghitung nilai analitik sebelum aliran dimulai.
+    """
+    try:
+        fungsi_python = parse_latex_to_python(fungsi_latex)
+        compile_func(fungsi_python, np)
+    except SymbolicUnavailableError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400, detail=f"Gagal mem-parsing fungsi LaTeX: {str(e)}"
+        )
+
+    hasil_analitik = turunan_fungsi_latex = alasan_analitik = None
+    try:
+        hasil_analitik, turunan_fungsi_latex, _ = turunan_analitik_cepat(
+            fungsi_python, x, orde_turunan, bulatkan=False
+        )
+    except (SymbolicUnavailableError, ValueError) as e:
+        # Aliran numerik tetap berjalan, hanya tanpa error terhadap nilai analitik
+        alasan_analitik = str(e)
+
+    return fungsi_python, KonvergensiTurunanMulai(
+        metode=metode,
+        input_fungsi=fungsi_latex,
+        turunan_fungsi=turunan_fungsi_latex,
+        input_x=x,
+        orde_turunan=orde_turunan,
+        hasil_analitik=hasil_analitik,
+        alasan_analitik=alasan_analitik,
+    )
+
+
+def _langkah_konvergensi_turunan(
+    metode: str,
+    fungsi_python: str,
+    x: float,
+    h_step: float,
+    orde_turunan: int,
+    maks_langkah: int,
+    toleransi: Optional[float],
+    hasil_analitik: Optional[float],
+):
+    """
+    Generator event `langkah` dan `selesai`; setiap langkah dijalankan di thread pool.
+    """
+    nilai_lama = None
+    barisan = barisan_turunan(
+        fungsi_python, metode, x, h_step, orde_turunan=orde_turunan, np_alias=np
+    )
+    for langkah, (h, nilai, jumlah_evaluasi) in enumerate(barisan, start=1):
+        estimasi_error = abs(nilai - nilai_lama) if nilai_lama is not None else None
+        yield KonvergensiTurunanLangkah(
+            langkah=langkah,
+            h=h,
+            hasil_numerik=nilai,
+            error_absolut=(
+                abs(nilai - hasil_analitik) if hasil_analitik is not None else None
+            ),
+            estimasi_error=estimasi_error,
+            jumlah_evaluasi=jumlah_evaluasi,
+        )
+        nilai_lama = nilai
+
+        if toleransi is not None and estimasi_error is not None:
+            if estimasi_error <= toleransi:
+                alasan = "toleransi"
+                break
+        if langkah >= maks_langkah:
+            alasan = "maks_langkah"
+            break
+
+    yield EventSelesai(
+        alasan=alasan,
+        hasil_numerik=nilai,
+        jumlah_langkah=langkah,
+        jumlah_evaluasi=jumlah_evaluasi,
+    )
+
+
+@router.post("/batch", response_model=DerivativeBatchResponse)
+async def solve_derivative_batch(permintaan: DerivativeBatchRequest):
+    """
+    Menghitung turunan untuk semua kombinasi metode × h × x dalam satu permintaan.
+
+    Fungsi di-parse dan turunan simbolik dihitung sekali saja. Hasil dikembalikan
+    dalam bentuk kolom (array sejajar), `error_relatif` dalam persen.
+    """
+    if any(h <= 0 for h in permintaan.h):
+        raise HTTPException(
+            status_code=400,
+            detail="Ukuran langkah 'h' (step size) harus lebih besar dari 0",
+        )
+    for metode in permintaan.metode:
+        if metode not in METODE_VALID:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Metode '{metode}' tidak valid. Gunakan 'selisih-maju', 'selisih-tengahan', 'selisih-mundur', atau 'langkah-kompleks'.",
+            )
+    if permintaan.referensi not in REFERENSI_VALID:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Referensi '{permintaan.referensi}' tidak valid. Gunakan 'simbolik' atau 'kompleks'.",
+        )
+    jumlah = len(permintaan.metode) * len(permintaan.h) * len(permintaan.x)
+    if jumlah > BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Jumlah kombinasi ({jumlah}) melebihi batas {BATCH_MAX_ITEMS}.",
+        )
+    return await run_compute(_hitung_turunan_batch, permintaan)
+
+
+def _hitung_turunan_batch(
+    permintaan: DerivativeBatchRequest,
+) -> DerivativeBatchResponse:
+    try:
+        fungsi_python = parse_latex_to_python(permintaan.fungsi_latex)
+    except SymbolicUnavailableError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400, detail=f"Gagal mem-parsing fungsi LaTeX: {str(e)}"
+        )
+
+    # Grid semua kombinasi: metode (luar) × h × x (dalam)
+    x_grid, h_grid = np.meshgrid(permintaan.x, permintaan.h)
+    x_kolom, h_kolom = x_grid.ravel(), h_grid.ravel()
+    hasil_numerik = np.concatenate(
+        [
+            _selisih_batch(fungsi_python, metode, x_kolom, h_kolom)
+            for metode in permintaan.metode
+        ]
+    )
+
+    hasil_analitik = error_relatif = None
+    turunan_fungsi_latex = alasan_analitik = None
+    try:
+        analitik_x = None
+        if permintaan.referensi == "kompleks":
+            try:
+                analitik_x = np.round(
+                    turunan_kompleks_array(fungsi_python, permintaan.x, np_alias=np), 3
+                )
+            except ValueError:
+                # Fungsi non-analitik: seluruh acuan dihitung simbolik
+                pass
+        if analitik_x is None or np.any(np.isnan(analitik_x)):
+            # Titik di mana langkah kompleks tidak berlaku memakai acuan simbolik
+            simbolik_x, turunan_fungsi_latex = turunan_analitik_array(
+                fungsi_python, permintaan.x
+            )
+            analitik_x = (
+                simbolik_x
+                if analitik_x is None
+                else np.where(np.isnan(analitik_x), simbolik_x, analitik_x)
+            )
+        hasil_analitik = np.tile(analitik_x, len(permintaan.h) * len(permintaan.metode))
+        error_relatif = hitung_error_persen_array(hasil_numerik, hasil_analitik)
+    except SymbolicUnavailableError as e:
+        alasan_analitik = str(e)
+    except ValueError as ve_analitik:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Turunan analitik tidak dapat dihitung: {str(ve_analitik)}",
+        )
+
+    # Alasan per baris jika hasil numerik atau analitik tidak terdefinisi
+    x_baris = np.tile(x_kolom, len(permintaan.metode))
+    alasan_titik = []
+    for i, x_i in enumerate(x_baris):
+        alasan = []
+        if not np.isfinite(hasil_numerik[i]):
+            alasan.append(f"Hasil numerik tidak terdefinisi di x={x_i}.")
+        if hasil_analitik is not None and not np.isfinite(hasil_analitik[i]):
+            alasan.append(f"Turunan analitik tidak terdefinisi (real) di x={x_i}.")
+        alasan_titik.append(" ".join(alasan) or None)
+
+    jumlah_per_metode = x_kolom.size
+    return DerivativeBatchResponse(
+        input_fungsi=permintaan.fungsi_latex,
+        turunan_fungsi=turunan_fungsi_latex,
+        metode=[m for m in permintaan.metode for _ in range(jumlah_per_metode)],
+        x=x_baris.tolist(),
+        h=np.tile(h_kolom, len(permintaan.metode)).tolist(),
+        hasil_numerik=_daftar_opsional(hasil_numerik),
+        hasil_analitik=(
+            _daftar_opsional(hasil_analitik) if hasil_analitik is not None else None
+        ),
+        error_relatif=(
+            _daftar_opsional(error_relatif) if error_relatif is not None else None
+        ),
+        alasan_analitik=alasan_analitik,
+        alasan_titik=alasan_titik,
+    )
+
+
+def _selisih_batch(fungsi_python: str, metode: str, x, h):
+    """
+    Seperti `selisih_array`, tetapi titik yang gagal dievaluasi (misal 1/x di
+    x=0) bernilai NaN alih-alih menggagalkan seluruh batch.
+    """
+    try:
+        return selisih_array(fungsi_python, metode, x, h, np_alias=np)
+    except ValueError:
+        hasil = np.full(x.shape, np.nan)
+        for i in range(x.size):
+            try:
+                hasil[i] = selisih_array(
+                    fungsi_python, metode, x[i : i + 1], h[i : i + 1], np_alias=np
+                )[0]
+            except ValueError:
+                pass
+        return hasil
+
+
+def _daftar_opsional(nilai) -> List[Optional[float]]:
+    # NaN/tak hingga ditulis null di JSON
+    return [float(v) if np.isfinite(v) else None for v in nilai]
@@ -1,25 +1,73 @@
-from fastapi import APIRouter, HTTPException, Form
-from pydantic import BaseModel
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Form, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional, Tuple
+import logging
+import math
 import numpy as np
 
-from services.utils import hitung_error, hitung_h, parse_latex_to_python
+from config import BATCH_MAX_ITEMS, MULTI_MAX_EVALUASI
+from services.analisis import AnalisisFungsi, analisis_fungsi
+from services.executor import iter_compute, run_compute
+from services.metrics import PengukurTahap, respons_terukur
+from services.penjumlahan import MODE_AKUMULASI, Akumulator
+from services.respons_cache import kunci_permintaan, respons_tercache
+from services.symbolic import (
+    antiturunan_simbolik,
+    antiturunan_tercache,
+    integral_lipat_simbolik,
+)
+from services.streaming import (
+    FORMAT_STREAM,
+    EventSelesai,
+    respons_stream,
+)
+from services.symbolic_pool import SymbolicUnavailableError
+from services.tracing import BarisTrace, Tracer
+from services.utils import (
+    compile_func,
+    fungsi_tercompile,
+    hitung_error,
+    hitung_h,
+    latex_tercache,
+    parse_latex_to_python,
+    to_sympy,
+)
 from services.integral_module import (
     riemann_integral,
     trapezoida_integral,
     simpson_integral,
+    adaptif_integral,
+    romberg_integral,
+    barisan_romberg,
+    gauss_legendre_integral,
+    tanh_sinh_integral,
     integral_analitik,
+    integral_analitik_cepat,
+    derajat_kuadratur_eksak,
 )
+from services.integral_multi import (
+    METODE_GRID,
+    METODE_QMC,
+    VARIABEL_MULTI,
+    integral_grid,
+    qmc_integral,
+)
+
+logger = logging.getLogger(__name__)
 
 # --- Router Setup ---
 router = APIRouter(prefix="/integral", tags=["Metode Numerik Integral"])
 
+# Metode yang barisannya memakai ulang sampel saat N digandakan
+METODE_KONVERGENSI = ["trapezoida", "simpson", "romberg"]
+
 
 # --- Response Model ---
 class IntegralCalcResponse(BaseModel):
     metode: str
     input_fungsi: str
-    integral_fungsi: str
+    integral_fungsi: Optional[str] = None
     input_batas_bawah: float
     input_batas_atas: float
     input_h: Optional[float] = None
@@ -27,19 +75,156 @@ class IntegralCalcResponse(BaseModel):
     hasil_numerik: float
     hasil_analitik: Optional[float] = None
     error_relatif: Optional[str] = None
+    alasan_analitik: Optional[str] = None
+    estimasi_error: Optional[float] = None
+    estimasi_error_pembulatan: Optional[float] = None
+    akumulasi: Optional[str] = None
+    jumlah_evaluasi: Optional[int] = None
+    tabel_romberg: Optional[List[List[float]]] = None
+    trace: Optional[List[BarisTrace]] = None
+    trace_terpotong: Optional[bool] = None
+    analisis: Optional[AnalisisFungsi] = None
+    jalur_numerik: Optional[str] = None
+    jalur_analitik: Optional[str] = None
+
+
+# --- Batch Model ---
+class IntegralBatchRequest(BaseModel):
+    fungsi_latex: str = Field(
+        description="Fungsi matematika dalam format LaTex. Contoh: _x^2_"
+    )
+    metode: List[str] = Field(
+        min_length=1, description="Daftar metode: _riemann_, _trapezoida_, _simpson_."
+    )
+    interval: List[Tuple[float, float]] = Field(
+        min_length=1, description="Daftar pasangan [batas_bawah, batas_atas]."
+    )
+    N: Optional[List[int]] = Field(
+        None, description="Daftar jumlah segmen untuk _trapezoida_ dan _simpson_."
+    )
+    h: Optional[List[float]] = Field(
+        None, description="Daftar ukuran langkah untuk _riemann_."
+    )
+
+
+# --- Multi Model ---
+class IntegralMultiRequest(BaseModel):
+    fungsi_latex: str = Field(
+        description="Fungsi dalam variabel x, y, z dalam format LaTex. Contoh: _x y^2 + z_"
+    )
+    metode: str = Field(
+        description="Metode: _trapezoida_, _simpson_, _gauss-legendre_ (produk tensor), atau _sobol_, _halton_ (quasi-Monte Carlo)."
+    )
+    batas: List[Tuple[float, float]] = Field(
+        min_length=1,
+        max_length=3,
+        description="Pasangan [batas_bawah, batas_atas] untuk x, lalu y, lalu z.",
+    )
+    N: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Jumlah segmen (atau titik Gauss) per sumbu. Diperlukan untuk metode produk tensor.",
+    )
+    n_sampel: int = Field(
+        65536,
+        ge=2,
+        description="Jumlah evaluasi fungsi maksimum untuk metode quasi-Monte Carlo.",
+    )
+    toleransi: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Berhenti lebih awal jika estimasi error quasi-Monte Carlo <= toleransi.",
+    )
+    replika: int = Field(
+        8,
+        ge=2,
+        le=64,
+        description="Jumlah pergeseran acak untuk estimasi error quasi-Monte Carlo.",
+    )
+    seed: int = Field(0, ge=0, description="Seed pergeseran acak quasi-Monte Carlo.")
+    akumulasi: str = Field(
+        "berpasangan",
+        description="Mode penjumlahan untuk metode produk tensor: _naif_, _kahan_, _berpasangan_, atau _fsum_.",
+    )
+
+
+class LangkahQMC(BaseModel):
+    jumlah_evaluasi: int
+    hasil_numerik: float
+    estimasi_error: float
+
+
+class IntegralMultiResponse(BaseModel):
+    metode: str
+    input_fungsi: str
+    integral_fungsi: Optional[str] = None
+    variabel: List[str]
+    batas: List[Tuple[float, float]]
+    input_N: Optional[int] = None
+    hasil_numerik: float
+    hasil_analitik: Optional[float] = None
+    error_relatif: Optional[str] = None
+    alasan_analitik: Optional[str] = None
+    estimasi_error: Optional[float] = None
+    estimasi_error_pembulatan: Optional[float] = None
+    akumulasi: Optional[str] = None
+    jumlah_evaluasi: int
+    riwayat: Optional[List[LangkahQMC]] = None
+
+
+# --- Streaming Model ---
+class KonvergensiIntegralMulai(BaseModel):
+    jenis: str = "mulai"
+    metode: str
+    input_fungsi: str
+    integral_fungsi: Optional[str] = None
+    input_batas_bawah: float
+    input_batas_atas: float
+    hasil_analitik: Optional[float] = None
+    alasan_analitik: Optional[str] = None
+
+
+class KonvergensiIntegralLangkah(BaseModel):
+    jenis: str = "langkah"
+    langkah: int
+    N: int
+    h: float
+    hasil_numerik: float
+    error_absolut: Optional[float] = None
+    estimasi_error: Optional[float] = None
+    jumlah_evaluasi: int
+
+
+class IntegralBatchResponse(BaseModel):
+    input_fungsi: str
+    antiturunan_fungsi: Optional[str] = None
+    metode: List[str]
+    batas_bawah: List[float]
+    batas_atas: List[float]
+    h: List[float]
+    N: List[Optional[int]]
+    hasil_numerik: List[float]
+    hasil_analitik: Optional[List[float]] = None
+    error_relatif: Optional[List[float]] = None
+    alasan_analitik: Optional[str] = None
 
 
 # --- Endpoint ---
 @router.post("/", response_model=IntegralCalcResponse)
 async def solve_integral_form(
+    request: Request,
     metode: str = Form(
-        description="Metode integrasi numerik yang akan digunakan: _riemann_, _trapezoida_, _simpson_."
+        description="Metode integrasi numerik yang akan digunakan: _riemann_, _trapezoida_, _simpson_, _adaptif_, _romberg_, _gauss-legendre_, _tanh-sinh_."
     ),
     fungsi_latex: str = Form(
         description="Fungsi matematika dalam format LaTex. Contoh: _x^2_ atau _\\frac{1}{2}x_"
     ),
-    batas_bawah: float = Form(description="Batas bawah interval integrasi."),
-    batas_atas: float = Form(description="Batas atas interval integrasi."),
+    batas_bawah: float = Form(
+        description="Batas bawah interval integrasi. Boleh _-inf_ untuk metode _tanh-sinh_."
+    ),
+    batas_atas: float = Form(
+        description="Batas atas interval integrasi. Boleh _inf_ untuk metode _tanh-sinh_."
+    ),
     h_step: Optional[float] = Form(
         None,
         alias="h",
@@ -52,10 +237,168 @@ async def solve_integral_form(
         description="Jumlah sub-interval/segmen. Diperlukan untuk metode _trapezoida_ dan _simpson_.",
         ge=1,  # N >= 1
     ),
+    toleransi: float = Form(
+        1e-6,
+        description="Target error absolut untuk metode _adaptif_, _romberg_, dan _tanh-sinh_.",
+        gt=0,
+    ),
+    maks_evaluasi: int = Form(
+        10000,
+        description="Jumlah maksimum evaluasi fungsi untuk metode _adaptif_ dan _tanh-sinh_.",
+        ge=5,
+    ),
+    maks_level: int = Form(
+        20,
+        description="Jumlah level maksimum untuk metode _romberg_ (N terbesar = 2^maks_level).",
+        ge=1,
+        le=25,
+    ),
+    n_titik: Optional[int] = Form(
+        None,
+        description="Jumlah titik Gauss per panel. Diperlukan untuk metode _gauss-legendre_.",
+        ge=1,
+        le=1000,
+    ),
+    panel: int = Form(
+        1,
+        description="Jumlah panel untuk metode _gauss-legendre_ komposit.",
+        ge=1,
+    ),
+    akumulasi: str = Form(
+        "berpasangan",
+        description="Mode penjumlahan: _naif_, _kahan_ (Kahan-Neumaier), _berpasangan_ (pairwise), atau _fsum_ (math.fsum).",
+    ),
+    trace: bool = Form(
+        False,
+        description="Jika _true_, sertakan tabel iterasi (i, x_i, f(x_i), bobot) pada respons.",
+    ),
 ):
     """
     Menghitung integral dari suatu fungsi menggunakan metode numerik yang dipilih.
     """
+    return await _jawab_integral(
+        request,
+        metode,
+        fungsi_latex,
+        batas_bawah,
+        batas_atas,
+        h_step,
+        N_segments,
+        toleransi,
+        maks_evaluasi,
+        maks_level,
+        n_titik,
+        panel,
+        akumulasi,
+        trace,
+    )
+
+
+@router.get("/", response_model=IntegralCalcResponse)
+async def solve_integral_query(
+    request: Request,
+    metode: str = Query(
+        description="Metode integrasi numerik yang akan digunakan: _riemann_, _trapezoida_, _simpson_, _adaptif_, _romberg_, _gauss-legendre_, _tanh-sinh_."
+    ),
+    fungsi_latex: str = Query(
+        description="Fungsi matematika dalam format LaTex. Contoh: _x^2_ atau _\\frac{1}{2}x_"
+    ),
+    batas_bawah: float = Query(
+        description="Batas bawah interval integrasi. Boleh _-inf_ untuk metode _tanh-sinh_."
+    ),
+    batas_atas: float = Query(
+        description="Batas atas interval integrasi. Boleh _inf_ untuk metode _tanh-sinh_."
+    ),
+    h_step: Optional[float] = Query(
+        None,
+        alias="h",
+        description="Ukuran langkah (step size). Diperlukan untuk metode _riemann_. Jika N disediakan untuk metode lain, h akan dihitung",
+        gt=0,  # h > 0
+    ),
+    N_segments: Optional[int] = Query(
+        None,
+        alias="N",
+        description="Jumlah sub-interval/segmen. Diperlukan untuk metode _trapezoida_ dan _simpson_.",
+        ge=1,  # N >= 1
+    ),
+    toleransi: float = Query(
+        1e-6,
+        description="Target error absolut untuk metode _adaptif_, _romberg_, dan _tanh-sinh_.",
+        gt=0,
+    ),
+    maks_evaluasi: int = Query(
+        10000,
+        description="Jumlah maksimum evaluasi fungsi untuk metode _adaptif_ dan _tanh-sinh_.",
+        ge=5,
+    ),
+    maks_level: int = Query(
+        20,
+        description="Jumlah level maksimum untuk metode _romberg_ (N terbesar = 2^maks_level).",
+        ge=1,
+        le=25,
+    ),
+    n_titik: Optional[int] = Query(
+        None,
+        description="Jumlah titik Gauss per panel. Diperlukan untuk metode _gauss-legendre_.",
+        ge=1,
+        le=1000,
+    ),
+    panel: int = Query(
+        1,
+        description="Jumlah panel untuk metode _gauss-legendre_ komposit.",
+        ge=1,
+    ),
+    akumulasi: str = Query(
+        "berpasangan",
+        description="Mode penjumlahan: _naif_, _kahan_ (Kahan-Neumaier), _berpasangan_ (pairwise), atau _fsum_ (math.fsum).",
+    ),
+    trace: bool = Query(
+        False,
+        description="Jika _true_, sertakan tabel iterasi (i, x_i, f(x_i), bobot) pada respons.",
+    ),
+):
+    """
+    Sama dengan `POST /integral/`, dengan parameter di query string sehingga
+    respons dapat di-cache oleh browser dan proxy (header ETag dan Cache-Control).
+    """
+    return await _jawab_integral(
+        request,
+        metode,
+        fungsi_latex,
+        batas_bawah,
+        batas_atas,
+        h_step,
+        N_segments,
+        toleransi,
+        maks_evaluasi,
+        maks_level,
+        n_titik,
+        panel,
+        akumulasi,
+        trace,
+    )
+
+
+async def _jawab_integral(
+    request: Request,
+    metode: str,
+    fungsi_latex: str,
+    batas_bawah: float,
+    batas_atas: float,
+    h_step: Optional[float],
+    N_segments: Optional[int],
+    toleransi: float,
+    maks_evaluasi: int,
+    maks_level: int,
+    n_titik: Optional[int],
+    panel: int,
+    akumulasi: str,
+    trace: bool,
+):
+    """
+    Validasi input, lalu ambil respons dari cache atau hitung sekali untuk semua
+    permintaan identik yang bersamaan.
+    """
 
     # Validasi untuk input h atau N
     current_h = h_step
@@ -63,6 +406,7 @@ async def solve_integral_form(
 
     if batas_bawah > batas_atas:
         batas_bawah, batas_atas = batas_atas, batas_bawah
+    _validasi_batas(batas_bawah, batas_atas, tak_hingga=metode == "tanh-sinh")
 
     if metode in ["trapezoida", "simpson"]:
         if current_N is None:
@@ -89,45 +433,192 @@ async def solve_integral_form(
                 status_code=400,
                 detail="Ukuran langkah 'h' (step size) harus lebih besar dari 0",
             )
+    elif metode == "gauss-legendre" and n_titik is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Parameter 'n_titik' wajib diisi untuk metode Gauss-Legendre.",
+        )
+    if akumulasi not in MODE_AKUMULASI:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Mode akumulasi '{akumulasi}' tidak valid. Gunakan 'naif', 'kahan', 'berpasangan', atau 'fsum'.",
+        )
 
+    # Hanya parameter yang memengaruhi hasil metode ini yang masuk ke kunci cache
+    parameter_metode = {
+        "riemann": {"h": current_h},
+        "trapezoida": {"N": current_N},
+        "simpson": {"N": current_N},
+        "adaptif": {"toleransi": toleransi, "maks_evaluasi": maks_evaluasi},
+        "romberg": {"toleransi": toleransi, "maks_level": maks_level},
+        "gauss-legendre": {"n_titik": n_titik, "panel": panel},
+        "tanh-sinh": {"toleransi": toleransi, "maks_evaluasi": maks_evaluasi},
+    }.get(metode, {})
+    kunci = kunci_permintaan(
+        "/integral/",
+        fungsi_latex,
+        metode=metode,
+        batas_bawah=batas_bawah,
+        batas_atas=batas_atas,
+        akumulasi=akumulasi,
+        trace=trace,
+        **parameter_metode,
+    )
+
+    async def hitung():
+        pengukur = PengukurTahap()
+        respons = await run_compute(
+            _hitung_integral,
+            metode,
+            fungsi_latex,
+            batas_bawah,
+            batas_atas,
+            current_h,
+            current_N,
+            trace,
+            toleransi=toleransi,
+            maks_evaluasi=maks_evaluasi,
+            maks_level=maks_level,
+            n_titik=n_titik,
+            panel=panel,
+            akumulasi=akumulasi,
+            pengukur=pengukur,
+        )
+        return respons_terukur(
+            respons, pengukur, "/integral/", metode, respons.jumlah_evaluasi
+        )
+
+    return await respons_tercache(kunci, hitung, request.headers.get("if-none-match"))
+
+
+def _validasi_batas(batas_bawah: float, batas_atas: float, tak_hingga: bool = False):
+    """
+    Memastikan batas integral berupa bilangan; batas tak hingga hanya untuk tanh-sinh.
+    """
+    if math.isnan(batas_bawah) or math.isnan(batas_atas):
+        raise HTTPException(
+            status_code=400, detail="Batas integral harus berupa bilangan."
+        )
+    if not tak_hingga and not (
+        math.isfinite(batas_bawah) and math.isfinite(batas_atas)
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Batas tak hingga hanya didukung metode 'tanh-sinh'.",
+        )
+
+
+def _hitung_integral(
+    metode: str,
+    fungsi_latex: str,
+    batas_bawah: float,
+    batas_atas: float,
+    current_h: Optional[float],
+    current_N: Optional[int],
+    trace: bool,
+    toleransi: float = 1e-6,
+    maks_evaluasi: int = 10000,
+    maks_level: int = 20,
+    n_titik: Optional[int] = None,
+    panel: int = 1,
+    akumulasi: str = "berpasangan",
+    pengukur: Optional[PengukurTahap] = None,
+) -> IntegralCalcResponse:
+    """
+    Bagian komputasi dari endpoint integral; dijalankan di thread pool komputasi.
+    """
+    pengukur = pengukur if pengukur is not None else PengukurTahap()
     # Parsing fungsi LaTeX ke ekspresi Python
     try:
-        fungsi_python = parse_latex_to_python(fungsi_latex)
+        with pengukur.tahap("parse", cache=latex_tercache(fungsi_latex)):
+            fungsi_python = parse_latex_to_python(fungsi_latex)
+        with pengukur.tahap("compile", cache=fungsi_tercompile(fungsi_python)):
+            compile_func(fungsi_python, np)
+        with pengukur.tahap("analisis"):
+            analisis = analisis_fungsi(fungsi_python)
+    except SymbolicUnavailableError:
+        # Worker simbolik sibuk/berhenti bukan kesalahan input (dibalas 503)
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=400, detail=f"Gagal mem-parsing fungsi LaTeX: {str(e)}"
         )
 
     hasil_numerik = 0.0
+    estimasi_error, tabel_romberg = None, None
+    # Tanpa trace, tracer berkapasitas 0 hanya menghitung jumlah evaluasi fungsi
+    tracer = Tracer() if trace else Tracer(kapasitas=0)
+    akumulator = Akumulator(akumulasi)
+
+    # Polinomial yang diintegrasikan eksak oleh metode terpilih cukup dihitung
+    # dengan Gauss-Legendre berorde rendah (hasil sama, evaluasi lebih sedikit).
+    # Tidak dipakai jika pengguna ingin melihat trace atau memilih mode akumulasi
+    # tertentu, karena keduanya menggambarkan jalannya metode terpilih
+    kuadratur_eksak = (
+        None
+        if trace or akumulasi != "berpasangan"
+        else _titik_kuadratur_eksak(metode, analisis, current_N, n_titik, panel)
+    )
 
     # Pemilihan metode dan perhitungan
     try:
-        if metode == "riemann":
-            hasil_numerik = riemann_integral(
-                fungsi_python, current_h, batas_bawah, batas_atas, np_alias=np
-            )
-        elif metode == "trapezoida":
-            hasil_numerik = trapezoida_integral(
-                fungsi_python, current_N, batas_bawah, batas_atas, np_alias=np
-            )
-        elif metode == "simpson":
-            hasil_numerik = simpson_integral(
-                fungsi_python, current_N, batas_bawah, batas_atas, np_alias=np
-            )
+        with pengukur.tahap("numerik"):
+            if kuadratur_eksak is not None:
+                n_eksak, jumlah_evaluasi_metode = kuadratur_eksak
+                jalur_numerik = "kuadratur-eksak"
+                hasil_numerik = gauss_legendre_integral(
+                    fungsi_python,
+                    n_eksak,
+                    batas_bawah,
+                    batas_atas,
+                    np_alias=np,
+                    tracer=tracer,
+                    akumulator=akumulator,
+                )
+                if metode == "adaptif":
+                    estimasi_error = 0.0
+            else:
+                jalur_numerik = "metode"
+                hasil_numerik, estimasi_error, tabel_romberg = _integral_numerik(
+                    metode,
+                    fungsi_python,
+                    batas_bawah,
+                    batas_atas,
+                    current_h,
+                    current_N,
+                    tracer,
+                    toleransi=toleransi,
+                    maks_evaluasi=maks_evaluasi,
+                    maks_level=maks_level,
+                    n_titik=n_titik,
+                    panel=panel,
+                    akumulator=akumulator,
+                )
+
+        # Jalur kuadratur eksak melaporkan jumlah evaluasi metode terpilih;
+        # error pembulatan jumlah Gauss-Legendre tidak mewakili metode itu
+        if kuadratur_eksak is None:
+            jumlah_evaluasi = tracer.total_baris
+            estimasi_error_pembulatan = akumulator.estimasi_error
         else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Metode '{metode}' tidak valid. Gunakan 'riemann', 'trapezoida', atau 'simpson'.",
-            )
+            jumlah_evaluasi, estimasi_error_pembulatan = jumlah_evaluasi_metode, None
 
         # Hitung metode analitik dan cari error
+        alasan_analitik = jalur_analitik = None
         try:
-            hasil_analitik, integral_fungsi_latex = integral_analitik(
-                fungsi_python, batas_bawah, batas_atas
-            )
-            error_relatif = hitung_error(hasil_numerik, hasil_analitik)
-            print(f"Hasil analitik: {hasil_analitik}")
-            print(f"Error: {error_relatif}")
+            with pengukur.tahap("analitik", cache=antiturunan_tercache(fungsi_python)):
+                (
+                    hasil_analitik,
+                    integral_fungsi_latex,
+                    jalur_analitik,
+                ) = integral_analitik_cepat(fungsi_python, batas_bawah, batas_atas)
+            with pengukur.tahap("error"):
+                error_relatif = str(hitung_error(hasil_numerik, hasil_analitik))
+        except SymbolicUnavailableError as e:
+            # Kembalikan hasil numerik saja jika komputasi simbolik gagal/timeout
+            hasil_analitik, integral_fungsi_latex, error_relatif = None, None, None
+            alasan_analitik = str(e)
+            pengukur.sementara = True
         except ValueError as ve_analitik:
             raise HTTPException(
                 status_code=400,
@@ -137,7 +628,7 @@ async def solve_integral_form(
         return IntegralCalcResponse(
             metode=metode,
             input_fungsi=fungsi_latex,
-            integral_fungsi=str(integral_fungsi_latex),
+            integral_fungsi=integral_fungsi_latex,
             input_batas_bawah=batas_bawah,
             input_batas_atas=batas_atas,
             input_h=current_h
@@ -147,12 +638,634 @@ async def solve_integral_form(
             input_N=current_N if metode in ["trapezoida", "simpson"] else None,
             hasil_numerik=hasil_numerik,
             hasil_analitik=hasil_analitik,
-            error_relatif=str(error_relatif),
+            error_relatif=error_relatif,
+            alasan_analitik=alasan_analitik,
+            estimasi_error=estimasi_error,
+            estimasi_error_pembulatan=estimasi_error_pembulatan,
+            akumulasi=akumulasi,
+            jumlah_evaluasi=jumlah_evaluasi,
+            tabel_romberg=tabel_romberg,
+            trace=tracer.tabel() if trace else None,
+            trace_terpotong=tracer.terpotong if trace else None,
+            analisis=analisis,
+            jalur_numerik=jalur_numerik,
+            jalur_analitik=jalur_analitik,
         )
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except HTTPException:
         raise
     except Exception as e:
-        print("Terjadi error:", e)
+        logger.exception("Terjadi error: %s", e)
         raise HTTPException(status_code=500, detail="Terjadi kesalahan di server.")
+
+
+def _titik_kuadratur_eksak(
+    metode: str,
+    analisis: AnalisisFungsi,
+    current_N: Optional[int],
+    n_titik: Optional[int],
+    panel: int,
+) -> Optional[Tuple[int, int]]:
+    """
+    Jumlah titik Gauss-Legendre yang mengintegrasikan polinomial secara eksak,
+    jika metode terpilih juga eksak untuk polinomial itu dan jalur ini lebih murah.
+
+    Returns:
+        tuple: (jumlah titik Gauss, jumlah evaluasi metode terpilih), atau None
+            jika metode terpilih tetap dijalankan
+    """
+    if analisis.kelas != "polinomial":
+        return None
+    derajat_eksak = derajat_kuadratur_eksak(metode, N=current_N, n_titik=n_titik)
+    if derajat_eksak is None or analisis.derajat > derajat_eksak:
+        return None
+    n_eksak = max(1, math.ceil((analisis.derajat + 1) / 2))
+    # Jumlah evaluasi metode terpilih; adaptif berhenti di tingkat pertama
+    # (5 titik Simpson) karena error-nya nol untuk polinomial derajat <= 3
+    evaluasi_metode = {
+        "trapezoida": (current_N or 0) + 1,
+        "simpson": (current_N or 0) + 1,
+        "gauss-legendre": (n_titik or 0) * panel,
+        "adaptif": 5,
+    }[metode]
+    return (n_eksak, evaluasi_metode) if n_eksak < evaluasi_metode else None
+
+
+def _integral_numerik(
+    metode: str,
+    fungsi_python: str,
+    batas_bawah: float,
+    batas_atas: float,
+    current_h: Optional[float],
+    current_N: Optional[int],
+    tracer: Tracer,
+    toleransi: float = 1e-6,
+    maks_evaluasi: int = 10000,
+    maks_level: int = 20,
+    n_titik: Optional[int] = None,
+    panel: int = 1,
+    akumulator: Optional[Akumulator] = None,
+):
+    """
+    Menjalankan metode integrasi numerik yang dipilih.
+
+    Returns:
+        tuple: (hasil numerik, estimasi error atau None, tabel Romberg atau None)
+    """
+    estimasi_error, tabel_romberg = None, None
+    if metode == "riemann":
+        hasil_numerik = riemann_integral(
+            fungsi_python,
+            current_h,
+            batas_bawah,
+            batas_atas,
+            np_alias=np,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+    elif metode == "trapezoida":
+        hasil_numerik = trapezoida_integral(
+            fungsi_python,
+            current_N,
+            batas_bawah,
+            batas_atas,
+            np_alias=np,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+    elif metode == "simpson":
+        hasil_numerik = simpson_integral(
+            fungsi_python,
+            current_N,
+            batas_bawah,
+            batas_atas,
+            np_alias=np,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+    elif metode == "adaptif":
+        hasil_numerik, estimasi_error, _ = adaptif_integral(
+            fungsi_python,
+            batas_bawah,
+            batas_atas,
+            toleransi=toleransi,
+            maks_evaluasi=maks_evaluasi,
+            np_alias=np,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+    elif metode == "romberg":
+        hasil_numerik, tabel_romberg, estimasi_error, _ = romberg_integral(
+            fungsi_python,
+            batas_bawah,
+            batas_atas,
+            toleransi=toleransi,
+            maks_level=maks_level,
+            np_alias=np,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+    elif metode == "gauss-legendre":
+        hasil_numerik = gauss_legendre_integral(
+            fungsi_python,
+            n_titik,
+            batas_bawah,
+            batas_atas,
+            panel=panel,
+            np_alias=np,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+    elif metode == "tanh-sinh":
+        hasil_numerik, estimasi_error, _ = tanh_sinh_integral(
+            fungsi_python,
+            batas_bawah,
+            batas_atas,
+            toleransi=toleransi,
+            maks_evaluasi=maks_evaluasi,
+            np_alias=np,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Metode '{metode}' tidak valid. Gunakan 'riemann', 'trapezoida', 'simpson', 'adaptif', 'romberg', 'gauss-legendre', atau 'tanh-sinh'.",
+        )
+    return hasil_numerik, estimasi_error, tabel_romberg
+
+
+@router.post("/batch", response_model=IntegralBatchResponse)
+async def solve_integral_batch(permintaan: IntegralBatchRequest):
+    """
+    Menghitung integral untuk semua kombinasi interval × metode × (N atau h).
+
+    Fungsi di-parse dan antiturunan simbolik dihitung sekali saja. Metode _riemann_
+    memakai daftar `h`, metode _trapezoida_ dan _simpson_ memakai daftar `N`.
+    Hasil dikembalikan dalam bentuk kolom (array sejajar).
+    """
+    for metode in permintaan.metode:
+        if metode not in ["riemann", "trapezoida", "simpson"]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Metode '{metode}' tidak valid. Gunakan 'riemann', 'trapezoida', atau 'simpson'.",
+            )
+        if metode == "riemann" and not permintaan.h:
+            raise HTTPException(
+                status_code=400,
+                detail="Parameter 'h' wajib diisi untuk metode Riemann.",
+            )
+        if metode in ["trapezoida", "simpson"] and not permintaan.N:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Parameter 'N' wajib diisi untuk metode {metode}.",
+            )
+    if any(h <= 0 for h in permintaan.h or []):
+        raise HTTPException(
+            status_code=400,
+            detail="Ukuran langkah 'h' (step size) harus lebih besar dari 0",
+        )
+    for batas_bawah, batas_atas in permintaan.interval:
+        _validasi_batas(batas_bawah, batas_atas)
+    if any(N < 1 for N in permintaan.N or []):
+        raise HTTPException(
+            status_code=400, detail="Parameter 'N' harus lebih besar dari 0."
+        )
+    jumlah = len(permintaan.interval) * sum(
+        len(permintaan.h) if metode == "riemann" else len(permintaan.N)
+        for metode in permintaan.metode
+    )
+    if jumlah > BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Jumlah kombinasi ({jumlah}) melebihi batas {BATCH_MAX_ITEMS}.",
+        )
+    return await run_compute(_hitung_integral_batch, permintaan)
+
+
+def _hitung_integral_batch(permintaan: IntegralBatchRequest) -> IntegralBatchResponse:
+    try:
+        fungsi_python = parse_latex_to_python(permintaan.fungsi_latex)
+    except SymbolicUnavailableError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400, detail=f"Gagal mem-parsing fungsi LaTeX: {str(e)}"
+        )
+
+    interval = [(min(a, b), max(a, b)) for a, b in permintaan.interval]
+    kolom = {k: [] for k in ["metode", "batas_bawah", "batas_atas", "h", "N"]}
+    hasil_numerik = []
+    try:
+        for batas_bawah, batas_atas in interval:
+            for metode in permintaan.metode:
+                if metode == "riemann":
+                    for h in permintaan.h:
+                        hasil_numerik.append(
+                            riemann_integral(
+                                fungsi_python, h, batas_bawah, batas_atas, np_alias=np
+                            )
+                        )
+                        kolom["h"].append(h)
+                        kolom["N"].append(None)
+                        kolom["metode"].append(metode)
+                    continue
+                integrator = (
+                    trapezoida_integral if metode == "trapezoida" else simpson_integral
+                )
+                for N in permintaan.N:
+                    hasil_numerik.append(
+                        integrator(
+                            fungsi_python, N, batas_bawah, batas_atas, np_alias=np
+                        )
+                    )
+                    kolom["h"].append(hitung_h(batas_bawah, batas_atas, N))
+                    kolom["N"].append(N)
+                    kolom["metode"].append(metode)
+            jumlah_baris = len(kolom["metode"]) - len(kolom["batas_bawah"])
+            kolom["batas_bawah"].extend([batas_bawah] * jumlah_baris)
+            kolom["batas_atas"].extend([batas_atas] * jumlah_baris)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+    hasil_analitik = error_relatif = None
+    antiturunan_latex = alasan_analitik = None
+    try:
+        antiturunan_latex = antiturunan_simbolik(fungsi_python)["latex"]
+        mulus = analisis_fungsi(fungsi_python).mulus
+        nilai_interval = {
+            batas: integral_analitik(fungsi_python, *batas, mulus=mulus)[0]
+            for batas in dict.fromkeys(interval)
+        }
+        hasil_analitik = [
+            nilai_interval[batas]
+            for batas in zip(kolom["batas_bawah"], kolom["batas_atas"])
+        ]
+        error_relatif = [
+            hitung_error(numerik, analitik)
+            for numerik, analitik in zip(hasil_numerik, hasil_analitik)
+        ]
+    except SymbolicUnavailableError as e:
+        alasan_analitik = str(e)
+    except ValueError as ve_analitik:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Integral analitik tidak dapat dihitung: {str(ve_analitik)}",
+        )
+
+    return IntegralBatchResponse(
+        input_fungsi=permintaan.fungsi_latex,
+        antiturunan_fungsi=antiturunan_latex,
+        hasil_numerik=hasil_numerik,
+        hasil_analitik=hasil_analitik,
+        error_relatif=error_relatif,
+        alasan_analitik=alasan_analitik,
+        **kolom,
+    )
+
+
+@router.post("/multi", response_model=IntegralMultiResponse)
+async def solve_integral_multi(request: Request, permintaan: IntegralMultiRequest):
+    """
+    Menghitung integral lipat dua atau tiga (∬, ∭) pada domain persegi.
+
+    Metode produk tensor (_trapezoida_, _simpson_, _gauss-legendre_) memakai
+    `N` segmen/titik per sumbu pada grid meshgrid. Metode quasi-Monte Carlo
+    (_sobol_, _halton_) mengevaluasi sampel per batch dan melaporkan riwayat
+    estimasi beserta estimasi error-nya setelah setiap batch.
+    """
+    metode = permintaan.metode
+    batas = [(min(a, b), max(a, b)) for a, b in permintaan.batas]
+    for batas_bawah, batas_atas in batas:
+        _validasi_batas(batas_bawah, batas_atas)
+    if metode in METODE_GRID:
+        if permintaan.N is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Parameter 'N' wajib diisi untuk metode {metode}.",
+            )
+        if metode == "simpson" and permintaan.N % 2 != 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Metode Simpson memerlukan 'N' genap (jumlah segmen per sumbu).",
+            )
+        titik_per_sumbu = (
+            permintaan.N if metode == "gauss-legendre" else permintaan.N + 1
+        )
+        jumlah_evaluasi = titik_per_sumbu ** len(batas)
+    elif metode in METODE_QMC:
+        jumlah_evaluasi = permintaan.n_sampel
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Metode '{metode}' tidak valid. Gunakan 'trapezoida', 'simpson', 'gauss-legendre', 'sobol', atau 'halton'.",
+        )
+    if jumlah_evaluasi > MULTI_MAX_EVALUASI:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Jumlah evaluasi fungsi ({jumlah_evaluasi}) melebihi batas {MULTI_MAX_EVALUASI}.",
+        )
+    if permintaan.akumulasi not in MODE_AKUMULASI:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Mode akumulasi '{permintaan.akumulasi}' tidak valid. Gunakan 'naif', 'kahan', 'berpasangan', atau 'fsum'.",
+        )
+
+    parameter_metode = (
+        {"N": permintaan.N, "akumulasi": permintaan.akumulasi}
+        if metode in METODE_GRID
+        else {
+            "n_sampel": permintaan.n_sampel,
+            "toleransi": permintaan.toleransi,
+            "replika": permintaan.replika,
+            "seed": permintaan.seed,
+        }
+    )
+    kunci = kunci_permintaan(
+        "/integral/multi",
+        permintaan.fungsi_latex,
+        metode=metode,
+        batas=batas,
+        **parameter_metode,
+    )
+
+    async def hitung():
+        pengukur = PengukurTahap()
+        respons = await run_compute(
+            _hitung_integral_multi, permintaan, batas, pengukur=pengukur
+        )
+        return respons_terukur(
+            respons, pengukur, "/integral/multi", metode, respons.jumlah_evaluasi
+        )
+
+    return await respons_tercache(kunci, hitung, request.headers.get("if-none-match"))
+
+
+def _hitung_integral_multi(
+    permintaan: IntegralMultiRequest,
+    batas: List[Tuple[float, float]],
+    pengukur: Optional[PengukurTahap] = None,
+) -> IntegralMultiResponse:
+    """
+    Bagian komputasi dari endpoint integral lipat; dijalankan di thread pool komputasi.
+    """
+    pengukur = pengukur if pengukur is not None else PengukurTahap()
+    metode = permintaan.metode
+    variabel = VARIABEL_MULTI[: len(batas)]
+    try:
+        with pengukur.tahap("parse", cache=latex_tercache(permintaan.fungsi_latex)):
+            fungsi_python = parse_latex_to_python(permintaan.fungsi_latex)
+        with pengukur.tahap(
+            "compile", cache=fungsi_tercompile(fungsi_python, np, variabel)
+        ):
+            compile_func(fungsi_python, np, variabel)
+    except SymbolicUnavailableError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400, detail=f"Gagal mem-parsing fungsi LaTeX: {str(e)}"
+        )
+
+    tracer = Tracer(kapasitas=0)
+    akumulator = Akumulator(permintaan.akumulasi) if metode in METODE_GRID else None
+    estimasi_error, riwayat = None, None
+    try:
+        with pengukur.tahap("numerik"):
+            if metode in METODE_GRID:
+                hasil_numerik = integral_grid(
+                    fungsi_python,
+                    batas,
+                    metode,
+                    permintaan.N,
+                    np_alias=np,
+                    tracer=tracer,
+                    akumulator=akumulator,
+                )
+            else:
+                hasil_numerik, estimasi_error, langkah = qmc_integral(
+                    fungsi_python,
+                    batas,
+                    metode=metode,
+                    n_sampel=permintaan.n_sampel,
+                    toleransi=permintaan.toleransi,
+                    replika=permintaan.replika,
+                    seed=permintaan.seed,
+                    np_alias=np,
+                    tracer=tracer,
+                )
+                riwayat = [
+                    LangkahQMC(
+                        jumlah_evaluasi=n, hasil_numerik=nilai, estimasi_error=error
+                    )
+                    for n, nilai, error in langkah
+                ]
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+    # Integral simbolik lipat bisa gagal atau tidak memiliki bentuk tertutup;
+    # hasil numerik tetap dikembalikan beserta alasannya
+    hasil_analitik = integral_fungsi_latex = error_relatif = alasan_analitik = None
+    try:
+        with pengukur.tahap("analitik"):
+            hasil_simbolik = integral_lipat_simbolik(
+                to_sympy(fungsi_python, variabel),
+                [(v, a, b) for v, (a, b) in zip(variabel, batas)],
+            )
+        integral_fungsi_latex = (
+            "".join(rf"\int_{{{a}}}^{{{b}}}" for a, b in reversed(batas))
+            + f" {hasil_simbolik['latex_fungsi']} "
+            + "".join(rf"\,d{v}" for v in variabel)
+        )
+        # Bentuk tertutup dengan fungsi khusus (misal Ei) dapat bernilai kompleks
+        # dengan bagian imajiner sisa pembulatan
+        nilai = (
+            complex(hasil_simbolik["nilai"])
+            if hasil_simbolik["nilai"] is not None
+            else None
+        )
+        if nilai is None:
+            alasan_analitik = "Integral lipat tidak memiliki bentuk tertutup."
+        elif abs(nilai.imag) > 1e-12 * max(1.0, abs(nilai.real)):
+            alasan_analitik = "Bentuk tertutup integral lipat tidak bernilai real."
+        else:
+            hasil_analitik = round(nilai.real, 3)
+            error_relatif = str(hitung_error(hasil_numerik, hasil_analitik))
+    except SymbolicUnavailableError as e:
+        alasan_analitik = str(e)
+        pengukur.sementara = True
+    except (ValueError, TypeError) as e:
+        alasan_analitik = str(e)
+
+    return IntegralMultiResponse(
+        metode=metode,
+        input_fungsi=permintaan.fungsi_latex,
+        integral_fungsi=integral_fungsi_latex,
+        variabel=list(variabel),
+        batas=batas,
+        input_N=permintaan.N if metode in METODE_GRID else None,
+        hasil_numerik=hasil_numerik,
+        hasil_analitik=hasil_analitik,
+        error_relatif=error_relatif,
+        alasan_analitik=alasan_analitik,
+        estimasi_error=estimasi_error,
+        estimasi_error_pembulatan=(
+            akumulator.estimasi_error if akumulator is not None else None
+        ),
+        akumulasi=permintaan.akumulasi if akumulator is not None else None,
+        jumlah_evaluasi=tracer.total_baris,
+        riwayat=riwayat,
+    )
+
+
+@router.post("/konvergensi", response_class=StreamingResponse)
+async def konvergensi_integral(
+    metode: str = Form(
+        description="Metode integrasi numerik: _trapezoida_, _simpson_, _romberg_."
+    ),
+    fungsi_latex: str = Form(
+        description="Fungsi matematika dalam format LaTex. Contoh: _x^2_ atau _\\frac{1}{2}x_"
+    ),
+    batas_bawah: float = Form(description="Batas bawah interval integrasi."),
+    batas_atas: float = Form(description="Batas atas interval integrasi."),
+    maks_level: int = Form(
+        15,
+        description="Jumlah penggandaan N maksimum (N terbesar = 2^maks_level).",
+        ge=1,
+        le=25,
+    ),
+    toleransi: Optional[float] = Form(
+        None,
+        description="Berhenti lebih awal jika selisih dua langkah berurutan <= toleransi.",
+        gt=0,
+    ),
+    format: str = Form(
+        "ndjson",
+        description="Format aliran: _ndjson_ (satu JSON per baris) atau _sse_ (Server-Sent Events).",
+    ),
+):
+    """
+    Mengalirkan hasil integral numerik untuk N = 1, 2, 4, ... (Simpson mulai dari N = 2).
+
+    Setiap penggandaan N memakai ulang semua evaluasi fungsi sebelumnya. Event
+    `mulai` berisi nilai analitik (dari cache simbolik), lalu satu event `langkah`
+    per N dengan error absolut terhadap nilai analitik, dan event `selesai`.
+    Nilai pada aliran tidak dibulatkan agar konvergensinya terlihat.
+    """
+    if metode not in METODE_KONVERGENSI:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Metode '{metode}' tidak valid. Gunakan 'trapezoida', 'simpson', atau 'romberg'.",
+        )
+    if format not in FORMAT_STREAM:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Format '{format}' tidak valid. Gunakan 'ndjson' atau 'sse'.",
+        )
+    if batas_bawah > batas_atas:
+        batas_bawah, batas_atas = batas_atas, batas_bawah
+    _validasi_batas(batas_bawah, batas_atas)
+
+    fungsi_python, mulai = await run_compute(
+        _mulai_konvergensi_integral, metode, fungsi_latex, batas_bawah, batas_atas
+    )
+    langkah = iter_compute(
+        _langkah_konvergensi_integral(
+            metode,
+            fungsi_python,
+            batas_bawah,
+            batas_atas,
+            maks_level,
+            toleransi,
+            mulai.hasil_analitik,
+        )
+    )
+    return respons_stream([mulai], langkah, format)
+
+
+def _mulai_konvergensi_integral(
+    metode: str, fungsi_latex: str, batas_bawah: float, batas_atas: float
+):
+    """
+    Mem-parsing fungsi dan menghitung nilai analitik sebelum aliran dimulai.
+    """
+    try:
+        fungsi_python = parse_latex_to_python(fungsi_latex)
+        compile_func(fungsi_python, np)
+    except SymbolicUnavailableError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=400, detail=f"Gagal mem-parsing fungsi LaTeX: {str(e)}"
+        )
+
+    hasil_analitik = integral_fungsi_latex = alasan_analitik = None
+    try:
+        hasil_analitik, integral_fungsi_latex, _ = integral_analitik_cepat(
+            fungsi_python, batas_bawah, batas_atas, bulatkan=False
+        )
+    except (SymbolicUnavailableError, ValueError) as e:
+        # Aliran numerik tetap berjalan, hanya tanpa error terhadap nilai analitik
+        alasan_analitik = str(e)
+
+    return fungsi_python, KonvergensiIntegralMulai(
+        metode=metode,
+        input_fungsi=fungsi_latex,
+        integral_fungsi=integral_fungsi_latex,
+        input_batas_bawah=batas_bawah,
+        input_batas_atas=batas_atas,
+        hasil_analitik=hasil_analitik,
+        alasan_analitik=alasan_analitik,
+    )
+
+
+def _langkah_konvergensi_integral(
+    metode: str,
+    fungsi_python: str,
+    batas_bawah: float,
+    batas_atas: float,
+    maks_level: int,
+    toleransi: Optional[float],
+    hasil_analitik: Optional[float],
+):
+    """
+    Generator event `langkah` dan `selesai`; setiap langkah dijalankan di thread pool.
+    """
+    # Kolom tabel Romberg: T(N), Simpson(N) = R[k][1], atau diagonal R[k][k]
+    kolom = {"trapezoida": 0, "simpson": 1}.get(metode)
+    nilai_lama = None
+    langkah = 0
+    barisan = barisan_romberg(fungsi_python, batas_bawah, batas_atas, np_alias=np)
+    for k, (N, baris, jumlah_evaluasi) in enumerate(barisan):
+        if metode == "simpson" and k == 0:
+            continue  # Simpson memerlukan N genap
+        nilai = baris[-1] if kolom is None else baris[kolom]
+        estimasi_error = abs(nilai - nilai_lama) if nilai_lama is not None else None
+        langkah += 1
+        yield KonvergensiIntegralLangkah(
+            langkah=langkah,
+            N=N,
+            h=hitung_h(batas_bawah, batas_atas, N),
+            hasil_numerik=nilai,
+            error_absolut=(
+                abs(nilai - hasil_analitik) if hasil_analitik is not None else None
+            ),
+            estimasi_error=estimasi_error,
+            jumlah_evaluasi=jumlah_evaluasi,
+        )
+        nilai_lama = nilai
+
+        if toleransi is not None and estimasi_error is not None:
+            if estimasi_error <= toleransi:
+                alasan = "toleransi"
+                break
+        if k >= maks_level:
+            alasan = "maks_level"
+            break
+
+    yield EventSelesai(
+        alasan=alasan,
+        hasil_numerik=nilai,
+        jumlah_langkah=langkah,
+        jumlah_evaluasi=jumlah_evaluasi,
+    )
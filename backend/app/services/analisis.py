@@ -0,0 +1,286 @@
+import ast
+import math
+import operator
+from fractions import Fraction
+from typing import Optional
+
+import numpy as np
+from numpy.polynomial import Polynomial
+from pydantic import BaseModel
+
+from config import PARSE_CACHE_SIZE
+from services.cache import LRUCache
+from services.utils import normalisasi_fungsi, validasi_ekspresi
+
+# Cache hasil analisis, kunci: string fungsi ternormalisasi
+_analisis_cache = LRUCache(maxsize=PARSE_CACHE_SIZE)
+
+# Derajat maksimum polinomial yang koefisiennya dihitung untuk jalur cepat.
+# Di atas derajat ini koefisien float dapat overflow atau kehilangan presisi.
+DERAJAT_MAKS_CEPAT = 50
+
+# Fungsi yang mulus (tak hingga kali terdiferensialkan) di seluruh bilangan real
+_FUNGSI_MULUS = {"sin", "cos", "exp", "sinh", "cosh", "tanh", "arctan"}
+
+_operator_biner = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+
+
+class AnalisisFungsi(BaseModel):
+    kelas: str
+    derajat: Optional[int] = None
+    mulus: bool
+    komposisi_transenden: bool
+
+
+def _nama_fungsi(node: ast.Call) -> str:
+    return node.func.attr if isinstance(node.func, ast.Attribute) else node.func.id
+
+
+def _konstanta(node) -> Optional[float]:
+    # Nilai float dari sub-ekspresi tanpa variabel x, atau None
+    if isinstance(node, ast.Constant):
+        return float(node.value)
+    if isinstance(node, ast.Name):
+        return {"pi": math.pi, "e": math.e}.get(node.id)
+    if isinstance(node, ast.Attribute):
+        return {"pi": math.pi, "e": math.e}.get(node.attr)
+    if isinstance(node, ast.UnaryOp):
+        nilai = _konstanta(node.operand)
+        if nilai is None:
+            return None
+        return -nilai if isinstance(node.op, ast.USub) else nilai
+    if isinstance(node, ast.BinOp):
+        kiri, kanan = _konstanta(node.left), _konstanta(node.right)
+        if kiri is None or kanan is None:
+            return None
+        try:
+            with np.errstate(all="ignore"):
+                return float(_operator_biner[type(node.op)](kiri, kanan))
+        except (OverflowError, ZeroDivisionError, ValueError, TypeError):
+            return None
+    if isinstance(node, ast.Call):
+        argumen = [_konstanta(arg) for arg in node.args]
+        if any(nilai is None for nilai in argumen):
+            return None
+        nama = _nama_fungsi(node)
+        with np.errstate(all="ignore"):
+            if len(argumen) == 2:
+                nilai = np.log(argumen[0]) / np.log(argumen[1])
+            else:
+                nilai = getattr(np, nama)(argumen[0])
+        return float(nilai) if np.isfinite(nilai) else None
+    return None
+
+
+def _rasional(node):
+    # (pembilang, penyebut) sebagai Polynomial jika node fungsi rasional dari x
+    # dengan derajat <= DERAJAT_MAKS_CEPAT, atau None
+    nilai = _konstanta(node)
+    if nilai is not None:
+        return Polynomial([nilai]), Polynomial([1.0])
+    if isinstance(node, ast.Name) and node.id == "x":
+        return Polynomial([0.0, 1.0]), Polynomial([1.0])
+    if isinstance(node, ast.UnaryOp):
+        hasil = _rasional(node.operand)
+        if hasil is None:
+            return None
+        return (-hasil[0], hasil[1]) if isinstance(node.op, ast.USub) else hasil
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    if isinstance(node.op, ast.Pow):
+        pangkat = _konstanta(node.right)
+        basis = _rasional(node.left)
+        if basis is None or pangkat is None or pangkat != int(pangkat):
+            return None
+        pangkat = int(pangkat)
+        p, q = basis if pangkat >= 0 else (basis[1], basis[0])
+        if max(p.degree(), q.degree()) * abs(pangkat) > DERAJAT_MAKS_CEPAT:
+            return None
+        return p ** abs(pangkat), q ** abs(pangkat)
+
+    kiri, kanan = _rasional(node.left), _rasional(node.right)
+    if kiri is None or kanan is None:
+        return None
+    (p1, q1), (p2, q2) = kiri, kanan
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        hasil = (
+            (
+                (p1 * q2 + p2 * q1)
+                if isinstance(node.op, ast.Add)
+                else (p1 * q2 - p2 * q1)
+            ),
+            q1 * q2,
+        )
+    elif isinstance(node.op, ast.Mult):
+        hasil = (p1 * p2, q1 * q2)
+    else:
+        hasil = (p1 * q2, q1 * p2)
+    if max(hasil[0].degree(), hasil[1].degree()) > DERAJAT_MAKS_CEPAT:
+        return None
+    return hasil
+
+
+def _mulus(node) -> bool:
+    # True jika ekspresi mulus di seluruh bilangan real (tanpa pembagian oleh
+    # x, log, akar, tan, nilai mutlak, atau pangkat pecahan/negatif dari x)
+    if _konstanta(node) is not None or isinstance(node, ast.Name):
+        return True
+    if isinstance(node, ast.UnaryOp):
+        return _mulus(node.operand)
+    if isinstance(node, ast.Call):
+        return _nama_fungsi(node) in _FUNGSI_MULUS and all(map(_mulus, node.args))
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Div):
+            return _mulus(node.left) and _konstanta(node.right) not in (None, 0.0)
+        if isinstance(node.op, ast.Pow):
+            basis, pangkat = _konstanta(node.left), _konstanta(node.right)
+            if pangkat is not None and pangkat == int(pangkat) and pangkat >= 0:
+                return _mulus(node.left)
+            return basis is not None and basis > 0 and _mulus(node.right)
+        return _mulus(node.left) and _mulus(node.right)
+    return False
+
+
+def _argumen_transenden(node):
+    # Argumen node jika node fungsi transenden dari x: pemanggilan fungsi
+    # (sin, exp, sqrt, ...) atau pangkat dengan eksponen variabel (e**x, 2**x)
+    if _konstanta(node) is not None:
+        return None
+    if isinstance(node, ast.Call):
+        return node.args
+    if (
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.Pow)
+        and _konstanta(node.right) is None
+    ):
+        return [node.left, node.right]
+    return None
+
+
+def _komposisi_transenden(pohon) -> bool:
+    # True jika ada fungsi transenden yang argumennya memuat fungsi transenden
+    # lain dari x, misal e^{sin x}; sympy jarang menemukan bentuk tertutupnya
+    for node in ast.walk(pohon):
+        for arg in _argumen_transenden(node) or []:
+            if any(_argumen_transenden(dalam) for dalam in ast.walk(arg)):
+                return True
+    return False
+
+
+def _analisis(fungsi_str: str):
+    pohon = validasi_ekspresi(fungsi_str)
+    ada_mutlak = any(
+        isinstance(node, ast.Call) and _nama_fungsi(node) == "abs"
+        for node in ast.walk(pohon)
+    )
+    rasional = None if ada_mutlak else _rasional(pohon.body)
+    polinomial = None
+    if ada_mutlak:
+        kelas = "piecewise"
+    elif rasional is not None and rasional[1].degree() == 0:
+        kelas = "polinomial"
+        polinomial = (rasional[0] / rasional[1].coef[0]).trim()
+    elif rasional is not None:
+        kelas = "rasional"
+    else:
+        kelas = "elementer"
+    analisis = AnalisisFungsi(
+        kelas=kelas,
+        derajat=polinomial.degree() if polinomial is not None else None,
+        mulus=_mulus(pohon.body),
+        komposisi_transenden=_komposisi_transenden(pohon.body),
+    )
+    return analisis, polinomial
+
+
+def analisis_fungsi(fungsi_str: str) -> AnalisisFungsi:
+    """
+    Mengklasifikasikan fungsi secara statis dari AST-nya, tanpa sympy.
+
+    Kelas fungsi: _polinomial_, _rasional_ (hasil bagi dua polinomial),
+    _piecewise_ (memuat nilai mutlak), atau _elementer_ (lainnya). `mulus`
+    bernilai True jika fungsi tak hingga kali terdiferensialkan di seluruh
+    bilangan real (tidak ada titik singular), dan `komposisi_transenden` True
+    jika ada fungsi transenden dari fungsi lain (misal e^{sin x}).
+    Polinomial berderajat di atas `DERAJAT_MAKS_CEPAT` dianggap elementer.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string, misal "x**3 + 2*x".
+
+    Returns:
+        AnalisisFungsi: Hasil klasifikasi
+
+    Raises:
+        ValueError: Jika fungsi tidak valid
+    """
+    return _analisis_tercache(fungsi_str)[0]
+
+
+def polinomial_fungsi(fungsi_str: str) -> Optional[Polynomial]:
+    """
+    Mengambil koefisien fungsi polinomial sebagai `numpy.polynomial.Polynomial`.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+
+    Returns:
+        Polynomial: Polinomial dalam x, atau None jika fungsi bukan polinomial
+
+    Raises:
+        ValueError: Jika fungsi tidak valid
+    """
+    return _analisis_tercache(fungsi_str)[1]
+
+
+def _analisis_tercache(fungsi_str: str):
+    kunci = normalisasi_fungsi(fungsi_str)
+    hasil = _analisis_cache.get(kunci)
+    if hasil is None:
+        hasil = _analisis(fungsi_str)
+        _analisis_cache.set(kunci, hasil)
+    return hasil
+
+
+def _latex_koefisien(nilai: float) -> str:
+    # Koefisien rasional sederhana ditulis sebagai pecahan, lainnya desimal
+    pecahan = Fraction(nilai).limit_denominator(1000)
+    if abs(float(pecahan) - nilai) <= 1e-12 * max(1.0, abs(nilai)):
+        if pecahan.denominator == 1:
+            return str(pecahan.numerator)
+        return rf"\frac{{{pecahan.numerator}}}{{{pecahan.denominator}}}"
+    return f"{nilai:.12g}"
+
+
+def latex_polinomial(polinomial: Polynomial) -> str:
+    """
+    Menulis polinomial dalam format LaTeX, suku berderajat tertinggi lebih dulu.
+
+    Args:
+        polinomial (Polynomial): Polinomial dalam x
+
+    Returns:
+        str: Polinomial dalam LaTeX, misal "\\frac{1}{4} x^{4} + x^{2}"
+    """
+    teks = ""
+    for k in range(len(polinomial.coef) - 1, -1, -1):
+        koefisien = float(polinomial.coef[k])
+        if koefisien == 0:
+            continue
+        angka = _latex_koefisien(abs(koefisien))
+        if k == 0:
+            suku = angka
+        else:
+            variabel = "x" if k == 1 else f"x^{{{k}}}"
+            suku = variabel if angka == "1" else f"{angka} {variabel}"
+        if not teks:
+            teks = f"-{suku}" if koefisien < 0 else suku
+        else:
+            teks += f" - {suku}" if koefisien < 0 else f" + {suku}"
+    return teks or "0"
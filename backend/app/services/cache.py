@@ -0,0 +1,307 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Cache LRU (Least Recently Used) dengan ukuran terbatas dan aman dipakai
+    bersama oleh beberapa thread.
+
+    Cache mencatat jumlah hit, miss, dan eviction sehingga ukurannya bisa
+    disesuaikan dengan pola trafik.
+
+    Args:
+        maxsize (int): Jumlah entri maksimum sebelum entri terlama dibuang.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError("Ukuran cache (maxsize) harus lebih besar dari 0.")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """
+        Mengambil nilai dari cache dan menandainya sebagai yang terbaru dipakai.
+
+        Args:
+            key: Kunci entri (harus hashable)
+            default: Nilai yang dikembalikan jika kunci tidak ada
+
+        Returns:
+            Nilai yang tersimpan, atau `default` jika tidak ada
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Menyimpan nilai ke cache, membuang entri terlama jika cache penuh.
+
+        Args:
+            key: Kunci entri (harus hashable)
+            value: Nilai yang disimpan
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def clear(self):
+        """
+        Mengosongkan cache dan mereset seluruh penghitung.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Mengambil statistik pemakaian cache.
+
+        Returns:
+            dict: Jumlah hit, miss, eviction, ukuran saat ini, dan ukuran maksimum
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+class TTLCache(LRUCache):
+    """
+    Cache LRU yang entrinya kedaluwarsa setelah `ttl` detik.
+
+    Entri kedaluwarsa dibuang saat diakses dan dihitung sebagai miss. Selain
+    batas waktu, ukuran cache tetap dibatasi `maxsize` seperti LRUCache.
+
+    Args:
+        maxsize (int): Jumlah entri maksimum sebelum entri terlama dibuang.
+        ttl (float): Masa berlaku entri dalam detik.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                kedaluwarsa, value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if kedaluwarsa <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        super().set(key, (time.monotonic() + self.ttl, value))
+
+    def __contains__(self, key):
+        with self._lock:
+            entri = self._data.get(key)
+            return entri is not None and entri[0] > time.monotonic()
+
+    def clear(self):
+        super().clear()
+        self.expirations = 0
+
+    def stats(self) -> dict:
+        """
+        Mengambil statistik pemakaian cache.
+
+        Returns:
+            dict: Statistik LRUCache ditambah jumlah entri kedaluwarsa dan TTL
+        """
+        return {**super().stats(), "expirations": self.expirations, "ttl": self.ttl}
+
+
+class SQLiteCache:
+    """
+    Cache persisten berbasis SQLite untuk pasangan kunci-nilai bertipe string.
+
+    Isi cache bertahan setelah server di-restart. Koneksi dibuka ulang secara
+    otomatis jika dipakai dari proses lain (misal setelah fork worker), dan
+    database memakai mode WAL sehingga beberapa proses dapat membaca sambil
+    satu proses menulis.
+
+    Args:
+        path (str): Lokasi file database SQLite.
+        tabel (str): Nama tabel yang dipakai untuk menyimpan entri.
+    """
+
+    def __init__(self, path: str, tabel: str = "cache"):
+        self.path = path
+        self.tabel = tabel
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _koneksi(self):
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(
+                self.path, timeout=5.0, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.tabel} "
+                "(kunci TEXT PRIMARY KEY, nilai TEXT NOT NULL)"
+            )
+            self._conn.commit()
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str, default=None):
+        """
+        Mengambil nilai dari database.
+
+        Args:
+            key (str): Kunci entri
+            default: Nilai yang dikembalikan jika kunci tidak ada
+
+        Returns:
+            str: Nilai yang tersimpan, atau `default` jika tidak ada
+        """
+        with self._lock:
+            baris = (
+                self._koneksi()
+                .execute(f"SELECT nilai FROM {self.tabel} WHERE kunci = ?", (key,))
+                .fetchone()
+            )
+        return baris[0] if baris is not None else default
+
+    def set(self, key: str, value: str):
+        """
+        Menyimpan nilai ke database, menimpa nilai lama jika kunci sudah ada.
+
+        Jika database sedang dikunci proses lain lebih lama dari batas waktu,
+        penulisan dilewati: nilai tetap tersimpan di cache memori pemanggil.
+
+        Args:
+            key (str): Kunci entri
+            value (str): Nilai yang disimpan
+        """
+        with self._lock:
+            conn = self._koneksi()
+            try:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.tabel} (kunci, nilai) VALUES (?, ?)",
+                    (key, value),
+                )
+                conn.commit()
+            except sqlite3.OperationalError:
+                conn.rollback()
+
+
+class TieredCache:
+    """
+    Cache dua tingkat: LRU di memori dan (opsional) cache persisten di disk.
+
+    Pencarian dilakukan di memori terlebih dahulu, lalu di disk. Nilai yang
+    ditemukan di disk dimuat kembali ke memori. Karena disk hanya menyimpan
+    string, konversi nilai diatur lewat `serialize` dan `deserialize`.
+
+    Args:
+        memori (LRUCache): Cache tingkat pertama.
+        disk (SQLiteCache, optional): Cache tingkat kedua; None untuk menonaktifkan.
+        serialize (callable): Mengubah nilai menjadi string untuk disimpan di disk.
+        deserialize (callable): Mengubah string dari disk kembali menjadi nilai.
+    """
+
+    def __init__(self, memori, disk=None, serialize=str, deserialize=str):
+        self.memori = memori
+        self.disk = disk
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.disk_hits = 0
+
+    def get(self, key: str, default=None):
+        value = self.memori.get(key)
+        if value is not None:
+            return value
+        if self.disk is not None:
+            tersimpan = self.disk.get(key)
+            if tersimpan is not None:
+                value = self.deserialize(tersimpan)
+                self.memori.set(key, value)
+                self.disk_hits += 1
+                return value
+        return default
+
+    def __contains__(self, key: str):
+        if key in self.memori:
+            return True
+        return self.disk is not None and self.disk.get(key) is not None
+
+    def set(self, key: str, value):
+        self.memori.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, self.serialize(value))
+
+    def get_or_compute(self, key: str, hitung):
+        """
+        Mengambil nilai dari cache, atau menghitungnya dengan `hitung()` lalu menyimpannya.
+
+        Args:
+            key (str): Kunci entri
+            hitung (callable): Fungsi tanpa argumen untuk menghitung nilai saat cache miss
+
+        Returns:
+            Nilai dari cache atau hasil `hitung()`
+        """
+        value = self.get(key)
+        if value is None:
+            value = hitung()
+            self.set(key, value)
+        return value
+
+    def stats(self) -> dict:
+        """
+        Mengambil statistik pemakaian cache.
+
+        Returns:
+            dict: Statistik cache memori ditambah jumlah hit dari disk
+        """
+        return {
+            **self.memori.stats(),
+            "disk_hits": self.disk_hits,
+            "disk_enabled": self.disk is not None,
+        }
@@ -1,40 +1,100 @@
+import logging
+
 import numpy as np
-from sympy import diff, Symbol, latex
-from services.utils import eval_func
+from services.analisis import analisis_fungsi, latex_polinomial, polinomial_fungsi
+from services.cache import LRUCache
+from services.symbolic import evaluasi_simbolik, turunan_simbolik
+from services.symbolic_pool import SymbolicUnavailableError
+from services.utils import compile_func, eval_func_array
+
+logger = logging.getLogger(__name__)
+
+# Cache koefisien stensil, kunci: (orde turunan, tuple offset titik)
+_stensil_cache = LRUCache(maxsize=128)
 
-x = Symbol("x")
+JENIS_STENSIL = ["tengahan", "maju", "mundur"]
 
+# Langkah imajiner untuk memeriksa Re f(x + ih) = f(x), terlepas dari h pengguna
+_H_UJI_KOMPLEKS = 1e-20
 
-def turunan_analitik(fungsi_str: str, nilai_x: float):
+
+def turunan_analitik(
+    fungsi_str: str, nilai_x: float, orde: int = 1, bulatkan: bool = True
+):
     """
     Menghitung turunan secara analitik menggunakan sympy.
 
     Args:
         fungsi_str (str): Fungsi sebagai string
         nilai_x (float): Nilai x dimana turunan akan dihitung
+        orde (int): Orde turunan (1 untuk f', 2 untuk f'', dst.)
+        bulatkan (bool): Jika False, hasil tidak dibulatkan ke 3 desimal
 
     Returns:
         float: Hasil turunan analitik yang sudah dievaluasi
         str: Turunan fungsi dalam format LaTeX
 
     Raises:
-        ValueError: Jika fungsi tidak bisa diturunkan secara analitik
+        ValueError: Jika fungsi tidak bisa diturunkan secara analitik atau
+            turunannya tidak bernilai real dan hingga di `nilai_x`
+        SymbolicUnavailableError: Jika komputasi simbolik melebihi batas waktu
     """
     try:
-        turunan = diff(fungsi_str, x)
-        turunan_latex = latex(turunan)
-        hasil_analitik = turunan.subs(x, nilai_x)
-
-        # Konversi ke float dan bulatkan
-        if hasattr(hasil_analitik, "evalf"):
-            return round(float(hasil_analitik.evalf()), 3), turunan_latex
-        return (round(float(hasil_analitik), 3)), turunan_latex
+        hasil_simbolik = turunan_simbolik(fungsi_str, orde)
+        turunan, turunan_latex = hasil_simbolik["expr"], hasil_simbolik["latex"]
+        hasil_analitik = float(evaluasi_simbolik(turunan, nilai_x))
+    except SymbolicUnavailableError:
+        raise
     except Exception as e:
-        print("Gagal menghitung turunan analitik:", e)
+        logger.warning("Gagal menghitung turunan analitik: %s", e)
         raise ValueError("Gagal menghitung turunan analitik")
+    if not np.isfinite(hasil_analitik):
+        raise ValueError(
+            f"Turunan analitik tidak bernilai real dan hingga di x = {nilai_x}."
+        )
+
+    # Bulatkan
+    if bulatkan:
+        hasil_analitik = round(hasil_analitik, 3)
+    return hasil_analitik, turunan_latex
+
+
+def turunan_analitik_cepat(
+    fungsi_str: str, nilai_x: float, orde: int = 1, bulatkan: bool = True
+):
+    """
+    Menghitung turunan analitik, memakai turunan tertutup `numpy.polynomial` jika
+    analisis statis menyatakan fungsi polinomial (tanpa sympy sama sekali).
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        nilai_x (float): Nilai x dimana turunan akan dihitung
+        orde (int): Orde turunan (1 untuk f', 2 untuk f'', dst.)
+        bulatkan (bool): Jika False, hasil tidak dibulatkan ke 3 desimal
+
+    Returns:
+        float: Hasil turunan analitik
+        str: Turunan fungsi dalam format LaTeX
+        str: Jalur yang dipakai: _polinomial_ atau _simbolik_
+
+    Raises:
+        ValueError: Jika fungsi tidak bisa diturunkan secara analitik
+        SymbolicUnavailableError: Jika komputasi simbolik melebihi batas waktu
+    """
+    polinomial = polinomial_fungsi(fungsi_str)
+    if polinomial is not None:
+        turunan = polinomial.deriv(orde)
+        hasil = float(turunan(nilai_x))
+        return (
+            (round(hasil, 3) if bulatkan else hasil),
+            latex_polinomial(turunan),
+            "polinomial",
+        )
+    hasil, turunan_latex = turunan_analitik(fungsi_str, nilai_x, orde, bulatkan)
+    return hasil, turunan_latex, "simbolik"
 
 
-def selisih_maju(fungsi_str: str, x: float, h: float, np_alias=np):
+def selisih_maju(fungsi_str: str, x: float, h: float, np_alias=np, tracer=None):
     """
     Menghitung turunan fungsi dengan Metode Selisih Maju
 
@@ -42,27 +102,24 @@ def selisih_maju(fungsi_str: str, x: float, h: float, np_alias=np):
         fungsi_str (str): Fungsi sebagai string
         x (float): Nilai x dari fungsi
         h (float): Ukuran langkah (step size)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
 
     Returns:
         float: Nilai numerik
     """
-    result = (
-        eval_func(fungsi_str, x + h, np_alias) - eval_func(fungsi_str, x, np_alias)
-    ) / h
+    f = compile_func(fungsi_str, np_alias)
+    f_maju, f_x = f(x + h), f(x)
+    if tracer is not None:
+        tracer.catat([x, x + h], [f_x, f_maju], [-1 / h, 1 / h])
+    result = (f_maju - f_x) / h
     # Kondisi jika floating point terlalu kecil
     if round(result, 3) == -0.0:
         result = 0.0
 
-    print("\n--- Turunan (Metode Selisih Maju) ---")
-    print(f"f(x) = {fungsi_str}")
-    print(f"x = {x}")
-    print(f"h = {h}")
-    print("\nHasil numerik = ", round(result, 3))
-
     return round(result, 3)
 
 
-def selisih_tengahan(fungsi_str: str, x: float, h: float, np_alias=np):
+def selisih_tengahan(fungsi_str: str, x: float, h: float, np_alias=np, tracer=None):
     """
     Menghitung turunan fungsi dengan Metode Selisih Tengahan
 
@@ -70,26 +127,23 @@ def selisih_tengahan(fungsi_str: str, x: float, h: float, np_alias=np):
         fungsi_str (str): Fungsi sebagai string
         x (float): Nilai x dari fungsi
         h (float): Ukuran langkah (step size)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
 
     Returns:
         float: Nilai numerik
     """
-    result = (
-        eval_func(fungsi_str, x + h, np_alias) - eval_func(fungsi_str, x - h, np_alias)
-    ) / (2 * h)
+    f = compile_func(fungsi_str, np_alias)
+    f_maju, f_mundur = f(x + h), f(x - h)
+    if tracer is not None:
+        tracer.catat([x - h, x + h], [f_mundur, f_maju], [-1 / (2 * h), 1 / (2 * h)])
+    result = (f_maju - f_mundur) / (2 * h)
     # Kondisi jika floating point terlalu kecil
     if round(result, 3) == -0.0:
         result = 0.0
-
-    print("\n--- Turunan (Metode Selisih Tengahan) ---")
-    print(f"f(x) = {fungsi_str}")
-    print(f"x = {x}")
-    print(f"h = {h}")
-    print("\nHasil numerik = ", round(result, 3))
     return round(result, 3)
 
 
-def selisih_mundur(fungsi_str: str, x: float, h: float, np_alias=np):
+def selisih_mundur(fungsi_str: str, x: float, h: float, np_alias=np, tracer=None):
     """
     Menghitung turunan fungsi dengan Metode Selisih Mundur
 
@@ -97,20 +151,443 @@ def selisih_mundur(fungsi_str: str, x: float, h: float, np_alias=np):
         fungsi_str (str): Fungsi sebagai string
         x (float): Nilai x dari fungsi
         h (float): Ukuran langkah (step size)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
 
     Returns:
         float: Nilai numerik
     """
-    result = (
-        eval_func(fungsi_str, x, np_alias) - eval_func(fungsi_str, x - h, np_alias)
-    ) / h
+    f = compile_func(fungsi_str, np_alias)
+    f_x, f_mundur = f(x), f(x - h)
+    if tracer is not None:
+        tracer.catat([x - h, x], [f_mundur, f_x], [-1 / h, 1 / h])
+    result = (f_x - f_mundur) / h
     # Kondisi jika floating point terlalu kecil
     if result == -0.0:
         result = 0.0
-
-    print("\n--- Turunan (Metode Selisih Mundur) ---")
-    print(f"f(x) = {fungsi_str}")
-    print(f"x = {x}")
-    print(f"h = {h}")
-    print("\nHasil numerik = ", round(result, 3))
     return round(result, 3)
+
+
+def turunan_analitik_array(fungsi_str: str, nilai_x):
+    """
+    Menghitung turunan analitik pada banyak titik x sekaligus.
+
+    Turunan simbolik dihitung sekali (lewat cache) lalu dievaluasi di semua titik
+    sekaligus dengan callable numpy hasil lambdify. Titik di mana turunan tidak
+    bernilai real dan hingga (misal ln(x) di x <= 0) bernilai NaN.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        nilai_x (array-like): Titik-titik x dimana turunan akan dihitung
+
+    Returns:
+        np.ndarray: Hasil turunan analitik yang sudah dibulatkan (NaN jika tidak real)
+        str: Turunan fungsi dalam format LaTeX
+
+    Raises:
+        ValueError: Jika fungsi tidak bisa diturunkan secara analitik
+        SymbolicUnavailableError: Jika komputasi simbolik melebihi batas waktu
+    """
+    try:
+        hasil_simbolik = turunan_simbolik(fungsi_str)
+        hasil = evaluasi_simbolik(hasil_simbolik["expr"], np.ravel(nilai_x))
+        hasil[~np.isfinite(hasil)] = np.nan
+        return np.round(hasil, 3), hasil_simbolik["latex"]
+    except SymbolicUnavailableError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Gagal menghitung turunan analitik: {e}")
+
+
+def selisih_array(fungsi_str: str, metode: str, x, h, np_alias=np):
+    """
+    Menghitung turunan numerik secara tervektorisasi untuk banyak pasangan (x, h).
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        metode (str): _selisih-maju_, _selisih-tengahan_, _selisih-mundur_, atau
+            _langkah-kompleks_ (h diabaikan)
+        x (array-like): Nilai-nilai x
+        h (array-like): Ukuran langkah, di-broadcast terhadap x
+
+    Returns:
+        np.ndarray: Nilai numerik (dibulatkan 3 desimal)
+
+    Raises:
+        ValueError: Jika metode tidak dikenal atau evaluasi fungsi gagal
+    """
+    x, h = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(h, dtype=float))
+    if metode == "selisih-maju":
+        result = (
+            eval_func_array(fungsi_str, x + h, np_alias)
+            - eval_func_array(fungsi_str, x, np_alias)
+        ) / h
+    elif metode == "selisih-tengahan":
+        result = (
+            eval_func_array(fungsi_str, x + h, np_alias)
+            - eval_func_array(fungsi_str, x - h, np_alias)
+        ) / (2 * h)
+    elif metode == "selisih-mundur":
+        result = (
+            eval_func_array(fungsi_str, x, np_alias)
+            - eval_func_array(fungsi_str, x - h, np_alias)
+        ) / h
+    elif metode == "langkah-kompleks":
+        result = turunan_kompleks_array(fungsi_str, x, np_alias=np_alias)
+    else:
+        raise ValueError(f"Metode '{metode}' tidak valid.")
+    # + 0.0 mengubah -0.0 menjadi 0.0
+    return np.round(result, 3) + 0.0
+
+
+def koefisien_fornberg(orde_turunan: int, titik):
+    """
+    Menghitung koefisien stensil beda hingga dengan algoritma Fornberg.
+
+    Koefisien c_k memenuhi f^(m)(x) ~ sum c_k f(x + t_k h) / h^m, dengan t_k
+    adalah offset titik dalam satuan h. Hasil disimpan di cache.
+
+    Args:
+        orde_turunan (int): Orde turunan m
+        titik (sequence): Offset titik t_k (harus berbeda satu sama lain)
+
+    Returns:
+        np.ndarray: Koefisien untuk setiap titik (read-only)
+
+    Raises:
+        ValueError: Jika jumlah titik kurang dari orde_turunan + 1
+    """
+    titik = tuple(float(t) for t in titik)
+    kunci = (orde_turunan, titik)
+    koefisien = _stensil_cache.get(kunci)
+    if koefisien is not None:
+        return koefisien
+    if len(titik) <= orde_turunan:
+        raise ValueError("Jumlah titik stensil harus lebih dari orde turunan.")
+
+    n = len(titik)
+    c = np.zeros((n, orde_turunan + 1))
+    c[0, 0] = 1.0
+    c1, c4 = 1.0, titik[0]
+    for i in range(1, n):
+        mn = min(i, orde_turunan)
+        c2, c5, c4 = 1.0, c4, titik[i]
+        for j in range(i):
+            c3 = titik[i] - titik[j]
+            c2 *= c3
+            if j == i - 1:
+                for k in range(mn, 0, -1):
+                    c[i, k] = c1 * (k * c[i - 1, k - 1] - c5 * c[i - 1, k]) / c2
+                c[i, 0] = -c1 * c5 * c[i - 1, 0] / c2
+            for k in range(mn, 0, -1):
+                c[j, k] = (c4 * c[j, k] - k * c[j, k - 1]) / c3
+            c[j, 0] = c4 * c[j, 0] / c3
+        c1 = c2
+
+    koefisien = c[:, orde_turunan].copy()
+    koefisien.flags.writeable = False
+    _stensil_cache.set(kunci, koefisien)
+    return koefisien
+
+
+def titik_stensil(orde_turunan: int, orde_akurasi: int, jenis: str = "tengahan"):
+    """
+    Menentukan offset titik stensil untuk orde turunan dan orde akurasi tertentu.
+
+    Args:
+        orde_turunan (int): Orde turunan m
+        orde_akurasi (int): Orde akurasi p (error ~ h^p); harus genap untuk stensil tengahan
+        jenis (str): _tengahan_, _maju_, atau _mundur_
+
+    Returns:
+        np.ndarray: Offset titik dalam satuan h
+
+    Raises:
+        ValueError: Jika orde atau jenis stensil tidak valid
+    """
+    if orde_turunan < 1 or orde_akurasi < 1:
+        raise ValueError("Orde turunan dan orde akurasi harus lebih besar dari 0.")
+    if jenis == "tengahan":
+        if orde_akurasi % 2 != 0:
+            raise ValueError("Orde akurasi stensil tengahan harus genap.")
+        jumlah = 2 * ((orde_turunan + 1) // 2) - 1 + orde_akurasi
+        k = (jumlah - 1) // 2
+        return np.arange(-k, k + 1, dtype=float)
+    if jenis == "maju":
+        return np.arange(orde_turunan + orde_akurasi, dtype=float)
+    if jenis == "mundur":
+        return -np.arange(orde_turunan + orde_akurasi, dtype=float)[::-1]
+    raise ValueError(f"Jenis stensil '{jenis}' tidak valid.")
+
+
+def h_optimal(x: float, orde_turunan: int = 1, orde_akurasi: int = 2):
+    """
+    Memperkirakan ukuran langkah optimal untuk turunan beda hingga.
+
+    Error total ~ C h^p (pemotongan) + eps |f| / h^m (pembulatan) minimum di
+    sekitar h = eps^(1 / (p + m)), diskalakan dengan besar x.
+
+    Args:
+        x (float): Nilai x
+        orde_turunan (int): Orde turunan m
+        orde_akurasi (int): Orde akurasi p
+
+    Returns:
+        float: Ukuran langkah h
+    """
+    eps = np.finfo(float).eps
+    return float(eps ** (1 / (orde_akurasi + orde_turunan)) * max(1.0, abs(x)))
+
+
+def turunan_stensil(
+    fungsi_str: str,
+    x: float,
+    h: float,
+    orde_turunan: int = 1,
+    orde_akurasi: int = 2,
+    jenis: str = "tengahan",
+    np_alias=np,
+    tracer=None,
+):
+    """
+    Menghitung turunan orde berapa pun dengan stensil beda hingga (koefisien Fornberg)
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        x (float): Nilai x dari fungsi
+        h (float): Ukuran langkah (step size)
+        orde_turunan (int): Orde turunan (1 untuk f', 2 untuk f'', dst.)
+        orde_akurasi (int): Orde akurasi stensil
+        jenis (str): _tengahan_, _maju_, atau _mundur_
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+
+    Returns:
+        float: Nilai numerik
+
+    Raises:
+        ValueError: Jika parameter stensil tidak valid atau evaluasi fungsi gagal
+    """
+    offset = titik_stensil(orde_turunan, orde_akurasi, jenis)
+    bobot = koefisien_fornberg(orde_turunan, offset) / h**orde_turunan
+    titik_x = x + h * offset
+    f_x = eval_func_array(fungsi_str, titik_x, np_alias)
+    if tracer is not None:
+        tracer.catat(titik_x, f_x, bobot)
+    result = float(np.dot(bobot, f_x))
+    # + 0.0 mengubah -0.0 menjadi 0.0
+    return round(result, 3) + 0.0
+
+
+def turunan_richardson(
+    fungsi_str: str,
+    x: float,
+    h: float,
+    orde_turunan: int = 1,
+    level: int = 4,
+    np_alias=np,
+    tracer=None,
+):
+    """
+    Menghitung turunan dengan selisih tengahan yang diekstrapolasi Richardson
+
+    Selisih tengahan orde 2 dihitung dengan h, h/2, ..., h/2^(level-1), lalu
+    D[i][j] = D[i][j-1] + (D[i][j-1] - D[i-1][j-1]) / (4^j - 1).
+    Semua titik dievaluasi dalam satu panggilan tervektorisasi.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        x (float): Nilai x dari fungsi
+        h (float): Ukuran langkah awal
+        orde_turunan (int): Orde turunan (1 untuk f', 2 untuk f'', dst.)
+        level (int): Jumlah ukuran langkah yang dipakai (minimal 2)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+
+    Returns:
+        float: Nilai numerik
+        float: Estimasi error |D[k][k] - D[k-1][k-1]|
+
+    Raises:
+        ValueError: Jika level kurang dari 2 atau evaluasi fungsi gagal
+    """
+    if level < 2:
+        raise ValueError("Level Richardson minimal 2.")
+    offset = titik_stensil(orde_turunan, 2, "tengahan")
+    koefisien = koefisien_fornberg(orde_turunan, offset)
+    langkah = h / 2.0 ** np.arange(level)
+
+    # Baris = ukuran langkah, kolom = titik stensil
+    titik_x = x + langkah[:, None] * offset[None, :]
+    f_x = eval_func_array(fungsi_str, titik_x.ravel(), np_alias).reshape(titik_x.shape)
+    bobot = koefisien[None, :] / langkah[:, None] ** orde_turunan
+    if tracer is not None:
+        tracer.catat(titik_x.ravel(), f_x.ravel(), bobot.ravel())
+    kolom = np.sum(bobot * f_x, axis=1)
+
+    tabel = []
+    for i in range(level):
+        baris = [float(kolom[i])]
+        for j in range(1, i + 1):
+            baris.append(
+                baris[j - 1] + (baris[j - 1] - tabel[i - 1][j - 1]) / (4**j - 1)
+            )
+        tabel.append(baris)
+    estimasi_error = abs(tabel[-1][-1] - tabel[-2][-2])
+
+    return round(tabel[-1][-1], 3) + 0.0, estimasi_error
+
+
+def barisan_turunan(
+    fungsi_str: str,
+    metode: str,
+    x: float,
+    h: float,
+    orde_turunan: int = 1,
+    np_alias=np,
+    tracer=None,
+):
+    """
+    Generator turunan numerik dengan ukuran langkah h, h/2, h/4, ...
+
+    Nilai f(x) (offset 0 pada stensil) hanya dievaluasi sekali dan dipakai ulang
+    di setiap langkah. Untuk metode _richardson_, setiap langkah menambah satu baris
+    tabel ekstrapolasi Richardson atas selisih tengahan.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        metode (str): _selisih-maju_, _selisih-tengahan_, _selisih-mundur_, atau _richardson_
+        x (float): Nilai x dari fungsi
+        h (float): Ukuran langkah awal
+        orde_turunan (int): Orde turunan (hanya untuk _richardson_)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+
+    Yields:
+        tuple: (h, nilai turunan tanpa pembulatan, jumlah evaluasi kumulatif)
+
+    Raises:
+        ValueError: Jika metode tidak dikenal atau evaluasi fungsi gagal
+    """
+    if metode == "selisih-maju":
+        offset = titik_stensil(1, 1, "maju")
+    elif metode == "selisih-tengahan":
+        offset = titik_stensil(1, 2, "tengahan")
+    elif metode == "selisih-mundur":
+        offset = titik_stensil(1, 1, "mundur")
+    elif metode == "richardson":
+        offset = titik_stensil(orde_turunan, 2, "tengahan")
+    else:
+        raise ValueError(f"Metode '{metode}' tidak valid.")
+    if metode != "richardson":
+        orde_turunan = 1
+    koefisien = koefisien_fornberg(orde_turunan, offset)
+    # Titik dengan koefisien 0 (misal x pada selisih tengahan) tidak dievaluasi
+    bukan_nol = (offset != 0) & (koefisien != 0)
+
+    f_titik = np.zeros(offset.shape)
+    jumlah_evaluasi = 0
+    if np.any((offset == 0) & (koefisien != 0)):
+        f_x = float(eval_func_array(fungsi_str, [x], np_alias)[0])
+        jumlah_evaluasi = 1
+        if tracer is not None:
+            tracer.catat(x, f_x)
+        f_titik[offset == 0] = f_x
+    baris_lama = []
+    while True:
+        titik_x = x + h * offset[bukan_nol]
+        f_titik[bukan_nol] = eval_func_array(fungsi_str, titik_x, np_alias)
+        jumlah_evaluasi += titik_x.size
+        bobot = koefisien / h**orde_turunan
+        if tracer is not None:
+            tracer.catat(titik_x, f_titik[bukan_nol], bobot[bukan_nol])
+        nilai = float(np.dot(bobot, f_titik))
+        if metode == "richardson":
+            baris = [nilai]
+            for j in range(1, len(baris_lama) + 1):
+                baris.append(
+                    baris[j - 1] + (baris[j - 1] - baris_lama[j - 1]) / (4**j - 1)
+                )
+            nilai, baris_lama = baris[-1], baris
+        yield h, nilai, jumlah_evaluasi
+        h /= 2
+
+
+def turunan_kompleks_array(fungsi_str: str, x, h: float = 1e-20, np_alias=np):
+    """
+    Menghitung f'(x) dengan metode langkah kompleks: f'(x) ~ Im f(x + ih) / h.
+
+    Tidak ada pengurangan dua nilai yang hampir sama, sehingga h boleh sangat
+    kecil dan hasilnya akurat hingga presisi mesin dengan satu evaluasi per titik.
+    Hanya berlaku untuk fungsi analitik (sin, exp, log, pangkat, dsb.) di dalam
+    domain real-nya: titik di mana f(x) real tidak hingga, atau Re f(x + ih)
+    berbeda dari f(x) (cabang kompleks lain, misal ln(x) untuk x < 0), bernilai NaN.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        x (array-like): Nilai-nilai x
+        h (float): Ukuran langkah imajiner
+
+    Returns:
+        np.ndarray: Nilai turunan tanpa pembulatan (NaN pada titik yang tidak valid)
+
+    Raises:
+        ValueError: Jika fungsi tidak analitik (misal memuat nilai mutlak) atau
+            tidak dapat dievaluasi pada bilangan kompleks
+    """
+    return _langkah_kompleks(fungsi_str, x, h, np_alias)[0]
+
+
+def _langkah_kompleks(fungsi_str: str, x, h: float, np_alias):
+    # Mengembalikan (Im f(x + ih) / h, Re f(x + ih)); Re f(x + ih) ~ f(x).
+    # Turunan bernilai NaN pada titik di mana metode ini tidak berlaku.
+    if analisis_fungsi(fungsi_str).kelas == "piecewise":
+        # |x + ih| real, sehingga Im-nya selalu 0 dan turunan yang didapat salah
+        raise ValueError(
+            "Metode langkah kompleks tidak berlaku untuk fungsi non-analitik (nilai mutlak)."
+        )
+    f = compile_func(fungsi_str, np_alias)
+    x = np.asarray(x, dtype=float)
+    with np.errstate(all="ignore"):
+        hasil = np.asarray(f(x + 1j * h))
+        f_real = np.broadcast_to(np.asarray(f(x)), x.shape)
+        uji = hasil if h <= _H_UJI_KOMPLEKS else np.asarray(f(x + 1j * _H_UJI_KOMPLEKS))
+    if hasil.dtype.kind not in "biufc" or f_real.dtype.kind not in "biuf":
+        raise ValueError("Fungsi tidak dapat dievaluasi pada bilangan kompleks.")
+    hasil = np.broadcast_to(hasil, x.shape)
+    uji = np.broadcast_to(uji, x.shape)
+    f_real = f_real.astype(float)
+    turunan = (np.imag(hasil) / h).astype(float)
+    valid = (
+        np.isfinite(f_real)
+        & np.isfinite(turunan)
+        & np.isclose(np.real(uji), f_real, rtol=1e-9, atol=1e-12)
+    )
+    return np.where(valid, turunan, np.nan), np.real(hasil).astype(float)
+
+
+def turunan_kompleks(
+    fungsi_str: str, x: float, h: float = 1e-20, np_alias=np, tracer=None
+):
+    """
+    Menghitung turunan fungsi dengan Metode Langkah Kompleks
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        x (float): Nilai x dari fungsi
+        h (float): Ukuran langkah imajiner
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+
+    Returns:
+        float: Nilai numerik
+
+    Raises:
+        ValueError: Jika fungsi tidak analitik, atau x di luar domain real fungsi
+    """
+    turunan, f_x = _langkah_kompleks(fungsi_str, x, h, np_alias)
+    if tracer is not None:
+        tracer.catat(x, f_x, 1 / h)
+    result = float(turunan)
+    if not np.isfinite(result):
+        raise ValueError(
+            f"Turunan langkah kompleks tidak terdefinisi pada x={x}: fungsi tidak "
+            "bernilai real hingga atau tidak analitik di titik ini."
+        )
+    # + 0.0 mengubah -0.0 menjadi 0.0
+    return round(result, 3) + 0.0
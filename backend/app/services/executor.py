@@ -0,0 +1,166 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import COMPUTE_QUEUE_DEPTH, COMPUTE_WORKERS, INTEGRAL_WORKERS
+
+
+class ComputeQueueFullError(Exception):
+    """
+    Antrian komputasi penuh; permintaan sebaiknya dicoba lagi nanti.
+    """
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=COMPUTE_WORKERS, thread_name_prefix="komputasi"
+)
+# Pool terpisah untuk panel integral: panel dikirim dari thread komputasi,
+# sehingga memakai pool yang sama dapat menyebabkan deadlock saat pool penuh
+_panel_executor = ThreadPoolExecutor(
+    max_workers=INTEGRAL_WORKERS, thread_name_prefix="panel"
+)
+_lock = threading.Lock()
+_aktif = 0
+
+
+def compute_stats() -> dict:
+    """
+    Mengambil status antrian komputasi.
+
+    Returns:
+        dict: Jumlah permintaan aktif (berjalan + menunggu) dan kapasitasnya
+    """
+    return {
+        "aktif": _aktif,
+        "workers": COMPUTE_WORKERS,
+        "kapasitas": COMPUTE_WORKERS + COMPUTE_QUEUE_DEPTH,
+    }
+
+
+def _ambil_slot():
+    global _aktif
+    with _lock:
+        if _aktif >= COMPUTE_WORKERS + COMPUTE_QUEUE_DEPTH:
+            raise ComputeQueueFullError("Server sedang sibuk, silakan coba lagi.")
+        _aktif += 1
+
+
+def _lepas_slot():
+    global _aktif
+    with _lock:
+        _aktif -= 1
+
+
+async def run_compute(fungsi, *args, **kwargs):
+    """
+    Menjalankan komputasi blocking (NumPy/sympy/eval) di thread pool agar event
+    loop tetap bisa melayani permintaan lain.
+
+    Args:
+        fungsi (callable): Fungsi sinkron yang akan dijalankan
+        *args: Argumen posisi untuk fungsi
+        **kwargs: Argumen keyword untuk fungsi
+
+    Slot antrian dilepas saat thread selesai menghitung, bukan saat coroutine
+    pemanggil berhenti menunggu: jika permintaan dibatalkan (misal klien terputus),
+    komputasi yang sudah berjalan tetap dihitung dalam kapasitas sampai selesai.
+
+    Returns:
+        Hasil `fungsi(*args, **kwargs)`
+
+    Raises:
+        ComputeQueueFullError: Jika jumlah permintaan aktif sudah mencapai kapasitas
+    """
+    _ambil_slot()
+    try:
+        future = _executor.submit(functools.partial(fungsi, *args, **kwargs))
+    except BaseException:
+        _lepas_slot()
+        raise
+    future.add_done_callback(lambda _: _lepas_slot())
+    return await asyncio.wrap_future(future)
+
+
+def iter_compute(iterator):
+    """
+    Menjalankan iterator blocking langkah demi langkah di thread pool komputasi.
+
+    Satu slot antrian dipakai selama seluruh iterasi sehingga respons streaming
+    yang panjang tetap dihitung dalam kapasitas. Kapasitas diperiksa saat fungsi
+    ini dipanggil (bukan saat iterasi pertama) agar antrian penuh masih bisa
+    dibalas dengan HTTP 503 sebelum respons dimulai.
+
+    Args:
+        iterator (Iterator): Iterator sinkron, misal generator hasil komputasi
+
+    Returns:
+        AsyncIterator: Item-item dari iterator
+
+    Raises:
+        ComputeQueueFullError: Jika jumlah permintaan aktif sudah mencapai kapasitas
+    """
+    _ambil_slot()
+    return _IterasiCompute(iterator)
+
+
+class _IterasiCompute:
+    # Iterator asinkron yang melepas slot antrian tepat sekali: saat iterator
+    # habis, saat terjadi error, atau saat aclose() dipanggil (klien terputus).
+    # Jika langkah masih berjalan di thread, slot baru dilepas saat langkah selesai.
+
+    _habis = object()
+
+    def __init__(self, iterator):
+        self._iterator = iterator
+        self._memegang_slot = True
+        self._langkah = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._memegang_slot:
+            raise StopAsyncIteration
+        try:
+            self._langkah = _executor.submit(next, self._iterator, self._habis)
+            item = await asyncio.wrap_future(self._langkah)
+        except BaseException:
+            await self.aclose()
+            raise
+        if item is self._habis:
+            await self.aclose()
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self):
+        if self._memegang_slot:
+            self._memegang_slot = False
+            if self._langkah is None:
+                _lepas_slot()
+            else:
+                # Langsung dipanggil jika langkah terakhir sudah selesai
+                self._langkah.add_done_callback(lambda _: _lepas_slot())
+
+
+def map_panel(fungsi, daftar_kwargs):
+    """
+    Menjalankan `fungsi(**kwargs)` untuk setiap panel secara paralel.
+
+    Evaluasi NumPy melepas GIL pada array besar sehingga thread cukup untuk
+    memakai banyak core tanpa biaya serialisasi data antar proses.
+
+    Args:
+        fungsi (callable): Fungsi sinkron yang menghitung satu panel
+        daftar_kwargs (list[dict]): Argumen keyword untuk setiap panel
+
+    Returns:
+        list: Hasil setiap panel, urut sesuai `daftar_kwargs`
+    """
+    futures = [_panel_executor.submit(fungsi, **kwargs) for kwargs in daftar_kwargs]
+    try:
+        return [future.result() for future in futures]
+    finally:
+        # Jika satu panel gagal, panel yang belum mulai tidak perlu dijalankan
+        for future in futures:
+            future.cancel()
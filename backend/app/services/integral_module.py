@@ -1,18 +1,95 @@
+import math
+
 import numpy as np
-from sympy import integrate, Symbol, latex, parse_expr
-from services.utils import hitung_h, eval_func
+from sympy import Integral, Symbol
+from config import INTEGRAL_CHUNK_SIZE
+from services.analisis import analisis_fungsi, latex_polinomial, polinomial_fungsi
+from services.cache import LRUCache
+from services.executor import map_panel
+from services.penjumlahan import jumlah_suku, jumlahkan
+from services.symbolic import (
+    antiturunan_simbolik,
+    fungsi_numerik,
+    integral_tentu_simbolik,
+    nilai_antiturunan_simbolik,
+)
+from services.symbolic_pool import SymbolicTimeoutError, SymbolicUnavailableError
+from services.utils import hitung_h, eval_func_array, to_sympy
 
 x = Symbol("x")
 
+# Cache tabel titik dan bobot Gauss-Legendre, kunci: jumlah titik n
+_gauss_legendre_cache = LRUCache(maxsize=64)
+
+# Batas t simpul tanh-sinh: jarak simpul ke ujung interval mencapai ~1e-300
+_T_MAKS_TANH_SINH = 6.1
+
+# Jarak minimum simpul ke ujung tak hingga (x hingga sekitar 2e15), agar
+# pangkat besar dari x tidak overflow saat integran meluruh di tak hingga
+_JARAK_MIN_TAK_HINGGA = 1e-15
+
+
+def _nilai_antiturunan(fungsi, antiturunan, batas_bawah, batas_atas, mulus=False):
+    """
+    Menghitung F(b) - F(a) dari antiturunan, atau None jika tidak berlaku.
+
+    Teorema dasar kalkulus hanya dipakai jika antiturunan berhasil dihitung dan
+    fungsi tidak memiliki titik singular di dalam interval. Pemeriksaan
+    singularitas (mahal) dilewati jika analisis statis sudah menyatakan fungsi mulus.
+    Pemeriksaan itu dan evaluasi subs/evalf berjalan di process pool dengan batas
+    waktu; jika terlewati, None dikembalikan agar pemanggil memakai integral tentu.
+    """
+    if antiturunan.has(Integral):
+        return None
+
+    # Jalur cepat: callable numpy hasil lambdify. Dievaluasi sebagai bilangan
+    # kompleks agar cabang log/akar dari nilai negatif tetap saling menghapus.
+    nilai_cepat = None
+    try:
+        F = fungsi_numerik(antiturunan)
+        with np.errstate(all="ignore"):
+            hasil = complex(F(complex(batas_atas)) - F(complex(batas_bawah)))
+        if np.isfinite(hasil) and abs(hasil.imag) <= 1e-12 * max(1.0, abs(hasil.real)):
+            nilai_cepat = hasil.real
+    except Exception:
+        pass
 
-def integral_analitik(fungsi_str, batas_bawah, batas_atas):
+    try:
+        return nilai_antiturunan_simbolik(
+            fungsi,
+            antiturunan,
+            batas_bawah,
+            batas_atas,
+            periksa_singular=not mulus,
+            nilai_cepat=nilai_cepat,
+        )
+    except SymbolicTimeoutError:
+        return None
+
+
+def _latex_batas(batas: float) -> str:
+    # Batas tak hingga ditulis sebagai \infty
+    if math.isinf(batas):
+        return r"\infty" if batas > 0 else r"-\infty"
+    return str(batas)
+
+
+def integral_analitik(
+    fungsi_str, batas_bawah, batas_atas, bulatkan: bool = True, mulus: bool = False
+):
     """
     Menghitung integral secara analitik menggunakan sympy.
 
+    Antiturunan diambil dari cache hasil simbolik sehingga integral dengan batas
+    baru cukup dihitung dari F(batas_atas) - F(batas_bawah).
+
     Args:
         fungsi_str (str): Fungsi sebagai string
         batas_bawah (float): Batas bawah integral
         batas_atas (float): Batas atas integral
+        bulatkan (bool): Jika False, hasil tidak dibulatkan ke 3 desimal
+        mulus (bool): True jika fungsi diketahui tanpa titik singular (lihat
+            `analisis_fungsi`), sehingga pemeriksaan singularitas dilewati
 
     Returns:
         float: Hasil integral analitik yang sudah dievaluasi
@@ -20,24 +97,184 @@ def integral_analitik(fungsi_str, batas_bawah, batas_atas):
 
     Raises:
         ValueError: Jika fungsi tidak bisa diintegrasikan secara analitik
+        SymbolicUnavailableError: Jika komputasi simbolik melebihi batas waktu
     """
     try:
-        hasil_integral = integrate(fungsi_str, (x, batas_bawah, batas_atas))
+        fungsi = to_sympy(fungsi_str)
+        hasil_simbolik = antiturunan_simbolik(fungsi_str)
+        bawah, atas = _latex_batas(batas_bawah), _latex_batas(batas_atas)
+        latex_integral = rf"\int_{{{bawah}}}^{{{atas}}} {hasil_simbolik['latex_fungsi']}dx = \left[ {hasil_simbolik['latex']} \right]_{{{bawah}}}^{{{atas}}}"
 
-        fungsi = parse_expr(fungsi_str)
-        integral_fungsi = integrate(fungsi_str, x)
-        latex_integral = rf"\int_{{{batas_bawah}}}^{{{batas_atas}}} {latex(fungsi)}dx = \left[ {latex(integral_fungsi)} \right]_{{{batas_bawah}}}^{{{batas_atas}}}"
+        hasil_integral = _nilai_antiturunan(
+            fungsi, hasil_simbolik["expr"], batas_bawah, batas_atas, mulus
+        )
+        if hasil_integral is None:
+            hasil_integral = integral_tentu_simbolik(fungsi, batas_bawah, batas_atas)
 
         # Evaluasi hasil ke nilai numerik
         if hasattr(hasil_integral, "evalf"):
-            return round(float(hasil_integral.evalf()), 3), latex_integral
-        return round(float(hasil_integral), 3)
+            hasil_integral = float(hasil_integral.evalf())
+        hasil_integral = float(hasil_integral)
+        if bulatkan:
+            hasil_integral = round(hasil_integral, 3)
+        return hasil_integral, latex_integral
+    except SymbolicUnavailableError:
+        raise
     except Exception as e:
         raise ValueError(f"Gagal menghitung integral analitik: {str(e)}")
 
 
+def integral_analitik_cepat(fungsi_str, batas_bawah, batas_atas, bulatkan: bool = True):
+    """
+    Menghitung nilai acuan integral lewat jalur tercepat yang tetap tepat.
+
+    Jalur dipilih dari `analisis_fungsi`:
+    - _polinomial_: antiturunan tertutup dengan `numpy.polynomial`, tanpa sympy
+    - _referensi-numerik_: untuk komposisi transenden (misal e^{sin x}) sympy
+      jarang menemukan bentuk tertutup dan hanya mengintegrasikan secara numerik
+      dalam ratusan milidetik, sehingga dipakai tanh-sinh presisi tinggi
+    - _simbolik_: `integral_analitik`, tanpa pemeriksaan singularitas jika fungsi mulus
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        batas_bawah (float): Batas bawah integral
+        batas_atas (float): Batas atas integral
+        bulatkan (bool): Jika False, hasil tidak dibulatkan ke 3 desimal
+
+    Returns:
+        float: Nilai integral
+        str: Integral fungsi dalam format LaTeX, atau None untuk referensi numerik
+        str: Jalur yang dipakai: _polinomial_, _referensi-numerik_, atau _simbolik_
+
+    Raises:
+        ValueError: Jika fungsi tidak bisa diintegrasikan secara analitik
+        SymbolicUnavailableError: Jika komputasi simbolik melebihi batas waktu
+    """
+    analisis = analisis_fungsi(fungsi_str)
+    polinomial = polinomial_fungsi(fungsi_str)
+    hingga = math.isfinite(batas_bawah) and math.isfinite(batas_atas)
+    if polinomial is not None and hingga:
+        antiturunan = polinomial.integ()
+        nilai = float(antiturunan(batas_atas) - antiturunan(batas_bawah))
+        latex_integral = rf"\int_{{{batas_bawah}}}^{{{batas_atas}}} {latex_polinomial(polinomial)}dx = \left[ {latex_polinomial(antiturunan)} \right]_{{{batas_bawah}}}^{{{batas_atas}}}"
+        return (round(nilai, 3) if bulatkan else nilai), latex_integral, "polinomial"
+
+    if analisis.komposisi_transenden:
+        nilai = _acuan_tanh_sinh(fungsi_str, batas_bawah, batas_atas)
+        if nilai is not None:
+            return (round(nilai, 3) if bulatkan else nilai), None, "referensi-numerik"
+
+    hasil, latex_integral = integral_analitik(
+        fungsi_str, batas_bawah, batas_atas, bulatkan=bulatkan, mulus=analisis.mulus
+    )
+    return hasil, latex_integral, "simbolik"
+
+
+def _acuan_tanh_sinh(fungsi_str, batas_bawah, batas_atas):
+    # Nilai tanh-sinh dengan error relatif ~1e-12, atau None jika tidak konvergen
+    # (misal singularitas di dalam interval); pemanggil lalu memakai sympy
+    nilai_lama = None
+    try:
+        for _, nilai, jumlah_evaluasi in barisan_tanh_sinh(
+            fungsi_str, batas_bawah, batas_atas
+        ):
+            if not np.isfinite(nilai):
+                return None
+            if nilai_lama is not None and abs(nilai - nilai_lama) <= 1e-12 * max(
+                1.0, abs(nilai)
+            ):
+                return nilai
+            if jumlah_evaluasi > 20000:
+                return None
+            nilai_lama = nilai
+    except ValueError:
+        return None
+
+
+def derajat_kuadratur_eksak(metode: str, N=None, n_titik=None):
+    """
+    Derajat polinomial tertinggi yang diintegrasikan secara eksak oleh suatu metode.
+
+    Args:
+        metode (str): Nama metode integrasi
+        N (int, optional): Jumlah segmen (trapezoida/simpson)
+        n_titik (int, optional): Jumlah titik Gauss per panel
+
+    Returns:
+        int: Derajat eksak, atau None jika metode tidak eksak untuk polinomial
+    """
+    if metode == "trapezoida":
+        return 1
+    if metode == "simpson" and N is not None and N % 2 == 0:
+        return 3
+    if metode == "adaptif":
+        # Tingkat pertama sudah Simpson, dan error-nya nol untuk derajat <= 3
+        return 3
+    if metode == "gauss-legendre" and n_titik is not None:
+        return 2 * n_titik - 1
+    return None
+
+
+def grid_riemann(h: float, batas_bawah: float, batas_atas: float):
+    """
+    Membuat titik-titik sampel Metode Riemann: x_i = batas_bawah + i*h, selama x_i <= batas_atas.
+
+    Jumlah titik dihitung langsung dari panjang interval sehingga tidak terpengaruh
+    akumulasi error floating point seperti pada `x += h`.
+
+    Args:
+        h (float): Ukuran langkah (step size)
+        batas_bawah (float): Batas bawah iterasi
+        batas_atas (float): Batas atas iterasi
+
+    Returns:
+        np.ndarray: Titik-titik sampel
+    """
+    # Toleransi kecil agar titik yang jatuh tepat di batas atas tetap terhitung
+    n_titik = int(np.floor((batas_atas - batas_bawah) / h + 1e-9)) + 1
+    return batas_bawah + h * np.arange(max(n_titik, 0))
+
+
+def bobot_trapezoida(N: int):
+    """
+    Bobot Metode Trapezoida untuk N segmen: [1/2, 1, ..., 1, 1/2].
+
+    Args:
+        N (int): Jumlah segmen
+
+    Returns:
+        np.ndarray: Bobot untuk titik x_0 ... x_N
+    """
+    bobot = np.ones(N + 1)
+    bobot[0] = bobot[-1] = 0.5
+    return bobot
+
+
+def bobot_simpson(N: int):
+    """
+    Bobot Metode Simpson untuk N segmen: [1, 4, 2, 4, ..., 4, 1] / 3.
+
+    Args:
+        N (int): Jumlah segmen
+
+    Returns:
+        np.ndarray: Bobot untuk titik x_0 ... x_N
+    """
+    bobot = np.empty(N + 1)
+    bobot[1:N:2] = 4  # i ganjil
+    bobot[2:N:2] = 2  # i genap
+    bobot[0] = bobot[-1] = 1
+    return bobot / 3
+
+
 def riemann_integral(
-    fungsi_str: str, h: float, batas_bawah: float, batas_atas: float, np_alias=np
+    fungsi_str: str,
+    h: float,
+    batas_bawah: float,
+    batas_atas: float,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
 ):
     """
     Integrasi numerik dengan Metode Riemann
@@ -47,6 +284,8 @@ def riemann_integral(
         h (float): Ukuran langkah (step size)
         batas_bawah (float): Batas bawah iterasi
         batas_atas (float): Batas atas iterasi
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
 
     Returns:
         float: Nilai numerik
@@ -54,31 +293,26 @@ def riemann_integral(
     Raises:
         ValueError: Jika h adalah nol atau evaluasi fungsi gagal
     """
-    print("\n--- Integrasi (Metode Riemann) ---")
-    print(f"f(x) = {fungsi_str}")
     if h == 0:
         raise ValueError("Ukuran langkah (h) tidak boleh nol.")
-    print(f"h = {h}")
-    print(f"batas atas = {batas_atas}")
-    print(f"batas bawah = {batas_bawah}\n")
-
-    x = batas_bawah
-    i = 0
-    sum_iteration = 0
-    while x <= batas_atas:
-        f_i = eval_func(fungsi_str, x, np_alias)
-        print(f"f_{i}({x}) = {f_i}")
-        sum_iteration += f_i
-        i += 1
-        x += h
-    result = h * sum_iteration
-    print(f"Hasil numerik: {round(result, 3)}")
+
+    x = grid_riemann(h, batas_bawah, batas_atas)
+    f_x = eval_func_array(fungsi_str, x, np_alias)
+    if tracer is not None:
+        tracer.catat(x, f_x, h)
+    result = h * jumlah_suku(f_x, akumulator, h)
 
     return round(result, 3)
 
 
 def trapezoida_integral(
-    fungsi_str: str, N: int, batas_bawah: float, batas_atas: float, np_alias=np
+    fungsi_str: str,
+    N: int,
+    batas_bawah: float,
+    batas_atas: float,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
 ):
     """
     Integrasi numerik dengan Metode Trapezoida
@@ -88,6 +322,8 @@ def trapezoida_integral(
         N (int): Jumlah segmen
         batas_bawah (float): Batas bawah iterasi
         batas_atas (float): Batas atas iterasi
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
 
     Returns:
         float: Nilai numerik
@@ -95,43 +331,42 @@ def trapezoida_integral(
     Raises:
         ValueError: Jika h adalah nol atau evaluasi fungsi gagal
     """
-    print("\n--- Integrasi (Metode Trapezoida) ---")
-    print(f"f(x) = {fungsi_str}")
-    print(f"N = {N}")
     h = hitung_h(batas_bawah, batas_atas, N)
     if h == 0:
         raise ValueError("Ukuran langkah (h) tidak boleh nol.")
-    print(f"h = {h}")
-    print(f"batas atas = {batas_atas}")
-    print(f"batas bawah = {batas_bawah}")
-
-    # x_0 = batas bawah
-    x = batas_bawah
-    f_0 = eval_func(fungsi_str, batas_bawah, np_alias)
-    print(f"\nf_0({batas_bawah}) = {f_0}")
-    # x_n = batas atas
-    f_n = eval_func(fungsi_str, batas_atas, np_alias)
-
-    sum_iteration = 0
-    for i in range(1, N):
-        # x_1 = x_0 + h
-        # x_2 = x_1 + h
-        # ...
-        x += h
-        f_i = eval_func(fungsi_str, x)
-        print(f"f_{i}({x}) = {f_i}")
-        sum_iteration += f_i
-
-    print(f"f_{N}({batas_atas}) = {f_n}")
-
-    result = h / 2 * (f_0 + 2 * sum_iteration + f_n)
-    print(f"Hasil numerik: {round(result, 3)}")
+
+    if N + 1 > INTEGRAL_CHUNK_SIZE:
+        result = integral_panel(
+            fungsi_str,
+            N,
+            batas_bawah,
+            batas_atas,
+            metode="trapezoida",
+            np_alias=np_alias,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+        return round(result, 3)
+
+    # x_0 = batas bawah, ..., x_N = batas atas
+    x = np.linspace(batas_bawah, batas_atas, N + 1)
+    f_x = eval_func_array(fungsi_str, x, np_alias)
+    bobot = bobot_trapezoida(N)
+    if tracer is not None:
+        tracer.catat(x, f_x, h * bobot)
+    result = h * jumlah_suku(bobot * f_x, akumulator, h)
 
     return round(result, 3)
 
 
 def simpson_integral(
-    fungsi_str: str, N: int, batas_bawah: float, batas_atas: float, np_alias=np
+    fungsi_str: str,
+    N: int,
+    batas_bawah: float,
+    batas_atas: float,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
 ):
     """
     Integrasi numerik dengan Metode Simpson
@@ -141,6 +376,8 @@ def simpson_integral(
         N (int): Jumlah segmen
         batas_bawah (float): Batas bawah iterasi
         batas_atas (float): Batas atas iterasi
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
 
     Returns:
         float: Nilai numerik
@@ -149,39 +386,631 @@ def simpson_integral(
         ValueError: Jika h adalah nol atau evaluasi fungsi gagal
 
     """
-    print("\n--- Integrasi (Metode Simpson) ---")
-    print(f"f(x) = {fungsi_str}")
-    print(f"N = {N}")
     h = hitung_h(batas_bawah, batas_atas, N)
     if h == 0:
         raise ValueError("Ukuran langkah (h) tidak boleh nol.")
-    print(f"h = {h}")
-    print(f"batas atas = {batas_atas}")
-    print(f"batas bawah = {batas_bawah}")
-
-    # x_0 = batas bawah
-    x = batas_bawah
-    f_0 = eval_func(fungsi_str, batas_bawah, np_alias)
-    print(f"\nf_0({batas_bawah}) = {f_0}")
-    # x_n = batas atas
-    f_n = eval_func(fungsi_str, batas_atas, np_alias)
-
-    sum_iteration = 0
-    for i in range(1, N):
-        # x_1 = x_0 + h
-        # x_2 = x_1 + h
-        # ...
-        x += h
-        f_i = eval_func(fungsi_str, x)
-        print(f"f_{i}({x}) = {f_i}")
-        if i % 2 == 0:  # jika i genap
-            sum_iteration += 2 * f_i
-        else:  # jika i ganjil
-            sum_iteration += 4 * f_i
-
-    print(f"f_{N}({batas_atas}) = {f_n}")
-
-    result = h / 3 * (f_0 + sum_iteration + f_n)
-    print(f"Hasil numerik: {round(result, 3)}")
+
+    if N + 1 > INTEGRAL_CHUNK_SIZE:
+        result = integral_panel(
+            fungsi_str,
+            N,
+            batas_bawah,
+            batas_atas,
+            metode="simpson",
+            np_alias=np_alias,
+            tracer=tracer,
+            akumulator=akumulator,
+        )
+        return round(result, 3)
+
+    # x_0 = batas bawah, ..., x_N = batas atas
+    x = np.linspace(batas_bawah, batas_atas, N + 1)
+    f_x = eval_func_array(fungsi_str, x, np_alias)
+    bobot = bobot_simpson(N)
+    if tracer is not None:
+        tracer.catat(x, f_x, h * bobot)
+    result = h * jumlah_suku(bobot * f_x, akumulator, h)
+
+    return round(result, 3)
+
+
+def _bobot_indeks(metode: str, i, N: int):
+    # Bobot titik x_i (tanpa faktor h) untuk indeks i pada grid N segmen
+    if metode == "trapezoida":
+        bobot = np.ones(i.shape)
+        bobot[(i == 0) | (i == N)] = 0.5
+        return bobot
+    bobot = np.where(i % 2 == 1, 4.0, 2.0)
+    bobot[(i == 0) | (i == N)] = 1.0
+    return bobot / 3
+
+
+def _jumlah_panel(
+    fungsi_str: str,
+    metode: str,
+    N: int,
+    batas_bawah: float,
+    batas_atas: float,
+    i_awal: int,
+    i_akhir: int,
+    np_alias,
+    n_trace: int,
+    mode_akumulasi: str = "berpasangan",
+):
+    # Jumlah berbobot sum w_i f(x_i) untuk i_awal <= i < i_akhir, tanpa faktor h,
+    # beserta batas error pembulatannya
+    i = np.arange(i_awal, i_akhir)
+    x = batas_bawah + hitung_h(batas_bawah, batas_atas, N) * i
+    if i_akhir == N + 1:
+        x[-1] = batas_atas
+    f_x = eval_func_array(fungsi_str, x, np_alias)
+    bobot = _bobot_indeks(metode, i, N)
+    jumlah, batas = jumlahkan(bobot * f_x, mode_akumulasi)
+    trace = (x[:n_trace], f_x[:n_trace], bobot[:n_trace]) if n_trace else None
+    return jumlah, batas, trace
+
+
+def integral_panel(
+    fungsi_str: str,
+    N: int,
+    batas_bawah: float,
+    batas_atas: float,
+    metode: str = "trapezoida",
+    ukuran_chunk: int = INTEGRAL_CHUNK_SIZE,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Integrasi Trapezoida/Simpson untuk N sangat besar dengan membagi grid menjadi panel
+
+    Titik x_0 ... x_N dibagi menjadi panel berisi paling banyak `ukuran_chunk`
+    titik yang dievaluasi paralel di thread pool, sehingga memori puncak sebanding
+    dengan ukuran panel dikali jumlah worker, bukan N. Setiap panel dijumlahkan
+    dengan mode akumulasi yang dipilih (default berpasangan, np.sum) dan jumlah
+    parsial digabung dengan math.fsum.
+    Grid dan bobotnya sama dengan `trapezoida_integral`/`simpson_integral`.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        N (int): Jumlah segmen
+        batas_bawah (float): Batas bawah iterasi
+        batas_atas (float): Batas atas iterasi
+        metode (str): _trapezoida_ atau _simpson_
+        ukuran_chunk (int): Jumlah titik maksimum per panel
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Returns:
+        float: Nilai numerik tanpa pembulatan
+
+    Raises:
+        ValueError: Jika metode tidak dikenal, h adalah nol, atau evaluasi fungsi gagal
+    """
+    if metode not in ["trapezoida", "simpson"]:
+        raise ValueError(f"Metode '{metode}' tidak valid.")
+    h = hitung_h(batas_bawah, batas_atas, N)
+    if h == 0:
+        raise ValueError("Ukuran langkah (h) tidak boleh nol.")
+
+    # Hanya titik-titik awal yang muat di tabel tracer yang dikembalikan worker
+    sisa_trace = 0
+    if tracer is not None:
+        sisa_trace = max(0, tracer.kapasitas - tracer.total_baris)
+    ukuran_chunk = max(1, ukuran_chunk)
+    daftar_kwargs = [
+        dict(
+            fungsi_str=fungsi_str,
+            metode=metode,
+            N=N,
+            batas_bawah=batas_bawah,
+            batas_atas=batas_atas,
+            i_awal=i_awal,
+            i_akhir=min(i_awal + ukuran_chunk, N + 1),
+            np_alias=np_alias,
+            n_trace=min(ukuran_chunk, max(0, sisa_trace - i_awal)),
+            mode_akumulasi="berpasangan" if akumulator is None else akumulator.mode,
+        )
+        for i_awal in range(0, N + 1, ukuran_chunk)
+    ]
+    hasil_panel = map_panel(_jumlah_panel, daftar_kwargs)
+
+    if tracer is not None:
+        for kwargs, (_, _, trace) in zip(daftar_kwargs, hasil_panel):
+            n_titik = kwargs["i_akhir"] - kwargs["i_awal"]
+            if trace is not None:
+                x, f_x, bobot = trace
+                tracer.catat(x, f_x, h * bobot)
+                n_titik -= x.size
+            tracer.lewati(n_titik)
+    total = math.fsum(jumlah for jumlah, _, _ in hasil_panel)
+    if akumulator is not None:
+        # Penggabungan dengan fsum dibulatkan benar: error <= u |total|
+        akumulator.estimasi_error += abs(h) * (
+            sum(batas for _, batas, _ in hasil_panel)
+            + np.finfo(float).eps / 2 * abs(total)
+        )
+    return h * total
+
+
+def adaptif_integral(
+    fungsi_str: str,
+    batas_bawah: float,
+    batas_atas: float,
+    toleransi: float = 1e-6,
+    maks_evaluasi: int = 10000,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Integrasi numerik dengan Metode Simpson Adaptif
+
+    Interval dibagi dua hanya jika estimasi error-nya melebihi toleransi lokal
+    (toleransi ikut dibagi dua pada setiap pembagian). Semua sub-interval pada
+    satu tingkat dievaluasi sekaligus secara tervektorisasi.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        batas_bawah (float): Batas bawah iterasi
+        batas_atas (float): Batas atas iterasi
+        toleransi (float): Target error absolut
+        maks_evaluasi (int): Jumlah maksimum evaluasi fungsi
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Returns:
+        float: Nilai numerik
+        float: Estimasi error absolut
+        int: Jumlah evaluasi fungsi
+
+    Raises:
+        ValueError: Jika toleransi tidak positif atau evaluasi fungsi gagal
+    """
+    if toleransi <= 0:
+        raise ValueError("Toleransi harus lebih besar dari 0.")
+
+    # Tingkat awal: satu interval dengan titik a, m, b
+    x = np.array([batas_bawah, (batas_bawah + batas_atas) / 2, batas_atas])
+    f_x = eval_func_array(fungsi_str, x, np_alias)
+    if tracer is not None:
+        tracer.catat(x, f_x)
+    jumlah_evaluasi = 3
+
+    a, b = x[:1], x[2:]
+    f_a, f_m, f_b = f_x[:1], f_x[1:2], f_x[2:]
+    simpson = (b - a) / 6 * (f_a + 4 * f_m + f_b)
+    tol = np.array([toleransi])
+    # Estimasi error sementara tiap interval (dari interval induknya)
+    error_sementara = np.array([np.inf])
+
+    # Kontribusi interval yang diterima, dijumlahkan sekali di akhir
+    kontribusi = []
+    estimasi_error = 0.0
+    while a.size > 0:
+        # Batasi jumlah evaluasi: interval sisa diterima dengan estimasi saat ini
+        if jumlah_evaluasi + 2 * a.size > maks_evaluasi:
+            kontribusi.append(simpson)
+            estimasi_error += float(np.sum(error_sementara))
+            break
+
+        m = (a + b) / 2
+        x_baru = np.concatenate([(a + m) / 2, (m + b) / 2])
+        f_baru = eval_func_array(fungsi_str, x_baru, np_alias)
+        if tracer is not None:
+            tracer.catat(x_baru, f_baru)
+        jumlah_evaluasi += x_baru.size
+        f_kiri, f_kanan = np.split(f_baru, 2)
+
+        simpson_kiri = (m - a) / 6 * (f_a + 4 * f_kiri + f_m)
+        simpson_kanan = (b - m) / 6 * (f_m + 4 * f_kanan + f_b)
+        selisih = simpson_kiri + simpson_kanan - simpson
+        error = np.abs(selisih) / 15
+
+        # Interval terlalu kecil untuk dibagi lagi juga diterima
+        diterima = (error <= tol) | (m - a <= np.spacing(np.abs(m)) * 4)
+        kontribusi.append((simpson_kiri + simpson_kanan + selisih / 15)[diterima])
+        estimasi_error += float(np.sum(error[diterima]))
+
+        # Interval yang ditolak dibagi dua menjadi [a, m] dan [m, b]
+        ditolak = ~diterima
+        a = np.concatenate([a[ditolak], m[ditolak]])
+        b = np.concatenate([m[ditolak], b[ditolak]])
+        f_a, f_b, f_m = (
+            np.concatenate([f_a[ditolak], f_m[ditolak]]),
+            np.concatenate([f_m[ditolak], f_b[ditolak]]),
+            np.concatenate([f_kiri[ditolak], f_kanan[ditolak]]),
+        )
+        simpson = np.concatenate([simpson_kiri[ditolak], simpson_kanan[ditolak]])
+        tol = np.concatenate([tol[ditolak], tol[ditolak]]) / 2
+        error_sementara = np.concatenate([error[ditolak], error[ditolak]]) / 2
+
+    result = jumlah_suku(np.concatenate(kontribusi), akumulator)
+    return round(result, 3), estimasi_error, jumlah_evaluasi
+
+
+def barisan_trapezoida(
+    fungsi_str: str,
+    batas_bawah: float,
+    batas_atas: float,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Generator hasil Metode Trapezoida dengan N = 1, 2, 4, 8, ...
+
+    Setiap langkah memakai ulang semua evaluasi sebelumnya; hanya titik tengah
+    yang baru yang dievaluasi: T(2N) = T(N)/2 + h_baru * sum f(titik tengah).
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        batas_bawah (float): Batas bawah iterasi
+        batas_atas (float): Batas atas iterasi
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Yields:
+        tuple: (N, nilai trapezoida tanpa pembulatan, jumlah evaluasi kumulatif)
+    """
+    x = np.array([batas_bawah, batas_atas], dtype=float)
+    f_x = eval_func_array(fungsi_str, x, np_alias)
+    if tracer is not None:
+        tracer.catat(x, f_x)
+    N = 1
+    h = batas_atas - batas_bawah
+    nilai = h / 2 * float(f_x[0] + f_x[1])
+    jumlah_evaluasi = 2
+    yield N, nilai, jumlah_evaluasi
+
+    while True:
+        # Titik tengah baru: x_0 + h/2, x_0 + 3h/2, ...
+        x_baru = batas_bawah + h * (np.arange(N) + 0.5)
+        f_baru = eval_func_array(fungsi_str, x_baru, np_alias)
+        if tracer is not None:
+            tracer.catat(x_baru, f_baru)
+        jumlah_evaluasi += N
+        nilai = nilai / 2 + h / 2 * jumlah_suku(f_baru, akumulator, h / 2)
+        N *= 2
+        h /= 2
+        yield N, nilai, jumlah_evaluasi
+
+
+def barisan_romberg(
+    fungsi_str: str,
+    batas_bawah: float,
+    batas_atas: float,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Generator baris-baris tabel Romberg untuk N = 1, 2, 4, 8, ...
+
+    Baris ke-k berisi T(2^k) (trapezoida), R[k][1] (sama dengan Simpson N = 2^k),
+    hingga R[k][k], dengan
+    R[k][j] = R[k][j-1] + (R[k][j-1] - R[k-1][j-1]) / (4^j - 1).
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        batas_bawah (float): Batas bawah iterasi
+        batas_atas (float): Batas atas iterasi
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Yields:
+        tuple: (N, baris tabel Romberg tanpa pembulatan, jumlah evaluasi kumulatif)
+    """
+    baris_lama = []
+    barisan = barisan_trapezoida(
+        fungsi_str,
+        batas_bawah,
+        batas_atas,
+        np_alias=np_alias,
+        tracer=tracer,
+        akumulator=akumulator,
+    )
+    for k, (N, nilai_trapezoida, jumlah_evaluasi) in enumerate(barisan):
+        baris = [nilai_trapezoida]
+        for j in range(1, k + 1):
+            baris.append(baris[j - 1] + (baris[j - 1] - baris_lama[j - 1]) / (4**j - 1))
+        yield N, baris, jumlah_evaluasi
+        baris_lama = baris
+
+
+def romberg_integral(
+    fungsi_str: str,
+    batas_bawah: float,
+    batas_atas: float,
+    toleransi: float = 1e-6,
+    maks_level: int = 20,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Integrasi numerik dengan Metode Romberg
+
+    Barisan trapezoida (N digandakan tiap level, evaluasi lama dipakai ulang)
+    diekstrapolasi dengan ekstrapolasi Richardson, lihat `barisan_romberg`.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        batas_bawah (float): Batas bawah iterasi
+        batas_atas (float): Batas atas iterasi
+        toleransi (float): Berhenti jika |R[k][k] - R[k-1][k-1]| <= toleransi
+        maks_level (int): Jumlah level maksimum (N terbesar = 2^maks_level)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Returns:
+        float: Nilai numerik
+        list[list[float]]: Tabel Romberg (segitiga bawah)
+        float: Estimasi error |R[k][k] - R[k-1][k-1]|
+        int: Jumlah evaluasi fungsi
+
+    Raises:
+        ValueError: Jika toleransi tidak positif atau evaluasi fungsi gagal
+    """
+    if toleransi <= 0:
+        raise ValueError("Toleransi harus lebih besar dari 0.")
+
+    tabel = []
+    estimasi_error = float("inf")
+    barisan = barisan_romberg(
+        fungsi_str,
+        batas_bawah,
+        batas_atas,
+        np_alias=np_alias,
+        tracer=tracer,
+        akumulator=akumulator,
+    )
+    for k, (_, baris, jumlah_evaluasi) in enumerate(barisan):
+        tabel.append(baris)
+        if k > 0:
+            estimasi_error = abs(baris[k] - tabel[k - 1][k - 1])
+            if estimasi_error <= toleransi or k >= maks_level:
+                break
+
+    return round(tabel[-1][-1], 3), tabel, estimasi_error, jumlah_evaluasi
+
+
+def _simpul_tanh_sinh(h: float, ganjil: bool):
+    # Simpul tanh-sinh u = tanh(pi/2 sinh t) pada t = j*h (j ganjil saja jika
+    # `ganjil`), beserta jarak ke -1 dan +1 yang dihitung tanpa pembatalan
+    # (1 - tanh(v) = 2 / (exp(2v) + 1)) dan bobot du/dt
+    j_maks = int(math.ceil(_T_MAKS_TANH_SINH / h))
+    j = np.arange(1 if ganjil else 0, j_maks + 1, 2 if ganjil else 1)
+    t = j * h
+    v = np.pi / 2 * np.sinh(t)
+    with np.errstate(over="ignore"):
+        jarak = 2 / (np.exp(2 * v) + 1)
+        bobot = np.pi / 2 * np.cosh(t) / np.cosh(v) ** 2
+    # Sisi t > 0 dan cerminannya t < 0 (t = 0 hanya sekali)
+    cermin = j > 0
+    jarak_kiri = np.concatenate([2 - jarak, jarak[cermin]])
+    jarak_kanan = np.concatenate([jarak, 2 - jarak[cermin]])
+    bobot = np.concatenate([bobot, bobot[cermin]])
+    return jarak_kiri, jarak_kanan, bobot
+
+
+def _peta_tanh_sinh(batas_bawah: float, batas_atas: float, jarak_kiri, jarak_kanan):
+    # Memetakan simpul u di (-1, 1) ke x beserta dx/du. Interval tak hingga
+    # memakai x = a + t/(1-t), x = b - t/(1-t), atau x = t/(1-t^2), ditulis
+    # dalam jarak ke ujung agar titik dekat ujung tetap akurat
+    bawah_hingga, atas_hingga = np.isfinite(batas_bawah), np.isfinite(batas_atas)
+    with np.errstate(divide="ignore", over="ignore"):
+        if bawah_hingga and atas_hingga:
+            setengah = (batas_atas - batas_bawah) / 2
+            x = np.where(
+                jarak_kiri <= jarak_kanan,
+                batas_bawah + setengah * jarak_kiri,
+                batas_atas - setengah * jarak_kanan,
+            )
+            turunan = np.full(x.shape, setengah)
+            # Ujung hingga: simpul yang terbulatkan tepat ke ujung dibuang
+            valid = (x > batas_bawah) & (x < batas_atas)
+        elif bawah_hingga:
+            x = batas_bawah + jarak_kiri / jarak_kanan
+            turunan = 2 / jarak_kanan**2
+            valid = (x > batas_bawah) & (jarak_kanan >= _JARAK_MIN_TAK_HINGGA)
+        elif atas_hingga:
+            x = batas_atas - jarak_kanan / jarak_kiri
+            turunan = 2 / jarak_kiri**2
+            valid = (x < batas_atas) & (jarak_kiri >= _JARAK_MIN_TAK_HINGGA)
+        else:
+            u = jarak_kiri - 1
+            hasil_kali = jarak_kiri * jarak_kanan
+            x = u / hasil_kali
+            turunan = (1 + u**2) / hasil_kali**2
+            valid = np.minimum(jarak_kiri, jarak_kanan) >= _JARAK_MIN_TAK_HINGGA
+    return x[valid], turunan[valid], valid
+
+
+def barisan_tanh_sinh(
+    fungsi_str: str,
+    batas_bawah: float,
+    batas_atas: float,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Generator hasil kuadratur tanh-sinh (double exponential) dengan h = 1, 1/2, 1/4, ...
+
+    Substitusi x = tanh(pi/2 sinh t) membuat integran meluruh secara double
+    exponential di kedua ujung, sehingga singularitas di ujung interval (misal
+    1/sqrt(x) pada [0, 1]) tidak pernah dievaluasi dan aturan trapezoida pada t
+    konvergen sangat cepat. Batas tak hingga dipetakan ke interval hingga dengan
+    x = a + t/(1-t), x = b - t/(1-t), atau x = t/(1-t^2) sebelum substitusi.
+    Setiap penghalusan h hanya mengevaluasi simpul baru (j ganjil).
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        batas_bawah (float): Batas bawah iterasi (boleh -inf)
+        batas_atas (float): Batas atas iterasi (boleh inf)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Yields:
+        tuple: (h, nilai tanpa pembulatan, jumlah evaluasi kumulatif)
+
+    Raises:
+        ValueError: Jika batas bukan bilangan atau evaluasi fungsi gagal
+    """
+    if np.isnan(batas_bawah) or np.isnan(batas_atas):
+        raise ValueError("Batas integral harus berupa bilangan.")
+
+    h = 1.0
+    jumlah = 0.0
+    jumlah_evaluasi = 0
+    ganjil = False
+    while True:
+        jarak_kiri, jarak_kanan, bobot_t = _simpul_tanh_sinh(h, ganjil)
+        x, turunan, valid = _peta_tanh_sinh(
+            batas_bawah, batas_atas, jarak_kiri, jarak_kanan
+        )
+        bobot = bobot_t[valid] * turunan
+        f_x = eval_func_array(fungsi_str, x, np_alias)
+        if tracer is not None:
+            tracer.catat(x, f_x, h * bobot)
+        jumlah_evaluasi += x.size
+        # Sum pada h baru = sum lama (simpul genap) + simpul ganjil baru
+        jumlah += jumlah_suku(bobot * f_x, akumulator, h)
+        yield h, h * jumlah, jumlah_evaluasi
+        h /= 2
+        ganjil = True
+
+
+def tanh_sinh_integral(
+    fungsi_str: str,
+    batas_bawah: float,
+    batas_atas: float,
+    toleransi: float = 1e-6,
+    maks_evaluasi: int = 10000,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Integrasi numerik dengan Kuadratur Tanh-Sinh, lihat `barisan_tanh_sinh`
+
+    Cocok untuk integran dengan singularitas di ujung interval dan untuk interval
+    tak hingga. Ukuran langkah dibagi dua hingga selisih dua hasil berurutan
+    <= toleransi atau penghalusan berikutnya melebihi `maks_evaluasi`.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        batas_bawah (float): Batas bawah iterasi (boleh -inf)
+        batas_atas (float): Batas atas iterasi (boleh inf)
+        toleransi (float): Target error absolut
+        maks_evaluasi (int): Jumlah maksimum evaluasi fungsi
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Returns:
+        float: Nilai numerik
+        float: Estimasi error |I(h) - I(2h)|
+        int: Jumlah evaluasi fungsi
+
+    Raises:
+        ValueError: Jika toleransi tidak positif, hasil tidak hingga, atau evaluasi fungsi gagal
+    """
+    if toleransi <= 0:
+        raise ValueError("Toleransi harus lebih besar dari 0.")
+
+    nilai_lama = None
+    estimasi_error = float("inf")
+    barisan = barisan_tanh_sinh(
+        fungsi_str,
+        batas_bawah,
+        batas_atas,
+        np_alias=np_alias,
+        tracer=tracer,
+        akumulator=akumulator,
+    )
+    for _, nilai, jumlah_evaluasi in barisan:
+        if nilai_lama is not None:
+            estimasi_error = abs(nilai - nilai_lama)
+            # Penghalusan berikutnya menggandakan jumlah simpul
+            if estimasi_error <= toleransi or 2 * jumlah_evaluasi > maks_evaluasi:
+                break
+        nilai_lama = nilai
+
+    if not np.isfinite(nilai):
+        raise ValueError("Hasil integral tidak hingga; integral kemungkinan divergen.")
+    return round(nilai, 3), estimasi_error, jumlah_evaluasi
+
+
+def tabel_gauss_legendre(n: int):
+    """
+    Mengambil titik dan bobot Gauss-Legendre n titik pada interval [-1, 1].
+
+    Tabel dihitung sekali per n dengan `numpy.polynomial.legendre.leggauss`
+    lalu disimpan di cache.
+
+    Args:
+        n (int): Jumlah titik
+
+    Returns:
+        tuple: (titik, bobot) sebagai array numpy read-only
+    """
+    tabel = _gauss_legendre_cache.get(n)
+    if tabel is None:
+        titik, bobot = np.polynomial.legendre.leggauss(n)
+        titik.flags.writeable = False
+        bobot.flags.writeable = False
+        tabel = (titik, bobot)
+        _gauss_legendre_cache.set(n, tabel)
+    return tabel
+
+
+def gauss_legendre_integral(
+    fungsi_str: str,
+    n: int,
+    batas_bawah: float,
+    batas_atas: float,
+    panel: int = 1,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Integrasi numerik dengan Kuadratur Gauss-Legendre
+
+    Interval dibagi menjadi `panel` sub-interval sama lebar, dan pada tiap
+    sub-interval dipakai aturan Gauss-Legendre n titik. Aturan ini eksak untuk
+    polinomial berderajat hingga 2n - 1.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        n (int): Jumlah titik per panel
+        batas_bawah (float): Batas bawah iterasi
+        batas_atas (float): Batas atas iterasi
+        panel (int): Jumlah panel (mode komposit jika lebih dari 1)
+        tracer (Tracer, optional): Pencatat tabel iterasi, jika tracing diaktifkan
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Returns:
+        float: Nilai numerik
+
+    Raises:
+        ValueError: Jika n atau panel kurang dari 1, atau evaluasi fungsi gagal
+    """
+    if n < 1 or panel < 1:
+        raise ValueError("Jumlah titik (n) dan jumlah panel harus lebih besar dari 0.")
+
+    titik, bobot = tabel_gauss_legendre(n)
+    tepi = np.linspace(batas_bawah, batas_atas, panel + 1)
+    setengah_lebar = (batas_atas - batas_bawah) / (2 * panel)
+    tengah = (tepi[:-1] + tepi[1:]) / 2
+
+    # Titik pada semua panel: baris = panel, kolom = titik Gauss
+    x = (tengah[:, None] + setengah_lebar * titik[None, :]).ravel()
+    f_x = eval_func_array(fungsi_str, x, np_alias)
+    bobot_total = setengah_lebar * np.tile(bobot, panel)
+    if tracer is not None:
+        tracer.catat(x, f_x, bobot_total)
+    result = jumlah_suku(bobot_total * f_x, akumulator)
 
     return round(result, 3)
@@ -0,0 +1,316 @@
+import functools
+import math
+
+import numpy as np
+
+from config import INTEGRAL_CHUNK_SIZE, QMC_BATCH_SIZE
+from services.integral_module import (
+    bobot_simpson,
+    bobot_trapezoida,
+    tabel_gauss_legendre,
+)
+from services.penjumlahan import jumlah_suku
+from services.utils import eval_func_grid
+
+# Variabel integral lipat sesuai urutan batas: x, lalu y, lalu z
+VARIABEL_MULTI = ("x", "y", "z")
+
+# Metode produk tensor (grid) dan quasi-Monte Carlo
+METODE_GRID = ["trapezoida", "simpson", "gauss-legendre"]
+METODE_QMC = ["sobol", "halton"]
+
+# Parameter bilangan arah Sobol (Joe & Kuo) untuk dimensi 2 dan 3:
+# (derajat polinomial s, koefisien a, nilai awal m_1 ... m_s)
+_PARAMETER_SOBOL = [(1, 0, [1]), (2, 1, [1, 3])]
+_BIT_SOBOL = 32
+
+# Basis Halton: bilangan prima pertama, satu per dimensi
+_BASIS_HALTON = [2, 3, 5]
+
+
+def titik_bobot_sumbu(metode: str, n: int, batas_bawah: float, batas_atas: float):
+    """
+    Titik dan bobot kuadratur satu dimensi untuk satu sumbu grid produk tensor.
+
+    Args:
+        metode (str): _trapezoida_, _simpson_, atau _gauss-legendre_
+        n (int): Jumlah segmen (trapezoida/simpson) atau jumlah titik Gauss
+        batas_bawah (float): Batas bawah sumbu
+        batas_atas (float): Batas atas sumbu
+
+    Returns:
+        tuple: (titik, bobot) sebagai array numpy, bobot sudah dikali lebar langkah
+
+    Raises:
+        ValueError: Jika metode tidak dikenal, n kurang dari 1, atau n ganjil
+            untuk Metode Simpson
+    """
+    if n < 1:
+        raise ValueError("Jumlah segmen/titik per sumbu harus lebih besar dari 0.")
+    if metode == "simpson" and n % 2 != 0:
+        # Bobot [1, 4, 2, ..., 4, 1] / 3 hanya benar untuk jumlah segmen genap
+        raise ValueError("Metode Simpson memerlukan jumlah segmen per sumbu genap.")
+    if metode == "gauss-legendre":
+        titik, bobot = tabel_gauss_legendre(n)
+        setengah_lebar = (batas_atas - batas_bawah) / 2
+        tengah = (batas_bawah + batas_atas) / 2
+        return tengah + setengah_lebar * titik, setengah_lebar * bobot
+    if metode not in ["trapezoida", "simpson"]:
+        raise ValueError(
+            f"Metode '{metode}' tidak valid. Gunakan 'trapezoida', 'simpson', atau 'gauss-legendre'."
+        )
+    h = (batas_atas - batas_bawah) / n
+    bobot = bobot_trapezoida(n) if metode == "trapezoida" else bobot_simpson(n)
+    return np.linspace(batas_bawah, batas_atas, n + 1), h * bobot
+
+
+def integral_grid(
+    fungsi_str: str,
+    batas,
+    metode: str,
+    n: int,
+    np_alias=np,
+    tracer=None,
+    akumulator=None,
+):
+    """
+    Integral lipat pada domain persegi dengan aturan produk tensor.
+
+    Aturan satu dimensi (lihat `titik_bobot_sumbu`) dipakai pada setiap sumbu:
+    integral = sum_ijk w_i w_j w_k f(x_i, y_j, z_k). Grid dibentuk dengan
+    `np.meshgrid(sparse=True)` dan dievaluasi per lapisan sumbu x berisi paling
+    banyak `INTEGRAL_CHUNK_SIZE` titik, sehingga memori puncak tidak sebanding
+    dengan (n+1)^d.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string dalam variabel x, y, z
+        batas (list[tuple]): Pasangan (batas bawah, batas atas) untuk x, y, z
+        metode (str): _trapezoida_, _simpson_, atau _gauss-legendre_
+        n (int): Jumlah segmen (atau titik Gauss) per sumbu
+        tracer (Tracer, optional): Hanya menghitung jumlah evaluasi; titik grid
+            tidak dicatat karena tabel iterasi hanya memiliki kolom x
+        akumulator (Akumulator, optional): Mode akumulasi dan pencatat error pembulatan
+
+    Returns:
+        float: Nilai numerik
+
+    Raises:
+        ValueError: Jika metode tidak dikenal atau evaluasi fungsi gagal
+    """
+    variabel = VARIABEL_MULTI[: len(batas)]
+    sumbu = [titik_bobot_sumbu(metode, n, a, b) for a, b in batas]
+    titik_lain = [titik for titik, _ in sumbu[1:]]
+    bobot_lain = functools.reduce(np.multiply.outer, [b for _, b in sumbu[1:]], 1.0)
+    baris_per_lapisan = max(1, INTEGRAL_CHUNK_SIZE // max(np.size(bobot_lain), 1))
+
+    titik_x, bobot_x = sumbu[0]
+    jumlah_lapisan = []
+    for awal in range(0, titik_x.size, baris_per_lapisan):
+        akhir = awal + baris_per_lapisan
+        koordinat = np.meshgrid(
+            titik_x[awal:akhir], *titik_lain, indexing="ij", sparse=True
+        )
+        f_grid = eval_func_grid(fungsi_str, koordinat, np_alias, variabel)
+        bobot = np.multiply.outer(bobot_x[awal:akhir], bobot_lain)
+        if tracer is not None:
+            tracer.lewati(f_grid.size)
+        jumlah_lapisan.append(jumlah_suku(bobot * f_grid, akumulator))
+    return round(math.fsum(jumlah_lapisan), 3)
+
+
+def _bilangan_arah_sobol(dimensi: int):
+    # v[j, k] = m_k * 2^(BIT - k) untuk dimensi j dan bit ke-k (k mulai dari 1)
+    arah = np.zeros((dimensi, _BIT_SOBOL), dtype=np.uint64)
+    arah[0] = [1 << (_BIT_SOBOL - 1 - k) for k in range(_BIT_SOBOL)]
+    for j, (s, a, m_awal) in enumerate(_PARAMETER_SOBOL[: dimensi - 1], start=1):
+        m = list(m_awal)
+        for k in range(s, _BIT_SOBOL):
+            # m_k = 2 a_1 m_{k-1} ^ 4 a_2 m_{k-2} ^ ... ^ 2^s m_{k-s} ^ m_{k-s}
+            baru = m[k - s] ^ (m[k - s] << s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    baru ^= m[k - i] << i
+            m.append(baru)
+        arah[j] = [m[k] << (_BIT_SOBOL - 1 - k) for k in range(_BIT_SOBOL)]
+    return arah
+
+
+def barisan_sobol(indeks, dimensi: int):
+    """
+    Titik ke-i barisan Sobol (tanpa scrambling) di [0, 1)^d untuk d <= 3.
+
+    Setiap titik dihitung langsung dari indeksnya (XOR bilangan arah untuk setiap
+    bit i yang bernilai 1), sehingga batch titik dapat dibentuk tanpa
+    membangkitkan titik-titik sebelumnya.
+
+    Args:
+        indeks (array-like): Indeks titik (bilangan bulat tak negatif)
+        dimensi (int): Jumlah dimensi (1 sampai 3)
+
+    Returns:
+        np.ndarray: Titik dengan bentuk (len(indeks), dimensi)
+    """
+    indeks = np.asarray(indeks, dtype=np.uint64)
+    arah = _bilangan_arah_sobol(dimensi)
+    hasil = np.zeros((indeks.size, dimensi), dtype=np.uint64)
+    for k in range(_BIT_SOBOL):
+        bit = (indeks >> np.uint64(k)) & np.uint64(1)
+        hasil ^= bit[:, None] * arah[None, :, k]
+    return hasil / float(1 << _BIT_SOBOL)
+
+
+def barisan_halton(indeks, dimensi: int):
+    """
+    Titik ke-i barisan Halton di [0, 1)^d: invers radikal i dalam basis 2, 3, 5.
+
+    Args:
+        indeks (array-like): Indeks titik (bilangan bulat tak negatif)
+        dimensi (int): Jumlah dimensi (1 sampai 3)
+
+    Returns:
+        np.ndarray: Titik dengan bentuk (len(indeks), dimensi)
+    """
+    indeks = np.asarray(indeks, dtype=np.int64)
+    hasil = np.zeros((indeks.size, dimensi))
+    for j, basis in enumerate(_BASIS_HALTON[:dimensi]):
+        sisa, faktor = indeks.copy(), 1.0 / basis
+        while np.any(sisa > 0):
+            hasil[:, j] += faktor * (sisa % basis)
+            sisa //= basis
+            faktor /= basis
+    return hasil
+
+
+def barisan_qmc(
+    fungsi_str: str,
+    batas,
+    metode: str = "sobol",
+    ukuran_batch: int = QMC_BATCH_SIZE,
+    replika: int = 8,
+    seed: int = 0,
+    np_alias=np,
+    tracer=None,
+):
+    """
+    Generator estimasi integral lipat quasi-Monte Carlo yang diperbarui per batch.
+
+    Titik barisan Sobol/Halton digeser acak (rotasi Cranley-Patterson) dengan
+    `replika` pergeseran berbeda. Setiap replika menghasilkan estimasi tak bias,
+    sehingga simpangan baku rata-ratanya menjadi estimasi error yang dapat
+    diperbarui setelah setiap batch. Setiap batch mengevaluasi `ukuran_batch`
+    titik sekaligus, sehingga memori tidak bergantung pada jumlah sampel total.
+    Pergeseran dibangkitkan dari `seed` sehingga hasilnya deterministik.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string dalam variabel x, y, z
+        batas (list[tuple]): Pasangan (batas bawah, batas atas) untuk x, y, z
+        metode (str): _sobol_ atau _halton_
+        ukuran_batch (int): Jumlah evaluasi fungsi per batch (semua replika)
+        replika (int): Jumlah pergeseran acak, minimal 2
+        seed (int): Seed pembangkit pergeseran acak
+        tracer (Tracer, optional): Hanya menghitung jumlah evaluasi
+
+    Yields:
+        tuple: (jumlah evaluasi kumulatif, estimasi integral, estimasi error)
+
+    Raises:
+        ValueError: Jika metode tidak dikenal, replika kurang dari 2, atau evaluasi fungsi gagal
+    """
+    if metode not in METODE_QMC:
+        raise ValueError(
+            f"Metode '{metode}' tidak valid. Gunakan 'sobol' atau 'halton'."
+        )
+    if replika < 2:
+        raise ValueError("Jumlah replika harus minimal 2 untuk estimasi error.")
+
+    dimensi = len(batas)
+    variabel = VARIABEL_MULTI[:dimensi]
+    bawah = np.array([a for a, _ in batas], dtype=float)
+    lebar = np.array([b - a for a, b in batas], dtype=float)
+    volume = float(np.prod(lebar))
+    geser = np.random.default_rng(seed).random((replika, 1, dimensi))
+    pembangkit = barisan_sobol if metode == "sobol" else barisan_halton
+
+    titik_per_replika = max(1, ukuran_batch // replika)
+    jumlah = np.zeros(replika)
+    n = 0
+    while True:
+        indeks = np.arange(n, n + titik_per_replika)
+        # Bentuk (replika, titik, dimensi): titik yang sama, digeser per replika
+        u = (pembangkit(indeks, dimensi)[None, :, :] + geser) % 1.0
+        titik = bawah + lebar * u
+        f_titik = eval_func_grid(
+            fungsi_str,
+            [titik[..., j] for j in range(dimensi)],
+            np_alias,
+            variabel,
+        )
+        if tracer is not None:
+            tracer.lewati(f_titik.size)
+        jumlah += np.sum(f_titik, axis=1)
+        n += titik_per_replika
+
+        estimasi_replika = volume * jumlah / n
+        nilai = float(np.mean(estimasi_replika))
+        estimasi_error = float(np.std(estimasi_replika, ddof=1) / math.sqrt(replika))
+        yield n * replika, nilai, estimasi_error
+
+
+def qmc_integral(
+    fungsi_str: str,
+    batas,
+    metode: str = "sobol",
+    n_sampel: int = 65536,
+    toleransi=None,
+    ukuran_batch: int = QMC_BATCH_SIZE,
+    replika: int = 8,
+    seed: int = 0,
+    np_alias=np,
+    tracer=None,
+):
+    """
+    Integral lipat dengan quasi-Monte Carlo teracak (Sobol atau Halton).
+
+    Lihat `barisan_qmc`. Iterasi berhenti setelah sekitar `n_sampel` evaluasi,
+    atau lebih awal jika estimasi error sudah <= `toleransi`.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string dalam variabel x, y, z
+        batas (list[tuple]): Pasangan (batas bawah, batas atas) untuk x, y, z
+        metode (str): _sobol_ atau _halton_
+        n_sampel (int): Jumlah evaluasi fungsi maksimum
+        toleransi (float, optional): Target estimasi error
+        ukuran_batch (int): Jumlah evaluasi fungsi per batch
+        replika (int): Jumlah pergeseran acak
+        seed (int): Seed pembangkit pergeseran acak
+        tracer (Tracer, optional): Hanya menghitung jumlah evaluasi
+
+    Returns:
+        float: Nilai numerik
+        float: Estimasi error (simpangan baku rata-rata replika)
+        list[tuple]: Riwayat (jumlah evaluasi, estimasi, estimasi error) per batch
+
+    Raises:
+        ValueError: Jika parameter tidak valid atau evaluasi fungsi gagal
+    """
+    # Sampel dibagi rata ke batch berukuran paling banyak `ukuran_batch`
+    jumlah_batch = math.ceil(n_sampel / max(ukuran_batch, 1))
+    ukuran_batch = max(replika, n_sampel // jumlah_batch)
+    riwayat = []
+    barisan = barisan_qmc(
+        fungsi_str,
+        batas,
+        metode=metode,
+        ukuran_batch=ukuran_batch,
+        replika=replika,
+        seed=seed,
+        np_alias=np_alias,
+        tracer=tracer,
+    )
+    for jumlah_evaluasi, nilai, estimasi_error in barisan:
+        riwayat.append((jumlah_evaluasi, nilai, estimasi_error))
+        if toleransi is not None and estimasi_error <= toleransi:
+            break
+        if jumlah_evaluasi + ukuran_batch > n_sampel:
+            break
+    return round(nilai, 3), estimasi_error, riwayat
@@ -0,0 +1,215 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from config import SERVER_TIMING_HEADER
+
+
+class Histogram:
+    """
+    Histogram kumulatif sederhana dengan label, diekspor dalam format teks Prometheus.
+
+    Args:
+        nama (str): Nama metrik Prometheus
+        deskripsi (str): Teks HELP metrik
+        label (tuple[str]): Nama-nama label
+        bucket (tuple[float]): Batas atas bucket (urut naik, tanpa +Inf)
+    """
+
+    def __init__(self, nama: str, deskripsi: str, label, bucket):
+        self.nama = nama
+        self.deskripsi = deskripsi
+        self.label = tuple(label)
+        self.bucket = tuple(bucket)
+        self._lock = threading.Lock()
+        # kunci: tuple nilai label -> [jumlah per bucket (+Inf terakhir), total, count]
+        self._data = {}
+
+    def observe(self, nilai: float, **label):
+        """
+        Mencatat satu pengamatan.
+
+        Args:
+            nilai (float): Nilai yang diamati
+            **label: Nilai untuk setiap label histogram
+        """
+        kunci = tuple(str(label[nama]) for nama in self.label)
+        indeks = bisect_left(self.bucket, nilai)
+        with self._lock:
+            data = self._data.get(kunci)
+            if data is None:
+                data = self._data[kunci] = [[0] * (len(self.bucket) + 1), 0.0, 0]
+            data[0][indeks] += 1
+            data[1] += nilai
+            data[2] += 1
+
+    def render(self) -> str:
+        """
+        Menghasilkan teks format eksposisi Prometheus untuk histogram ini.
+
+        Returns:
+            str: Baris-baris HELP, TYPE, _bucket, _sum, dan _count
+        """
+        baris = [
+            f"# HELP {self.nama} {self.deskripsi}",
+            f"# TYPE {self.nama} histogram",
+        ]
+        with self._lock:
+            salinan = {k: (list(v[0]), v[1], v[2]) for k, v in self._data.items()}
+        for kunci, (per_bucket, total, jumlah) in sorted(salinan.items()):
+            label = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(self.label, kunci))
+            kumulatif = 0
+            for batas, isi in zip(self.bucket + (float("inf"),), per_bucket):
+                kumulatif += isi
+                le = "+Inf" if batas == float("inf") else f"{batas:g}"
+                baris.append(f'{self.nama}_bucket{{{label},le="{le}"}} {kumulatif}')
+            baris.append(f"{self.nama}_sum{{{label}}} {total!r}")
+            baris.append(f"{self.nama}_count{{{label}}} {jumlah}")
+        return "\n".join(baris)
+
+
+def _escape(nilai: str) -> str:
+    return nilai.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_gauge(nama: str, deskripsi: str, nilai: dict, jenis: str = "gauge") -> str:
+    """
+    Menghasilkan teks format Prometheus untuk metrik gauge/counter bernilai tunggal per label.
+
+    Args:
+        nama (str): Nama metrik Prometheus
+        deskripsi (str): Teks HELP metrik
+        nilai (dict): Pemetaan label -> nilai, dengan label berupa tuple pasangan
+            (nama_label, nilai_label), misal {(("cache", "parse_latex"),): 10}
+        jenis (str): _gauge_ atau _counter_
+
+    Returns:
+        str: Baris-baris HELP, TYPE, dan nilai
+    """
+    baris = [f"# HELP {nama} {deskripsi}", f"# TYPE {nama} {jenis}"]
+    for label, isi in nilai.items():
+        teks_label = ",".join(f'{n}="{_escape(str(v))}"' for n, v in label)
+        baris.append(f"{nama}{{{teks_label}}} {isi}" if label else f"{nama} {isi}")
+    return "\n".join(baris)
+
+
+# Durasi setiap tahap pemrosesan permintaan (detik)
+DURASI_TAHAP = Histogram(
+    "metode_numerik_tahap_detik",
+    "Durasi tahap pemrosesan permintaan dalam detik.",
+    ("endpoint", "metode", "tahap", "cache"),
+    (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+)
+
+# Jumlah evaluasi fungsi f(x) per permintaan
+EVALUASI_FUNGSI = Histogram(
+    "metode_numerik_evaluasi_fungsi",
+    "Jumlah evaluasi fungsi per permintaan.",
+    ("endpoint", "metode"),
+    (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+
+
+class PengukurTahap:
+    """
+    Pengukur durasi tahap (parse, compile, numerik, analitik, error, serialisasi)
+    dalam satu permintaan.
+
+    Hasil pengukuran dapat dikirim sebagai header `Server-Timing` dan dicatat
+    ke histogram Prometheus setelah permintaan berhasil. `sementara` diset True
+    jika hasil analitik tidak tersedia sementara (misal worker simbolik sibuk
+    atau melebihi batas waktu), sehingga respons tidak boleh di-cache.
+    """
+
+    def __init__(self):
+        self.durasi = {}
+        self.cache = {}
+        self.sementara = False
+
+    @contextmanager
+    def tahap(self, nama: str, cache=None):
+        """
+        Mengukur durasi blok `with` sebagai tahap `nama`.
+
+        Args:
+            nama (str): Nama tahap
+            cache (bool, optional): True jika tahap ini cache hit, False jika miss,
+                None jika tahap tidak memakai cache
+        """
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durasi[nama] = self.durasi.get(nama, 0.0) + (
+                time.perf_counter() - mulai
+            )
+            if cache is not None:
+                self.cache[nama] = "hit" if cache else "miss"
+
+    def server_timing(self) -> str:
+        """
+        Menghasilkan nilai header `Server-Timing`, misal `parse;dur=0.120, numerik;dur=3.400`.
+
+        Returns:
+            str: Nilai header (durasi dalam milidetik)
+        """
+        return ", ".join(
+            f"{nama};dur={detik * 1000:.3f}" for nama, detik in self.durasi.items()
+        )
+
+    def catat(self, endpoint: str, metode: str, jumlah_evaluasi=None):
+        """
+        Mencatat semua durasi tahap (dan jumlah evaluasi fungsi) ke histogram.
+
+        Args:
+            endpoint (str): Path endpoint, misal "/integral/"
+            metode (str): Metode numerik yang dipakai
+            jumlah_evaluasi (int, optional): Jumlah evaluasi fungsi f(x)
+        """
+        for nama, detik in self.durasi.items():
+            DURASI_TAHAP.observe(
+                detik,
+                endpoint=endpoint,
+                metode=metode,
+                tahap=nama,
+                cache=self.cache.get(nama, "none"),
+            )
+        if jumlah_evaluasi is not None:
+            EVALUASI_FUNGSI.observe(jumlah_evaluasi, endpoint=endpoint, metode=metode)
+
+
+def respons_terukur(
+    model: BaseModel,
+    pengukur: PengukurTahap,
+    endpoint: str,
+    metode: str,
+    jumlah_evaluasi=None,
+) -> Response:
+    """
+    Menserialisasi model respons (diukur sebagai tahap `serialisasi`), mencatat
+    metrik permintaan, dan menambahkan header `Server-Timing` jika diaktifkan.
+    Respons dengan hasil sementara diberi `Cache-Control: no-store`.
+
+    Args:
+        model (BaseModel): Model respons endpoint
+        pengukur (PengukurTahap): Pengukur tahap permintaan ini
+        endpoint (str): Path endpoint, misal "/integral/"
+        metode (str): Metode numerik yang dipakai
+        jumlah_evaluasi (int, optional): Jumlah evaluasi fungsi f(x)
+
+    Returns:
+        Response: Respons JSON
+    """
+    with pengukur.tahap("serialisasi"):
+        isi = model.model_dump_json()
+    pengukur.catat(endpoint, metode, jumlah_evaluasi)
+    headers = (
+        {"Server-Timing": pengukur.server_timing()} if SERVER_TIMING_HEADER else {}
+    )
+    if pengukur.sementara:
+        headers["Cache-Control"] = "no-store"
+    return Response(content=isi, media_type="application/json", headers=headers)
@@ -0,0 +1,164 @@
+import math
+
+import numpy as np
+
+MODE_AKUMULASI = ["naif", "kahan", "berpasangan", "fsum"]
+
+# Satuan pembulatan u = eps / 2 untuk float64
+_U = np.finfo(float).eps / 2
+
+
+def jumlah_naif(suku) -> float:
+    """
+    Penjumlahan berurutan satu per satu (total += f_i).
+
+    np.cumsum menjumlahkan secara berurutan sehingga elemen terakhirnya sama
+    dengan hasil loop `total += f_i`, tetapi tanpa overhead loop Python.
+
+    Args:
+        suku (array-like): Suku-suku yang dijumlahkan
+
+    Returns:
+        float: Hasil penjumlahan
+    """
+    suku = np.asarray(suku, dtype=float).ravel()
+    return float(np.cumsum(suku)[-1]) if suku.size else 0.0
+
+
+def jumlah_kahan(suku) -> float:
+    """
+    Penjumlahan terkompensasi Kahan-Babuska-Neumaier.
+
+    Error setiap penjumlahan s_i = fl(s_{i-1} + f_i) dihitung secara eksak dengan
+    TwoSum (tervektorisasi atas jumlah parsial dari np.cumsum), lalu dijumlahkan
+    sebagai koreksi: identik dengan loop Neumaier `c += error; total = s_n + c`.
+
+    Args:
+        suku (array-like): Suku-suku yang dijumlahkan
+
+    Returns:
+        float: Hasil penjumlahan
+    """
+    suku = np.asarray(suku, dtype=float).ravel()
+    if suku.size == 0:
+        return 0.0
+    parsial = np.cumsum(suku)
+    sebelum = np.concatenate([[0.0], parsial[:-1]])
+    # TwoSum(sebelum, suku): error eksak dari parsial = fl(sebelum + suku)
+    with np.errstate(invalid="ignore"):
+        bagian = parsial - sebelum
+        error = (sebelum - (parsial - bagian)) + (suku - bagian)
+    if not np.all(np.isfinite(error)):
+        return float(parsial[-1])
+    return float(parsial[-1] + np.cumsum(error)[-1])
+
+
+def _kedalaman_berpasangan(n: int) -> int:
+    # Kedalaman penjumlahan np.sum: naif untuk n < 8, 8 akumulator hingga
+    # 128 elemen, lalu dibagi dua secara rekursif
+    if n < 8:
+        return max(n - 1, 0)
+    if n <= 128:
+        return math.ceil(n / 8) + 3
+    return 19 + math.ceil(math.log2(n / 128))
+
+
+def jumlahkan(suku, mode: str = "berpasangan"):
+    """
+    Menjumlahkan suku-suku kuadratur dengan mode akumulasi yang dipilih.
+
+    Args:
+        suku (array-like): Suku-suku w_i * f(x_i)
+        mode (str): _naif_ (total += f_i), _kahan_ (Kahan-Neumaier),
+            _berpasangan_ (pairwise, np.sum), atau _fsum_ (math.fsum, dibulatkan benar)
+
+    Returns:
+        float: Hasil penjumlahan
+        float: Batas error pembulatan dari penjumlahan dan pembentukan suku
+
+    Raises:
+        ValueError: Jika mode tidak dikenal
+    """
+    suku = np.asarray(suku, dtype=float).ravel()
+    if mode == "naif":
+        total = jumlah_naif(suku)
+    elif mode == "kahan":
+        total = jumlah_kahan(suku)
+    elif mode == "berpasangan":
+        total = float(np.sum(suku))
+    elif mode == "fsum":
+        total = math.fsum(suku.tolist())
+    else:
+        raise ValueError(
+            f"Mode akumulasi '{mode}' tidak valid. Gunakan 'naif', 'kahan', 'berpasangan', atau 'fsum'."
+        )
+
+    n = suku.size
+    jumlah_mutlak = float(np.sum(np.abs(suku)))
+    # Setiap suku w_i * f(x_i) sudah membawa error pembulatan <= u |suku|
+    batas = _U * jumlah_mutlak
+    if mode == "naif":
+        batas += max(n - 1, 0) * _U * jumlah_mutlak
+    elif mode == "berpasangan":
+        batas += _kedalaman_berpasangan(n) * _U * jumlah_mutlak
+    elif mode == "kahan":
+        batas += 2 * _U * abs(total) + n * _U**2 * jumlah_mutlak
+    else:
+        batas += _U * abs(total)
+    return total, float(batas)
+
+
+class Akumulator:
+    """
+    Penjumlah suku-suku kuadratur dengan mode akumulasi tertentu.
+
+    Seperti `Tracer`, akumulator bersifat opsional: fungsi integral menerima
+    `akumulator=None` (penjumlahan berpasangan np.sum) dan hanya memakai mode lain
+    serta mencatat estimasi error pembulatan jika akumulator diberikan.
+
+    Args:
+        mode (str): _naif_, _kahan_, _berpasangan_, atau _fsum_
+
+    Raises:
+        ValueError: Jika mode tidak dikenal
+    """
+
+    def __init__(self, mode: str = "berpasangan"):
+        if mode not in MODE_AKUMULASI:
+            raise ValueError(
+                f"Mode akumulasi '{mode}' tidak valid. Gunakan 'naif', 'kahan', 'berpasangan', atau 'fsum'."
+            )
+        self.mode = mode
+        self.estimasi_error = 0.0
+
+    def jumlahkan(self, suku, skala: float = 1.0) -> float:
+        """
+        Menjumlahkan suku dan menambahkan batas error pembulatannya (dikali skala).
+
+        Args:
+            suku (array-like): Suku-suku yang dijumlahkan
+            skala (float): Faktor pengali hasil, misal h, untuk skala error
+
+        Returns:
+            float: Hasil penjumlahan (belum dikali skala)
+        """
+        total, batas = jumlahkan(suku, self.mode)
+        self.estimasi_error += abs(skala) * batas
+        return total
+
+
+def jumlah_suku(suku, akumulator=None, skala: float = 1.0) -> float:
+    """
+    Menjumlahkan suku dengan akumulator jika diberikan, atau np.sum jika tidak.
+
+    Args:
+        suku (array-like): Suku-suku yang dijumlahkan
+        akumulator (Akumulator, optional): Penjumlah dengan mode akumulasi tertentu
+        skala (float): Faktor pengali hasil, untuk skala estimasi error
+
+    Returns:
+        float: Hasil penjumlahan (belum dikali skala)
+    """
+    if akumulator is None:
+        return float(np.sum(suku))
+    return akumulator.jumlahkan(suku, skala)
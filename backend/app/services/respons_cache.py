@@ -0,0 +1,159 @@
+import asyncio
+import hashlib
+import json
+import time
+
+from fastapi import Response
+
+from config import RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL
+from services.cache import TTLCache
+from services.utils import normalisasi_latex
+
+# Cache respons lengkap /turunan/ dan /integral/, kunci: hash input kanonik
+_respons_cache = (
+    TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+    if RESPONSE_CACHE_SIZE > 0
+    else None
+)
+# Komputasi yang sedang berjalan, kunci: hash input kanonik -> asyncio.Future
+_sedang_dihitung = {}
+_jumlah_digabung = 0
+
+
+def kunci_permintaan(endpoint: str, fungsi_latex: str, **parameter) -> str:
+    """
+    Membuat kunci cache dari input permintaan yang sudah dikanonikalisasi.
+
+    LaTeX dinormalisasi seperti kunci cache parsing, dan nilai numerik sudah
+    berupa int/float hasil validasi FastAPI (sehingga "1" dan "1.0" sama).
+    Pemanggil hanya menyertakan parameter yang relevan untuk metode yang dipilih.
+
+    Args:
+        endpoint (str): Path endpoint, misal "/integral/"
+        fungsi_latex (str): Fungsi dalam format LaTeX
+        **parameter: Parameter lain yang memengaruhi hasil
+
+    Returns:
+        str: Hash SHA-256 heksadesimal dari input kanonik
+    """
+    kanonik = {
+        "endpoint": endpoint,
+        "fungsi_latex": normalisasi_latex(fungsi_latex),
+        **{nama: nilai for nama, nilai in parameter.items() if nilai is not None},
+    }
+    teks = json.dumps(kanonik, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(teks.encode()).hexdigest()
+
+
+def _cocok_etag(if_none_match, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    daftar = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in daftar or etag in daftar or f"W/{etag}" in daftar
+
+
+async def respons_tercache(kunci: str, hitung, if_none_match=None) -> Response:
+    """
+    Mengambil respons dari cache, atau menghitungnya sekali untuk semua permintaan
+    identik yang datang bersamaan (single-flight).
+
+    Header `ETag` (hash isi respons), `Cache-Control` (sisa masa berlaku), dan
+    `X-Cache` (_HIT_, _MISS_, atau _COALESCED_) ditambahkan pada respons. Jika
+    `If-None-Match` cocok dengan ETag, dibalas 304 tanpa isi. Error (misal HTTP 400)
+    diteruskan ke semua permintaan yang menunggu dan tidak disimpan di cache,
+    begitu pula respons yang dibuat dengan header `Cache-Control: no-store`.
+
+    Args:
+        kunci (str): Kunci dari `kunci_permintaan`
+        hitung (callable): Coroutine function tanpa argumen yang menghasilkan Response
+        if_none_match (str, optional): Nilai header If-None-Match dari klien
+
+    Returns:
+        Response: Respons JSON, atau 304 Not Modified
+    """
+    global _jumlah_digabung
+    entri = _respons_cache.get(kunci) if _respons_cache is not None else None
+    status, respons_baru = "HIT", None
+
+    while entri is None:
+        future = _sedang_dihitung.get(kunci)
+        if future is None:
+            status = "MISS"
+            respons_baru, entri = await _hitung_sekali(kunci, hitung)
+            break
+        try:
+            entri = await asyncio.shield(future)
+            status = "COALESCED"
+            _jumlah_digabung += 1
+        except asyncio.CancelledError:
+            # Hanya ulangi jika komputasi pemimpin yang dibatalkan, bukan permintaan ini
+            if not future.cancelled():
+                raise
+
+    if entri["simpan"]:
+        sisa = RESPONSE_CACHE_TTL - (time.monotonic() - entri["dibuat"])
+        cache_control = f"public, max-age={max(int(sisa), 0)}"
+    else:
+        cache_control = "no-store"
+    headers = {"ETag": entri["etag"], "Cache-Control": cache_control, "X-Cache": status}
+    if _cocok_etag(if_none_match, entri["etag"]):
+        return Response(status_code=304, headers=headers)
+    if respons_baru is not None:
+        respons_baru.headers.update(headers)
+        return respons_baru
+    return Response(
+        content=entri["body"], media_type="application/json", headers=headers
+    )
+
+
+async def _hitung_sekali(kunci: str, hitung):
+    future = asyncio.get_running_loop().create_future()
+    _sedang_dihitung[kunci] = future
+    try:
+        respons = await hitung()
+        # Respons sementara (Cache-Control: no-store) hanya dibagi ke permintaan
+        # yang sedang menunggu, tidak disimpan
+        entri = {
+            "body": respons.body,
+            "etag": '"' + hashlib.sha256(respons.body).hexdigest()[:32] + '"',
+            "dibuat": time.monotonic(),
+            "simpan": respons.headers.get("cache-control") != "no-store",
+        }
+        if _respons_cache is not None and entri["simpan"]:
+            _respons_cache.set(kunci, entri)
+        future.set_result(entri)
+        return respons, entri
+    except Exception as e:
+        future.set_exception(e)
+        # Tandai sudah diambil agar asyncio tidak mencatat peringatan jika tidak ada penunggu
+        future.exception()
+        raise
+    except BaseException:
+        future.cancel()
+        raise
+    finally:
+        del _sedang_dihitung[kunci]
+
+
+def respons_cache_stats() -> dict:
+    """
+    Mengambil statistik cache respons.
+
+    Returns:
+        dict: Statistik TTLCache (hit, miss, eviction, expiration, ...) ditambah
+            jumlah permintaan yang digabung dengan komputasi yang sedang berjalan
+    """
+    stats = (
+        _respons_cache.stats()
+        if _respons_cache is not None
+        else {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "size": 0,
+            "maxsize": 0,
+            "expirations": 0,
+            "ttl": RESPONSE_CACHE_TTL,
+        }
+    )
+    return {**stats, "coalesced": _jumlah_digabung, "in_flight": len(_sedang_dihitung)}
@@ -0,0 +1,78 @@
+import logging
+from typing import List, Optional
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+FORMAT_STREAM = ["ndjson", "sse"]
+
+
+class EventSelesai(BaseModel):
+    jenis: str = "selesai"
+    alasan: str
+    hasil_numerik: Optional[float] = None
+    jumlah_langkah: int
+    jumlah_evaluasi: int
+
+
+class EventError(BaseModel):
+    jenis: str = "error"
+    detail: str
+
+
+def bingkai(event: BaseModel, format: str) -> str:
+    """
+    Membungkus satu event sebagai baris NDJSON atau pesan Server-Sent Events.
+
+    Args:
+        event (BaseModel): Event dengan field `jenis` (mulai, langkah, selesai, error)
+        format (str): _ndjson_ atau _sse_
+
+    Returns:
+        str: Teks event siap dikirim
+    """
+    isi = event.model_dump_json()
+    if format == "sse":
+        return f"event: {event.jenis}\ndata: {isi}\n\n"
+    return isi + "\n"
+
+
+def respons_stream(awal: List[BaseModel], events, format: str) -> StreamingResponse:
+    """
+    Membuat respons streaming dari event awal dan aliran event asinkron.
+
+    Error saat iterasi tidak dapat lagi dibalas dengan status HTTP karena header
+    sudah terkirim, sehingga dikirim sebagai event `error` lalu aliran ditutup.
+
+    Args:
+        awal (list[BaseModel]): Event yang langsung dikirim, misal event `mulai`
+        events (AsyncIterator[BaseModel]): Event berikutnya dari `iter_compute`
+        format (str): _ndjson_ atau _sse_
+
+    Returns:
+        StreamingResponse: Respons `application/x-ndjson` atau `text/event-stream`
+    """
+
+    async def isi():
+        try:
+            for event in awal:
+                yield bingkai(event, format)
+            async for event in events:
+                yield bingkai(event, format)
+        except ValueError as ve:
+            yield bingkai(EventError(detail=str(ve)), format)
+        except Exception as e:
+            logger.exception("Terjadi error saat streaming: %s", e)
+            yield bingkai(EventError(detail="Terjadi kesalahan di server."), format)
+        finally:
+            # Lepaskan slot komputasi meskipun klien terputus di tengah aliran
+            await events.aclose()
+
+    return StreamingResponse(
+        isi(),
+        media_type="text/event-stream" if format == "sse" else "application/x-ndjson",
+        # Nonaktifkan buffering proxy agar setiap langkah langsung sampai ke klien
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
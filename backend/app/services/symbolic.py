@@ -0,0 +1,332 @@
+import json
+import logging
+
+import numpy as np
+from sympy import (
+    Integral,
+    Interval,
+    Symbol,
+    diff,
+    integrate,
+    lambdify,
+    latex,
+    singularities,
+    srepr,
+    sympify,
+)
+
+from config import SYMBOLIC_CACHE_PATH, SYMBOLIC_CACHE_SIZE
+from services.cache import LRUCache, SQLiteCache, TieredCache
+from services.symbolic_pool import SymbolicUnavailableError, run_symbolic
+from services.utils import LATEX_PEMANASAN, parse_latex_to_python, to_sympy
+
+logger = logging.getLogger(__name__)
+
+x = Symbol("x")
+
+
+def _serialize(entri: dict) -> str:
+    return json.dumps({**entri, "expr": srepr(entri["expr"])})
+
+
+def _deserialize(teks: str) -> dict:
+    entri = json.loads(teks)
+    entri["expr"] = sympify(entri["expr"])
+    return entri
+
+
+# Cache hasil simbolik, kunci: jenis hasil + srepr ekspresi kanonik
+_symbolic_cache = TieredCache(
+    LRUCache(maxsize=SYMBOLIC_CACHE_SIZE),
+    SQLiteCache(SYMBOLIC_CACHE_PATH, tabel="simbolik") if SYMBOLIC_CACHE_PATH else None,
+    serialize=_serialize,
+    deserialize=_deserialize,
+)
+
+# Cache callable numpy hasil lambdify, kunci: ekspresi sympy
+_numerik_cache = LRUCache(maxsize=SYMBOLIC_CACHE_SIZE)
+
+
+# --- Fungsi yang dijalankan di process pool ---
+def _hitung_turunan(fungsi, orde: int = 1) -> dict:
+    turunan = diff(fungsi, x, orde)
+    return {"expr": turunan, "latex": latex(turunan)}
+
+
+def _hitung_antiturunan(fungsi) -> dict:
+    antiturunan = integrate(fungsi, x)
+    return {
+        "expr": antiturunan,
+        "latex": latex(antiturunan),
+        "latex_fungsi": latex(fungsi),
+    }
+
+
+def _hitung_integral_tentu(fungsi, batas_bawah, batas_atas):
+    return integrate(fungsi, (x, batas_bawah, batas_atas)).evalf()
+
+
+def _hitung_nilai_antiturunan(
+    fungsi, antiturunan, batas_bawah, batas_atas, periksa_singular, nilai_cepat
+):
+    # F(b) - F(a) jika fungsi tidak singular di [a, b], atau None. nilai_cepat
+    # adalah hasil lambdify (boleh None); jika ada, subs/evalf tidak diperlukan.
+    if periksa_singular:
+        try:
+            titik_singular = singularities(fungsi, x, Interval(batas_bawah, batas_atas))
+        except Exception:
+            return None
+        if titik_singular.is_empty is not True:
+            return None
+    if nilai_cepat is not None:
+        return nilai_cepat
+    hasil = (antiturunan.subs(x, batas_atas) - antiturunan.subs(x, batas_bawah)).evalf()
+    if not (hasil.is_real and hasil.is_finite):
+        return None
+    return float(hasil)
+
+
+def _hitung_evaluasi(expr, daftar_x) -> list:
+    # Evaluasi subs/evalf per titik; nilai yang tidak real atau tak hingga menjadi NaN
+    hasil = []
+    for x_i in daftar_x:
+        nilai = expr.subs(x, x_i).evalf()
+        hasil.append(float(nilai) if nilai.is_real and nilai.is_finite else np.nan)
+    return hasil
+
+
+def _hitung_integral_lipat(fungsi, batas) -> dict:
+    # batas: [(variabel, bawah, atas), ...], variabel terdalam lebih dulu
+    hasil = integrate(fungsi, *[(Symbol(v), a, b) for v, a, b in batas])
+    return {
+        "nilai": None if hasil.has(Integral) else hasil.evalf(),
+        "latex_fungsi": latex(fungsi),
+    }
+
+
+def _kunci_turunan(fungsi_str: str, orde: int) -> str:
+    jenis = "turunan" if orde == 1 else f"turunan{orde}"
+    return f"{jenis}:" + srepr(to_sympy(fungsi_str))
+
+
+def _kunci_antiturunan(fungsi_str: str) -> str:
+    return "antiturunan:" + srepr(to_sympy(fungsi_str))
+
+
+def turunan_simbolik(fungsi_str: str, orde: int = 1) -> dict:
+    """
+    Menghitung turunan simbolik f'(x) beserta format LaTeX-nya, memakai cache.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        orde (int): Orde turunan (1 untuk f', 2 untuk f'', dst.)
+
+    Returns:
+        dict: `expr` (ekspresi sympy turunan) dan `latex` (turunan dalam LaTeX)
+    """
+    fungsi = to_sympy(fungsi_str)
+    return _symbolic_cache.get_or_compute(
+        _kunci_turunan(fungsi_str, orde),
+        lambda: run_symbolic(_hitung_turunan, fungsi, orde),
+    )
+
+
+def antiturunan_simbolik(fungsi_str: str) -> dict:
+    """
+    Menghitung antiturunan simbolik F(x) beserta format LaTeX-nya, memakai cache.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+
+    Returns:
+        dict: `expr` (ekspresi sympy antiturunan), `latex` (antiturunan dalam LaTeX),
+            dan `latex_fungsi` (fungsi asal dalam LaTeX)
+    """
+    fungsi = to_sympy(fungsi_str)
+    return _symbolic_cache.get_or_compute(
+        _kunci_antiturunan(fungsi_str),
+        lambda: run_symbolic(_hitung_antiturunan, fungsi),
+    )
+
+
+def turunan_tercache(fungsi_str: str, orde: int = 1) -> bool:
+    """
+    Memeriksa apakah turunan simbolik fungsi sudah ada di cache.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        orde (int): Orde turunan
+
+    Returns:
+        bool: True jika sudah ada di cache (memori atau disk)
+    """
+    return _kunci_turunan(fungsi_str, orde) in _symbolic_cache
+
+
+def antiturunan_tercache(fungsi_str: str) -> bool:
+    """
+    Memeriksa apakah antiturunan simbolik fungsi sudah ada di cache.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+
+    Returns:
+        bool: True jika sudah ada di cache (memori atau disk)
+    """
+    return _kunci_antiturunan(fungsi_str) in _symbolic_cache
+
+
+def integral_tentu_simbolik(fungsi, batas_bawah: float, batas_atas: float):
+    """
+    Menghitung integral tentu secara simbolik (tanpa cache) di process pool.
+
+    Args:
+        fungsi (sympy.Expr): Ekspresi sympy fungsi
+        batas_bawah (float): Batas bawah integral
+        batas_atas (float): Batas atas integral
+
+    Returns:
+        sympy.Expr: Nilai integral tentu
+    """
+    return run_symbolic(_hitung_integral_tentu, fungsi, batas_bawah, batas_atas)
+
+
+def nilai_antiturunan_simbolik(
+    fungsi,
+    antiturunan,
+    batas_bawah: float,
+    batas_atas: float,
+    periksa_singular: bool = True,
+    nilai_cepat=None,
+):
+    """
+    Menghitung F(b) - F(a) dari antiturunan di process pool dengan batas waktu.
+
+    Pemeriksaan singularitas sympy dan evaluasi subs/evalf bisa berjalan sangat
+    lama untuk fungsi tertentu, sehingga keduanya dijalankan lewat `run_symbolic`.
+
+    Args:
+        fungsi (sympy.Expr): Ekspresi sympy fungsi
+        antiturunan (sympy.Expr): Antiturunan fungsi
+        batas_bawah (float): Batas bawah integral
+        batas_atas (float): Batas atas integral
+        periksa_singular (bool): False jika fungsi sudah diketahui mulus
+        nilai_cepat (float, optional): F(b) - F(a) dari callable numpy, dipakai
+            setelah pemeriksaan singularitas sebagai pengganti subs/evalf
+
+    Returns:
+        float: Nilai integral, atau None jika fungsi singular di dalam interval
+            atau hasilnya tidak real
+
+    Raises:
+        SymbolicUnavailableError: Jika komputasi melebihi batas waktu
+    """
+    if not periksa_singular and nilai_cepat is not None:
+        return nilai_cepat
+    return run_symbolic(
+        _hitung_nilai_antiturunan,
+        fungsi,
+        antiturunan,
+        batas_bawah,
+        batas_atas,
+        periksa_singular,
+        nilai_cepat,
+    )
+
+
+def integral_lipat_simbolik(fungsi, batas):
+    """
+    Menghitung integral lipat pada domain persegi secara simbolik (tanpa cache).
+
+    Args:
+        fungsi (sympy.Expr): Ekspresi sympy fungsi beberapa variabel
+        batas (list[tuple]): (nama variabel, batas bawah, batas atas) per variabel,
+            variabel terdalam lebih dulu
+
+    Returns:
+        dict: `nilai` (nilai integral, atau None jika tidak memiliki bentuk
+            tertutup) dan `latex_fungsi` (fungsi dalam LaTeX)
+    """
+    return run_symbolic(_hitung_integral_lipat, fungsi, list(batas))
+
+
+def fungsi_numerik(expr):
+    """
+    Mengubah ekspresi sympy menjadi callable numpy f(x) dengan lambdify, memakai cache.
+
+    Args:
+        expr (sympy.Expr): Ekspresi sympy dalam variabel x
+
+    Returns:
+        callable: Fungsi f(x) yang menerima skalar atau array numpy
+    """
+    fungsi = _numerik_cache.get(expr)
+    if fungsi is None:
+        fungsi = lambdify(x, expr, modules="numpy")
+        _numerik_cache.set(expr, fungsi)
+    return fungsi
+
+
+def evaluasi_simbolik(expr, nilai_x):
+    """
+    Mengevaluasi ekspresi sympy pada satu atau banyak titik x.
+
+    Evaluasi memakai callable numpy dari `fungsi_numerik`. Nilai NaN/inf dari numpy
+    dikembalikan apa adanya, dan titik dengan nilai kompleks (bagian imajiner
+    bukan sisa pembulatan) bernilai NaN. Hanya jika callable gagal dijalankan atau
+    tidak menghasilkan angka, ekspresi dievaluasi dengan `subs`/`evalf` di process
+    pool dengan batas waktu.
+
+    Args:
+        expr (sympy.Expr): Ekspresi sympy dalam variabel x
+        nilai_x (float atau array-like): Titik-titik x
+
+    Returns:
+        np.ndarray: Nilai ekspresi (dtype float, bentuk sama dengan `nilai_x`)
+
+    Raises:
+        SymbolicUnavailableError: Jika evaluasi sympy melebihi batas waktu
+    """
+    xs = np.asarray(nilai_x, dtype=float)
+    try:
+        with np.errstate(all="ignore"):
+            hasil = np.asarray(fungsi_numerik(expr)(xs))
+    except Exception:
+        hasil = None
+    if hasil is not None and hasil.dtype.kind == "c":
+        nyata = np.abs(hasil.imag) <= 1e-12 * np.maximum(1.0, np.abs(hasil.real))
+        hasil = np.where(nyata, hasil.real, np.nan)
+    if hasil is None or hasil.dtype.kind not in "biuf":
+        hasil = run_symbolic(_hitung_evaluasi, expr, xs.ravel().tolist())
+        return np.asarray(hasil, dtype=float).reshape(xs.shape)
+    return np.broadcast_to(hasil, xs.shape).astype(float)
+
+
+def pemanasan_simbolik(daftar_latex=None):
+    """
+    Mengisi cache simbolik dengan turunan pertama dan antiturunan setiap fungsi.
+
+    Fungsi yang gagal (misal melebihi batas waktu) dilewati agar fungsi lain
+    tetap dipanaskan.
+
+    Args:
+        daftar_latex (list[str], optional): Ekspresi LaTeX yang dipanaskan.
+            Default: `LATEX_PEMANASAN`.
+    """
+    for latex_str in LATEX_PEMANASAN if daftar_latex is None else daftar_latex:
+        try:
+            fungsi_str = parse_latex_to_python(latex_str)
+            turunan_simbolik(fungsi_str)
+            antiturunan_simbolik(fungsi_str)
+        except (SymbolicUnavailableError, ValueError) as e:
+            logger.warning("Pemanasan simbolik '%s' gagal: %s", latex_str, e)
+
+
+def symbolic_cache_stats() -> dict:
+    """
+    Mengambil statistik cache hasil simbolik.
+
+    Returns:
+        dict: Statistik cache memori dan disk
+    """
+    return _symbolic_cache.stats()
@@ -0,0 +1,220 @@
+import importlib
+import multiprocessing
+import queue
+import threading
+from contextlib import contextmanager
+
+from config import (
+    SYMBOLIC_POOL_SIZE,
+    SYMBOLIC_POOL_START_METHOD,
+    SYMBOLIC_QUEUE_DEPTH,
+    SYMBOLIC_TIMEOUT,
+)
+
+
+class SymbolicUnavailableError(Exception):
+    """
+    Komputasi simbolik tidak dapat diselesaikan (antrian penuh atau worker berhenti).
+    """
+
+
+class SymbolicTimeoutError(SymbolicUnavailableError):
+    """
+    Komputasi simbolik melebihi batas waktu yang diizinkan.
+    """
+
+
+# Modul yang dimuat worker (atau forkserver) sebelum menerima tugas
+MODUL_PRAMUAT = ["sympy", "sympy.parsing.latex._parse_latex_antlr"]
+
+# Batas waktu (detik) worker baru selesai memuat modul; tidak termasuk SYMBOLIC_TIMEOUT
+_BATAS_WAKTU_MULAI = 60.0
+
+_lock = threading.Lock()
+# Worker yang sedang menganggur (LIFO agar worker yang baru dipakai tetap panas)
+_menganggur = queue.LifoQueue()
+_jumlah_worker = 0
+# True selama `tanpa_pool` aktif
+_langsung = False
+# Membatasi jumlah tugas yang sedang berjalan + menunggu di antrian
+_slot = threading.BoundedSemaphore(max(SYMBOLIC_POOL_SIZE, 1) + SYMBOLIC_QUEUE_DEPTH)
+
+
+def _loop_worker(koneksi):
+    # Dijalankan di proses worker: memuat modul berat, memberi tanda siap, lalu
+    # menjalankan tugas satu per satu sampai pipe ditutup
+    for modul in MODUL_PRAMUAT:
+        try:
+            importlib.import_module(modul)
+        except ImportError:
+            pass
+    koneksi.send(None)
+    while True:
+        try:
+            fungsi, args = koneksi.recv()
+        except EOFError:
+            return
+        try:
+            hasil = (True, fungsi(*args))
+        except Exception as e:
+            hasil = (False, e)
+        try:
+            koneksi.send(hasil)
+        except Exception as e:
+            # Hasil atau exception tidak bisa di-pickle
+            koneksi.send((False, RuntimeError(str(e))))
+
+
+class _Worker:
+    """
+    Satu proses worker simbolik dengan pipe miliknya sendiri.
+
+    Berbeda dengan ProcessPoolExecutor, worker yang macet dapat dihentikan
+    sendiri tanpa mengganggu tugas yang sedang berjalan di worker lain.
+    """
+
+    def __init__(self):
+        konteks = multiprocessing.get_context(SYMBOLIC_POOL_START_METHOD or None)
+        if konteks.get_start_method() == "forkserver":
+            # Worker di-fork dari forkserver yang sudah memuat sympy dan ANTLR
+            konteks.set_forkserver_preload(MODUL_PRAMUAT)
+        self.koneksi, ujung_worker = konteks.Pipe()
+        self.proses = konteks.Process(
+            target=_loop_worker, args=(ujung_worker,), daemon=True
+        )
+        self.proses.start()
+        ujung_worker.close()
+        try:
+            if not self.koneksi.poll(_BATAS_WAKTU_MULAI):
+                raise EOFError
+            self.koneksi.recv()
+        except (EOFError, OSError):
+            self.hentikan()
+            raise SymbolicUnavailableError("Worker komputasi simbolik gagal dimulai.")
+
+    def jalankan(self, fungsi, args, timeout: float):
+        """
+        Mengirim satu tugas dan menunggu hasilnya.
+
+        Returns:
+            tuple: (berhasil, hasil atau exception dari tugas)
+
+        Raises:
+            SymbolicTimeoutError: Jika tugas melebihi batas waktu
+            EOFError, OSError: Jika proses worker berhenti
+        """
+        self.koneksi.send((fungsi, args))
+        if not self.koneksi.poll(timeout):
+            raise SymbolicTimeoutError(
+                f"Komputasi simbolik melebihi batas waktu {timeout} detik."
+            )
+        return self.koneksi.recv()
+
+    def hentikan(self):
+        self.proses.terminate()
+        self.proses.join(timeout=1)
+        self.koneksi.close()
+
+
+def _ambil_worker(timeout: float) -> _Worker:
+    # Worker menganggur, worker baru jika jumlahnya belum SYMBOLIC_POOL_SIZE,
+    # atau menunggu worker lain selesai paling lama `timeout` detik
+    global _jumlah_worker
+    try:
+        return _menganggur.get_nowait()
+    except queue.Empty:
+        pass
+    with _lock:
+        buat_baru = _jumlah_worker < SYMBOLIC_POOL_SIZE
+        if buat_baru:
+            _jumlah_worker += 1
+    if buat_baru:
+        try:
+            return _Worker()
+        except BaseException:
+            with _lock:
+                _jumlah_worker -= 1
+            raise
+    try:
+        return _menganggur.get(timeout=timeout)
+    except queue.Empty:
+        raise SymbolicTimeoutError(
+            f"Semua worker komputasi simbolik sibuk lebih dari {timeout} detik."
+        )
+
+
+def _buang_worker(worker: _Worker):
+    """
+    Menghentikan paksa satu worker; penggantinya dibuat saat dibutuhkan.
+
+    Worker yang macet hanya dapat dihentikan dengan mematikan prosesnya. Worker
+    lain (dan tugas yang sedang berjalan di sana) tidak terpengaruh.
+    """
+    global _jumlah_worker
+    worker.hentikan()
+    with _lock:
+        _jumlah_worker -= 1
+
+
+@contextmanager
+def tanpa_pool():
+    """
+    Menjalankan `run_symbolic` langsung di proses ini (tanpa batas waktu) selama
+    blok aktif.
+
+    Dipakai saat pramuat di proses master gunicorn: pool tidak boleh dibuat sebelum
+    fork, karena worker akan mewarisi pool milik master yang tidak bisa dipakai.
+    """
+    global _langsung
+    _langsung = True
+    try:
+        yield
+    finally:
+        _langsung = False
+
+
+def run_symbolic(fungsi, *args, timeout: float = SYMBOLIC_TIMEOUT):
+    """
+    Menjalankan komputasi simbolik di process pool dengan batas waktu.
+
+    Batas waktu berlaku untuk eksekusi tugas; menunggu worker yang sibuk juga
+    dibatasi `timeout`. Jika terlewati, hanya worker yang menjalankan tugas ini
+    yang dihentikan.
+
+    Args:
+        fungsi (callable): Fungsi level modul (harus bisa di-pickle)
+        *args: Argumen untuk fungsi (harus bisa di-pickle)
+        timeout (float): Batas waktu dalam detik
+
+    Returns:
+        Hasil `fungsi(*args)`
+
+    Raises:
+        SymbolicTimeoutError: Jika komputasi melebihi batas waktu
+        SymbolicUnavailableError: Jika antrian penuh atau worker berhenti
+    """
+    if SYMBOLIC_POOL_SIZE <= 0 or _langsung:
+        return fungsi(*args)
+
+    if not _slot.acquire(blocking=False):
+        raise SymbolicUnavailableError("Antrian komputasi simbolik sedang penuh.")
+    try:
+        worker = _ambil_worker(timeout)
+        try:
+            berhasil, hasil = worker.jalankan(fungsi, args, timeout)
+        except SymbolicTimeoutError:
+            _buang_worker(worker)
+            raise
+        except (EOFError, OSError):
+            _buang_worker(worker)
+            raise SymbolicUnavailableError("Worker komputasi simbolik berhenti.")
+        except BaseException:
+            # Status pipe tidak diketahui (misal argumen gagal di-pickle di tengah jalan)
+            _buang_worker(worker)
+            raise
+        _menganggur.put(worker)
+    finally:
+        _slot.release()
+    if not berhasil:
+        raise hasil
+    return hasil
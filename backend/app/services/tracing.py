@@ -0,0 +1,86 @@
+import math
+from typing import List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from config import TRACE_MAX_ROWS
+
+
+class BarisTrace(BaseModel):
+    i: int
+    x: float
+    f_x: Optional[float] = None
+    bobot: Optional[float] = None
+
+
+class Tracer:
+    """
+    Pencatat tabel iterasi (i, x_i, f(x_i), bobot) dari metode numerik.
+
+    Tracing bersifat opsional: fungsi numerik menerima `tracer=None` secara default
+    dan hanya mencatat jika tracer diberikan. Buffer dibatasi `kapasitas` baris;
+    baris setelahnya hanya dihitung, tidak disimpan.
+
+    Args:
+        kapasitas (int): Jumlah baris maksimum yang disimpan.
+    """
+
+    def __init__(self, kapasitas: int = TRACE_MAX_ROWS):
+        self.kapasitas = kapasitas
+        self.total_baris = 0
+        self._baris = []
+
+    @property
+    def terpotong(self) -> bool:
+        return self.total_baris > len(self._baris)
+
+    def catat(self, x, f_x, bobot=None):
+        """
+        Mencatat sekumpulan titik sampel beserta nilai fungsi dan bobotnya.
+
+        Args:
+            x (array-like): Titik-titik x_i
+            f_x (array-like): Nilai f(x_i)
+            bobot (array-like, optional): Bobot tiap titik pada rumus metode
+        """
+        x = np.atleast_1d(x)
+        f_x = np.broadcast_to(f_x, x.shape)
+        n_baru = x.size
+        sisa = self.kapasitas - len(self._baris)
+        if sisa > 0:
+            bobot_simpan = (
+                [None] * min(sisa, n_baru)
+                if bobot is None
+                else np.broadcast_to(bobot, x.shape)[:sisa].tolist()
+            )
+            for offset, (x_i, f_i, w_i) in enumerate(
+                zip(x[:sisa].tolist(), f_x[:sisa].tolist(), bobot_simpan)
+            ):
+                self._baris.append(
+                    BarisTrace(
+                        i=self.total_baris + offset,
+                        x=x_i,
+                        f_x=f_i if math.isfinite(f_i) else None,
+                        bobot=w_i,
+                    )
+                )
+        self.total_baris += n_baru
+
+    def lewati(self, jumlah: int):
+        """
+        Menghitung sejumlah titik sampel tanpa mencatatnya ke tabel.
+
+        Args:
+            jumlah (int): Jumlah titik yang dievaluasi tetapi tidak dicatat
+        """
+        self.total_baris += jumlah
+
+    def tabel(self) -> List[BarisTrace]:
+        """
+        Mengambil tabel iterasi yang tercatat.
+
+        Returns:
+            list[BarisTrace]: Baris-baris tabel iterasi
+        """
+        return list(self._baris)
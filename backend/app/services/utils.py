@@ -1,6 +1,155 @@
+import ast
+import io
+import operator
+import threading
+import time
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from sympy.parsing.latex import parse_latex
-import re
+import sympy
+from sympy.parsing.sympy_parser import parse_expr
+from types import SimpleNamespace
+
+from config import (
+    COMPILED_CACHE_SIZE,
+    EXPR_MAX_EXPONENT,
+    EXPR_MAX_NODES,
+    PARSE_CACHE_SIZE,
+    SHARED_CACHE_PATH,
+    SYMBOLIC_POOL_SIZE,
+    WARMUP_LATEX,
+)
+from services.cache import LRUCache, SQLiteCache, TieredCache
+from services.symbolic_pool import SymbolicUnavailableError, run_symbolic
+
+# Cache fungsi terkompilasi, kunci: (ekspresi ternormalisasi, id modul numpy)
+_compiled_cache = LRUCache(maxsize=COMPILED_CACHE_SIZE)
+
+# Cache hasil parse_latex_to_python, kunci: string LaTeX ternormalisasi.
+# Dengan SHARED_CACHE_PATH, hasil parsing juga dibagi antar worker lewat SQLite.
+_parse_cache = TieredCache(
+    LRUCache(maxsize=PARSE_CACHE_SIZE),
+    SQLiteCache(SHARED_CACHE_PATH, tabel="parse") if SHARED_CACHE_PATH else None,
+)
+
+# Cache hasil to_sympy, kunci: string fungsi ternormalisasi
+_sympy_cache = LRUCache(maxsize=PARSE_CACHE_SIZE)
+
+# Statistik waktu parsing LaTeX (hanya cache miss yang benar-benar di-parse)
+_parse_lock = threading.Lock()
+_parse_waktu = {"jumlah": 0, "total": 0.0, "maks": 0.0}
+
+# Ekspresi LaTeX yang di-parse saat startup untuk memanaskan parser dan cache
+LATEX_PEMANASAN = WARMUP_LATEX or ["x^2", "\\sin(x) + x^2", "e^{x}", "\\frac{1}{x}"]
+
+# Padanan sympy untuk nama-nama numpy yang dihasilkan parse_latex_to_python
+_np_sympy = SimpleNamespace(
+    sin=sympy.sin,
+    cos=sympy.cos,
+    tan=sympy.tan,
+    arcsin=sympy.asin,
+    arccos=sympy.acos,
+    arctan=sympy.atan,
+    sinh=sympy.sinh,
+    cosh=sympy.cosh,
+    tanh=sympy.tanh,
+    exp=sympy.exp,
+    log=sympy.log,
+    sqrt=sympy.sqrt,
+    abs=sympy.Abs,
+    pi=sympy.pi,
+    e=sympy.E,
+)
+
+# Nama hasil parse_latex (sympy) dan padanannya dalam ekspresi numpy
+_nama_numpy = {
+    "sin": "np.sin",
+    "cos": "np.cos",
+    "tan": "np.tan",
+    "asin": "np.arcsin",
+    "acos": "np.arccos",
+    "atan": "np.arctan",
+    "sinh": "np.sinh",
+    "cosh": "np.cosh",
+    "tanh": "np.tanh",
+    "exp": "np.exp",
+    "log": "np.log",
+    "sqrt": "np.sqrt",
+    "Abs": "np.abs",
+    "pi": "np.pi",
+    "e": "np.e",
+    "E": "np.e",
+}
+
+# Atribut numpy yang boleh dipakai dalam ekspresi fungsi
+_fungsi_np = {
+    "sin",
+    "cos",
+    "tan",
+    "arcsin",
+    "arccos",
+    "arctan",
+    "sinh",
+    "cosh",
+    "tanh",
+    "exp",
+    "log",
+    "sqrt",
+    "abs",
+}
+_konstanta_np = {"pi", "e"}
+
+# Node AST yang boleh muncul dalam ekspresi fungsi
+_node_diizinkan = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Call,
+    ast.Name,
+    ast.Attribute,
+    ast.Constant,
+    ast.Load,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+_operator_biner = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+
+
+def _parse_latex(latex_str: str) -> str:
+    # Dijalankan di process pool komputasi simbolik. Import di sini agar parser
+    # ANTLR hanya dimuat di proses yang benar-benar mem-parsing LaTeX.
+    from sympy.parsing.latex import parse_latex
+
+    return str(parse_latex(latex_str))
+
+
+def normalisasi_latex(latex_str: str) -> str:
+    """
+    Menormalisasi string LaTeX agar penulisan yang setara memakai kunci cache yang sama.
+
+    Tanda dollar dan spasi di awal/akhir dibuang, spasi berurutan diringkas
+    menjadi satu. Spasi di tengah tidak dibuang karena bisa bermakna
+    (misal `\\sin x`).
+
+    Args:
+        latex_str (str): Ekspresi matematika dalam format LaTeX.
+
+    Returns:
+        str: String LaTeX ternormalisasi
+    """
+    return " ".join(latex_str.strip().strip("$").split())
 
 
 def parse_latex_to_python(latex_str: str) -> str:
@@ -15,27 +164,454 @@ def parse_latex_to_python(latex_str: str) -> str:
 
     Raises:
         ValueError: Jika ekspresi LaTeX tidak valid atau tidak dapat dikonversi.
+        SymbolicUnavailableError: Jika worker simbolik sibuk, berhenti, atau
+            melebihi batas waktu
     """
-    try:
-        latex_str = latex_str.strip("$")
-        sympy_expr = parse_latex(latex_str)
-        python_str = str(sympy_expr)
-        replacements = {
-            "sin": "np.sin",
-            "cos": "np.cos",
-            "tan": "np.tan",
-            "exp": "np.exp",
-            "log": "np.log",
-            "sqrt": "np.sqrt",
-            "pi": "np.pi",
-            "e": "np.e",
-        }
-
-        for old, new in replacements.items():
-            python_str = re.sub(r"\b" + old + r"\b", new, python_str)
+    kunci = normalisasi_latex(latex_str)
+    python_str = _parse_cache.get(kunci)
+    if python_str is not None:
         return python_str
+
+    mulai = time.perf_counter()
+    try:
+        python_str = _ganti_nama(run_symbolic(_parse_latex, kunci), _nama_numpy)
+    except SymbolicUnavailableError:
+        raise
     except Exception as e:
         raise ValueError(f"Error saat mengurai ekspresi LaTeX: {str(e)}")
+    durasi = time.perf_counter() - mulai
+    with _parse_lock:
+        _parse_waktu["jumlah"] += 1
+        _parse_waktu["total"] += durasi
+        _parse_waktu["maks"] = max(_parse_waktu["maks"], durasi)
+    _parse_cache.set(kunci, python_str)
+    return python_str
+
+
+def latex_tercache(latex_str: str) -> bool:
+    """
+    Memeriksa apakah hasil parsing LaTeX sudah ada di cache.
+
+    Args:
+        latex_str (str): Ekspresi matematika dalam format LaTeX.
+
+    Returns:
+        bool: True jika sudah ada di cache
+    """
+    return normalisasi_latex(latex_str) in _parse_cache
+
+
+def parse_cache_stats() -> dict:
+    """
+    Mengambil statistik cache dan waktu parsing LaTeX.
+
+    Returns:
+        dict: Statistik cache (hit, miss, hit_rate, ...) dan waktu parsing
+            cache miss dalam milidetik (jumlah, rata-rata, maksimum)
+    """
+    stats = _parse_cache.stats()
+    total = stats["hits"] + stats["misses"]
+    with _parse_lock:
+        jumlah, total_detik, maks = (
+            _parse_waktu["jumlah"],
+            _parse_waktu["total"],
+            _parse_waktu["maks"],
+        )
+    return {
+        **stats,
+        "hit_rate": round(stats["hits"] / total, 4) if total else None,
+        "parse_count": jumlah,
+        "parse_avg_ms": round(total_detik / jumlah * 1000, 3) if jumlah else None,
+        "parse_max_ms": round(maks * 1000, 3),
+    }
+
+
+def _panaskan_parser() -> str:
+    # Dijalankan di process pool: memuat parser ANTLR di worker
+    return _parse_latex("x^2")
+
+
+def pemanasan(daftar_latex=None):
+    """
+    Memanaskan parser LaTeX dan mengisi cache sebelum permintaan pertama.
+
+    Setiap worker simbolik memuat parser ANTLR (bagian paling lambat dari
+    permintaan pertama), lalu setiap ekspresi di `daftar_latex` di-parse,
+    dikonversi ke sympy, dan dikompilasi.
+
+    Args:
+        daftar_latex (list[str], optional): Ekspresi LaTeX yang dipanaskan.
+            Default: `LATEX_PEMANASAN`.
+    """
+    jumlah_worker = max(SYMBOLIC_POOL_SIZE, 1)
+    with ThreadPoolExecutor(max_workers=jumlah_worker) as pelaksana:
+        list(
+            pelaksana.map(
+                lambda _: run_symbolic(_panaskan_parser), range(jumlah_worker)
+            )
+        )
+
+    for latex_str in LATEX_PEMANASAN if daftar_latex is None else daftar_latex:
+        fungsi_str = parse_latex_to_python(latex_str)
+        to_sympy(fungsi_str)
+        compile_func(fungsi_str)
+
+
+def _ganti_nama(python_str: str, pengganti: dict) -> str:
+    # Mengganti nama (token NAME) secara utuh, bukan potongan teks, sehingga
+    # misalnya "e" tidak pernah mengubah bagian dari nama atau atribut lain
+    hasil, posisi, sebelumnya = [], 0, None
+    for token in tokenize.generate_tokens(io.StringIO(python_str).readline):
+        if (
+            token.type == tokenize.NAME
+            and token.string in pengganti
+            and sebelumnya != "."
+        ):
+            hasil.append(python_str[posisi : token.start[1]])
+            hasil.append(pengganti[token.string])
+            posisi = token.end[1]
+        sebelumnya = token.string
+    hasil.append(python_str[posisi:])
+    return "".join(hasil)
+
+
+def _nilai_konstan(node):
+    # Nilai float dari sub-ekspresi yang hanya berisi angka, atau None
+    if isinstance(node, ast.Constant):
+        return float(node.value)
+    if isinstance(node, ast.UnaryOp):
+        nilai = _nilai_konstan(node.operand)
+        if nilai is None:
+            return None
+        return -nilai if isinstance(node.op, ast.USub) else nilai
+    if isinstance(node, ast.BinOp):
+        kiri, kanan = _nilai_konstan(node.left), _nilai_konstan(node.right)
+        if kiri is None or kanan is None:
+            return None
+        try:
+            return _operator_biner[type(node.op)](kiri, kanan)
+        except (OverflowError, ZeroDivisionError):
+            return float("inf")
+    return None
+
+
+def validasi_ekspresi(fungsi_str: str, variabel=("x",)) -> ast.Expression:
+    """
+    Mem-parsing string fungsi menjadi AST dan memastikan hanya berisi elemen yang diizinkan.
+
+    Yang diizinkan: variabel di `variabel` (default hanya `x`), konstanta angka, operator + - * / **, fungsi
+    numpy yang ada di daftar putih (`np.sin`, `np.log`, ...), `sqrt`, `pi`, dan `e`.
+    Biaya ekspresi dibatasi oleh jumlah node (`EXPR_MAX_NODES`) dan besar
+    pangkat konstan (`EXPR_MAX_EXPONENT`).
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string, misal "np.sin(x) + x**2".
+        variabel (tuple[str]): Nama variabel bebas yang boleh dipakai
+
+    Returns:
+        ast.Expression: AST ekspresi yang sudah divalidasi
+
+    Raises:
+        ValueError: Jika ekspresi tidak valid, mengandung elemen terlarang, atau terlalu mahal
+    """
+    try:
+        pohon = ast.parse(fungsi_str.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Error: Kesalahan sintaks dalam fungsi: {e}")
+
+    nama_np = set()
+    for jumlah_node, node in enumerate(ast.walk(pohon), start=1):
+        if jumlah_node > EXPR_MAX_NODES:
+            raise ValueError(
+                f"Ekspresi fungsi terlalu kompleks (lebih dari {EXPR_MAX_NODES} node)."
+            )
+        if not isinstance(node, _node_diizinkan):
+            raise ValueError(
+                f"Elemen '{type(node).__name__}' tidak diizinkan dalam fungsi."
+            )
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise ValueError("Hanya konstanta angka yang diizinkan dalam fungsi.")
+        elif isinstance(node, ast.Attribute):
+            if not (
+                isinstance(node.value, ast.Name)
+                and node.value.id == "np"
+                and node.attr in _fungsi_np | _konstanta_np
+            ):
+                raise ValueError(f"Atribut '{node.attr}' tidak diizinkan dalam fungsi.")
+            nama_np.add(id(node.value))
+        elif isinstance(node, ast.Name):
+            if (
+                node.id not in (*variabel, "sqrt", "pi", "e")
+                and id(node) not in nama_np
+            ):
+                raise ValueError(f"Nama '{node.id}' tidak dikenal dalam fungsi.")
+        elif isinstance(node, ast.Call):
+            fungsi_valid = (
+                isinstance(node.func, ast.Attribute) and node.func.attr in _fungsi_np
+            ) or (isinstance(node.func, ast.Name) and node.func.id == "sqrt")
+            # log(x, basis) dihasilkan parse_latex untuk \ln dan \log_b
+            maks_argumen = (
+                2
+                if isinstance(node.func, ast.Attribute) and node.func.attr == "log"
+                else 1
+            )
+            if (
+                not fungsi_valid
+                or node.keywords
+                or not 1 <= len(node.args) <= maks_argumen
+            ):
+                raise ValueError("Pemanggilan fungsi tidak diizinkan dalam fungsi.")
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            pangkat = _nilai_konstan(node.right)
+            if pangkat is not None and not abs(pangkat) <= EXPR_MAX_EXPONENT:
+                raise ValueError(
+                    f"Pangkat dalam fungsi terlalu besar (maksimum {EXPR_MAX_EXPONENT:g})."
+                )
+    return pohon
+
+
+class _KeNumpy(ast.NodeTransformer):
+    # Konstanta bulat menjadi float agar tidak ada aritmetika bilangan bulat
+    # besar, dan log(a, b) menjadi log(a) / log(b)
+    def visit_Constant(self, node):
+        return ast.copy_location(ast.Constant(value=float(node.value)), node)
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if len(node.args) == 2:
+            pembilang = ast.Call(func=node.func, args=[node.args[0]], keywords=[])
+            penyebut = ast.Call(func=node.func, args=[node.args[1]], keywords=[])
+            return ast.copy_location(
+                ast.BinOp(left=pembilang, op=ast.Div(), right=penyebut), node
+            )
+        return node
+
+
+def to_sympy(fungsi_str: str, variabel=("x",)):
+    """
+    Mengkonversi string fungsi Python (hasil `parse_latex_to_python`) ke ekspresi sympy.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string, misal "np.sin(x) + x**2".
+        variabel (tuple[str]): Nama variabel bebas yang boleh dipakai
+
+    Returns:
+        sympy.Expr: Ekspresi sympy yang ekuivalen
+
+    Raises:
+        ValueError: Jika string tidak dapat dikonversi
+    """
+    kunci = (normalisasi_fungsi(fungsi_str), tuple(variabel))
+    hasil = _sympy_cache.get(kunci)
+    if hasil is not None:
+        return hasil
+
+    validasi_ekspresi(fungsi_str, variabel)
+    try:
+        hasil = parse_expr(
+            fungsi_str,
+            local_dict={
+                "np": _np_sympy,
+                "sqrt": sympy.sqrt,
+                "pi": sympy.pi,
+                "e": sympy.E,
+            },
+        )
+    except Exception as e:
+        raise ValueError(f"Error saat mengkonversi fungsi '{fungsi_str}': {e}")
+    _sympy_cache.set(kunci, hasil)
+    return hasil
+
+
+def normalisasi_fungsi(fungsi_str: str) -> str:
+    """
+    Menormalisasi string fungsi agar ekspresi yang sama menghasilkan kunci cache yang sama.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string, misal "x**3 + x**2".
+
+    Returns:
+        str: Fungsi tanpa spasi
+    """
+    return "".join(fungsi_str.split())
+
+
+def compile_func(fungsi_str: str, np_alias=np, variabel=("x",)):
+    """
+    Mengkompilasi string fungsi menjadi callable f(x) yang dapat dipakai berulang kali.
+
+    Hasil kompilasi disimpan di cache LRU sehingga ekspresi yang sama hanya
+    di-parse dan dikompilasi sekali.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string, misal "x**3 + x**2".
+        np_alias: Alias untuk library numpy yang bisa digunakan dalam fungsi_str.
+        variabel (tuple[str]): Nama argumen callable, misal ("x", "y") untuk f(x, y)
+
+    Returns:
+        callable: Fungsi f(x) (atau f(x, y, ...)) yang mengembalikan hasil evaluasi
+
+    Raises:
+        ValueError: Jika fungsi mengandung kesalahan sintaks
+    """
+    variabel = tuple(variabel)
+    kunci = (normalisasi_fungsi(fungsi_str), id(np_alias), variabel)
+    fungsi = _compiled_cache.get(kunci)
+    if fungsi is None:
+        fungsi = _buat_callable(fungsi_str, np_alias, variabel)
+        _compiled_cache.set(kunci, fungsi)
+    return fungsi
+
+
+def fungsi_tercompile(fungsi_str: str, np_alias=np, variabel=("x",)) -> bool:
+    """
+    Memeriksa apakah fungsi sudah dikompilasi dan ada di cache.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string
+        np_alias: Alias untuk library numpy
+        variabel (tuple[str]): Nama argumen callable
+
+    Returns:
+        bool: True jika sudah ada di cache
+    """
+    kunci = (normalisasi_fungsi(fungsi_str), id(np_alias), tuple(variabel))
+    return kunci in _compiled_cache
+
+
+def _buat_callable(fungsi_str: str, np_alias, variabel=("x",)):
+    pohon = _KeNumpy().visit(validasi_ekspresi(fungsi_str, variabel))
+    pembungkus = ast.parse(f"lambda {', '.join(variabel)}: 0", mode="eval")
+    pembungkus.body.body = pohon.body
+    kode = compile(ast.fix_missing_locations(pembungkus), "<fungsi>", "eval")
+
+    # Hanya atribut numpy yang ada di daftar putih yang dapat diakses
+    np_terbatas = SimpleNamespace(
+        **{nama: getattr(np_alias, nama) for nama in _fungsi_np | _konstanta_np}
+    )
+    allowed_names = {
+        "__builtins__": {},
+        "np": np_terbatas,
+        "sqrt": np_alias.sqrt,
+        "pi": np_alias.pi,
+        "e": np_alias.e,
+    }
+    lambda_fungsi = eval(kode, allowed_names)
+
+    def fungsi(*nilai):
+        try:
+            return lambda_fungsi(*nilai)
+        except Exception as e:
+            titik = ", ".join(f"{nama}={v}" for nama, v in zip(variabel, nilai))
+            raise ValueError(
+                f"Error saat mengevaluasi fungsi '{fungsi_str}' pada {titik}: {e}"
+            )
+
+    return fungsi
+
+
+def _evaluasi_ulang_tak_hingga(f, hasil: np.ndarray, koordinat):
+    # Titik dengan hasil NaN/inf dievaluasi ulang satu per satu dengan float Python
+    # agar error domain (misal 1/0) tetap dilaporkan seperti `eval_func`; nilai
+    # tak hingga yang sah (misal np.log(0) = -inf) dipertahankan
+    gagal = np.flatnonzero(~np.isfinite(hasil))
+    if gagal.size == 0:
+        return hasil
+    hasil_datar = hasil.reshape(-1)
+    koordinat_datar = [k.reshape(-1) for k in koordinat]
+    with np.errstate(all="ignore"):
+        for i in gagal:
+            hasil_datar[i] = f(*[float(k[i]) for k in koordinat_datar])
+    return hasil
+
+
+def eval_func_array(fungsi_str: str, xs, np_alias=np):
+    """
+    Mengevaluasi string fungsi matematika pada banyak titik sekaligus.
+
+    Fungsi terkompilasi dipanggil sekali dengan seluruh array. Hanya jika
+    pemanggilan itu gagal atau hasilnya bukan angka yang dapat di-broadcast ke
+    bentuk `xs`, evaluasi diulang per titik. Titik yang bernilai tak hingga/NaN
+    saja yang dievaluasi ulang, agar perilakunya sama dengan `eval_func`.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string, misal "x**3 + x**2".
+        xs (array-like): Titik-titik x untuk evaluasi.
+        np_alias: Alias untuk library numpy yang bisa digunakan dalam fungsi_str.
+
+    Returns:
+        np.ndarray: Hasil evaluasi fungsi pada setiap titik (dtype float)
+
+    Raises:
+        ValueError: Jika terjadi error saat mengevaluasi fungsi
+    """
+    f = compile_func(fungsi_str, np_alias)
+    xs = np.asarray(xs, dtype=float)
+    try:
+        with np.errstate(all="ignore"):
+            hasil = np.asarray(f(xs))
+        if hasil.dtype.kind in "biuf":
+            hasil = np.broadcast_to(hasil, xs.shape).astype(float)
+    except (ValueError, TypeError):
+        hasil = None
+    if hasil is not None and hasil.dtype.kind == "f":
+        return _evaluasi_ulang_tak_hingga(f, hasil, [xs])
+
+    # Fallback: evaluasi per titik
+    with np.errstate(all="ignore"):
+        hasil = [f(float(x_i)) for x_i in xs.ravel()]
+    return np.array(hasil, dtype=float).reshape(xs.shape)
+
+
+def eval_func_grid(fungsi_str: str, koordinat, np_alias=np, variabel=("x", "y", "z")):
+    """
+    Mengevaluasi fungsi beberapa variabel pada grid atau kumpulan titik sekaligus.
+
+    Seperti `eval_func_array`: fungsi terkompilasi dipanggil sekali dengan seluruh
+    array, evaluasi diulang per titik hanya jika pemanggilan itu gagal, dan titik
+    bernilai tak hingga/NaN dievaluasi ulang satu per satu.
+
+    Args:
+        fungsi_str (str): Fungsi sebagai string, misal "x*y + np.sin(z)".
+        koordinat (list[array-like]): Satu array per variabel, saling broadcast
+            (misal hasil `np.meshgrid(..., sparse=True)`)
+        np_alias: Alias untuk library numpy yang bisa digunakan dalam fungsi_str.
+        variabel (tuple[str]): Nama variabel sesuai urutan `koordinat`
+
+    Returns:
+        np.ndarray: Hasil evaluasi dengan bentuk hasil broadcast `koordinat`
+
+    Raises:
+        ValueError: Jika terjadi error saat mengevaluasi fungsi
+    """
+    f = compile_func(fungsi_str, np_alias, variabel)
+    koordinat = np.broadcast_arrays(*[np.asarray(k, dtype=float) for k in koordinat])
+    try:
+        with np.errstate(all="ignore"):
+            hasil = np.asarray(f(*koordinat))
+        if hasil.dtype.kind in "biuf":
+            hasil = np.broadcast_to(hasil, koordinat[0].shape).astype(float)
+    except (ValueError, TypeError):
+        hasil = None
+    if hasil is not None and hasil.dtype.kind == "f":
+        return _evaluasi_ulang_tak_hingga(f, hasil, koordinat)
+
+    # Fallback: evaluasi per titik
+    titik = zip(*[k.ravel().tolist() for k in koordinat])
+    with np.errstate(all="ignore"):
+        hasil = [f(*t) for t in titik]
+    return np.array(hasil, dtype=float).reshape(koordinat[0].shape)
+
+
+def compiled_cache_stats() -> dict:
+    """
+    Mengambil statistik cache fungsi terkompilasi.
+
+    Returns:
+        dict: Jumlah hit, miss, eviction, ukuran saat ini, dan ukuran maksimum
+    """
+    return _compiled_cache.stats()
 
 
 def eval_func(fungsi_str: str, x: float, np_alias=np):
@@ -53,25 +629,7 @@ def eval_func(fungsi_str: str, x: float, np_alias=np):
     Raises:
         ValueError: Jika terjadi error saat mengevaluasi fungsi
     """
-    try:
-        allowed_names = {
-            "x": x,
-            "np": np_alias,
-            "sqrt": np_alias.sqrt,
-            "pi": np_alias.pi,
-            "e": np_alias.e,
-        }
-        return eval(fungsi_str, {"__builtins__": {}}, allowed_names)
-    # except NameError as e:
-    #     raise ValueError(
-    #         f"Error: Nama tidak dikenal dalam fungsi: {e}. Pastikan menggunakan hanya variabel 'x'."
-    #     )
-    except SyntaxError as e:
-        raise ValueError(f"Error: Kesalahan sintaks dalam fungsi: {e}")
-    except Exception as e:
-        raise ValueError(
-            f"Error saat mengevaluasi fungsi '{fungsi_str}' pada x={x}: {e}"
-        )
+    return compile_func(fungsi_str, np_alias)(x)
 
 
 def hitung_error(numerik: float, analitik: float):
@@ -109,6 +667,26 @@ def hitung_error_persen(hasil_numerik, hasil_analitik):
     return round(error_persen, 3)
 
 
+def hitung_error_persen_array(hasil_numerik, hasil_analitik):
+    """
+    Versi tervektorisasi dari `hitung_error_persen`.
+
+    Args:
+        hasil_numerik (array-like): Hasil dari perhitungan metode numerik
+        hasil_analitik (array-like): Hasil dari perhitungan metode analitik
+
+    Returns:
+        np.ndarray: Nilai error dalam persen
+    """
+    numerik = np.asarray(hasil_numerik, dtype=float)
+    analitik = np.asarray(hasil_analitik, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hasil_error = np.where(
+            analitik == 0, np.abs(numerik), np.abs((numerik - analitik) / analitik)
+        )
+    return np.round(hasil_error * 100, 3)
+
+
 def hitung_h(batas_bawah: float, batas_atas: float, N: int):
     """
     Menghitung ukuran langkah (step size) h jika diketahui nilai N
@@ -0,0 +1,100 @@
+"""
+Klien HTTP minimal untuk benchmark, tanpa dependency tambahan.
+
+- `AsgiClient` memanggil aplikasi ASGI langsung di proses yang sama.
+- `HttpClient` mengirim permintaan HTTP/1.1 ke server yang sedang berjalan.
+"""
+
+import asyncio
+from urllib.parse import urlencode, urlsplit
+
+
+class AsgiClient:
+    """
+    Memanggil aplikasi ASGI (misal FastAPI) secara langsung di event loop saat ini.
+
+    Args:
+        app: Aplikasi ASGI
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method: str, path: str, data: dict = None):
+        """
+        Mengirim satu permintaan dan mengembalikan (status, body).
+        """
+        body = urlencode(data or {}).encode()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"host", b"benchmark"),
+                (b"content-type", b"application/x-www-form-urlencoded"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("benchmark", 80),
+        }
+        terkirim = False
+        status = None
+        potongan = []
+
+        async def receive():
+            nonlocal terkirim
+            if not terkirim:
+                terkirim = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await asyncio.Event().wait()
+
+        async def send(pesan):
+            nonlocal status
+            if pesan["type"] == "http.response.start":
+                status = pesan["status"]
+            elif pesan["type"] == "http.response.body":
+                potongan.append(pesan.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return status, b"".join(potongan)
+
+
+class HttpClient:
+    """
+    Mengirim permintaan HTTP/1.1 (satu koneksi per permintaan) ke server.
+
+    Args:
+        base_url (str): URL server, misal "http://127.0.0.1:8000"
+    """
+
+    def __init__(self, base_url: str):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or 80
+
+    async def request(self, method: str, path: str, data: dict = None):
+        """
+        Mengirim satu permintaan dan mengembalikan (status, body).
+        """
+        body = urlencode(data or {}).encode()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        header = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}\r\n"
+            "Content-Type: application/x-www-form-urlencoded\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(header.encode() + body)
+        await writer.drain()
+        respons = await reader.read()
+        writer.close()
+        baris_status, _, sisa = respons.partition(b"\r\n")
+        _, _, isi = sisa.partition(b"\r\n\r\n")
+        return int(baris_status.split()[1]), isi
@@ -0,0 +1,164 @@
+"""
+Load test campuran permintaan berat dan ringan untuk API Metode Numerik.
+
+Permintaan berat adalah integral dengan N besar, permintaan ringan adalah
+turunan sederhana dan health check. Jika komputasi memblokir event loop,
+latensi permintaan ringan akan ikut naik mengikuti permintaan berat.
+
+Contoh:
+    # in-process (tanpa server)
+    python benchmarks/loadtest.py --durasi 10
+
+    # terhadap server yang sedang berjalan
+    python benchmarks/loadtest.py --url http://127.0.0.1:8000 --durasi 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from asgi_client import AsgiClient, HttpClient  # noqa: E402
+
+
+def persentil(data, p: float) -> float:
+    """
+    Menghitung persentil ke-p (0-100) dengan interpolasi linear.
+    """
+    if not data:
+        return float("nan")
+    urut = sorted(data)
+    posisi = (len(urut) - 1) * p / 100
+    bawah = int(posisi)
+    atas = min(bawah + 1, len(urut) - 1)
+    return urut[bawah] + (urut[atas] - urut[bawah]) * (posisi - bawah)
+
+
+def ringkas(latensi, status) -> dict:
+    """
+    Meringkas latensi (detik) dan kode status satu jenis permintaan.
+    """
+    return {
+        "jumlah": len(latensi),
+        "p50_ms": round(persentil(latensi, 50) * 1000, 2),
+        "p99_ms": round(persentil(latensi, 99) * 1000, 2),
+        "maks_ms": round(max(latensi) * 1000, 2) if latensi else None,
+        "status": {str(k): status.count(k) for k in sorted(set(status))},
+    }
+
+
+def skenario(N: int) -> dict:
+    urutan = itertools.count()
+    return {
+        # batas_atas dibuat unik agar setiap permintaan berat benar-benar dihitung,
+        # bukan dilayani dari cache respons
+        "berat": (
+            "POST",
+            "/integral/",
+            lambda: {
+                "metode": "trapezoida",
+                "fungsi_latex": "\\sin(x) + x^2",
+                "batas_bawah": 0,
+                "batas_atas": 10 + next(urutan) * 1e-9,
+                "N": N,
+            },
+        ),
+        "ringan": (
+            "POST",
+            "/turunan/",
+            {"metode": "selisih-tengahan", "fungsi_latex": "x^2", "x": 1, "h": 0.01},
+        ),
+        "health": ("GET", "/", None),
+    }
+
+
+async def pekerja(klien, permintaan, batas_waktu, latensi, status):
+    method, path, data = permintaan
+    while time.perf_counter() < batas_waktu:
+        mulai = time.perf_counter()
+        kode, _ = await klien.request(
+            method, path, data() if callable(data) else data
+        )
+        latensi.append(time.perf_counter() - mulai)
+        status.append(kode)
+        # Beri kesempatan pekerja lain berjalan (penting untuk mode in-process)
+        await asyncio.sleep(0.05 if kode == 503 else 0.001)
+
+
+async def jalankan(klien, durasi: float, konkurensi: dict, N: int) -> dict:
+    """
+    Menjalankan load test selama `durasi` detik.
+
+    Args:
+        klien: AsgiClient atau HttpClient
+        durasi (float): Lama pengujian dalam detik
+        konkurensi (dict): Jumlah pekerja paralel per jenis permintaan
+        N (int): Jumlah segmen untuk permintaan berat
+
+    Returns:
+        dict: Ringkasan latensi per jenis permintaan
+    """
+    daftar = skenario(N)
+    # Pemanasan agar parsing dan cache tidak ikut terukur
+    for method, path, data in daftar.values():
+        await klien.request(method, path, data() if callable(data) else data)
+
+    batas_waktu = time.perf_counter() + durasi
+    hasil = {jenis: ([], []) for jenis in daftar}
+    tugas = [
+        pekerja(klien, daftar[jenis], batas_waktu, *hasil[jenis])
+        for jenis, jumlah in konkurensi.items()
+        for _ in range(jumlah)
+    ]
+    await asyncio.gather(*tugas)
+    return {jenis: ringkas(*hasil[jenis]) for jenis in daftar}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url", help="URL server. Jika kosong, app dipanggil in-process."
+    )
+    parser.add_argument("--durasi", type=float, default=10.0)
+    parser.add_argument("--berat", type=int, default=4, help="Pekerja permintaan berat")
+    parser.add_argument(
+        "--ringan", type=int, default=8, help="Pekerja permintaan ringan"
+    )
+    parser.add_argument("--health", type=int, default=2, help="Pekerja health check")
+    parser.add_argument("--N", type=int, default=2_000_000)
+    parser.add_argument("--output", help="Simpan hasil sebagai JSON ke file ini")
+    args = parser.parse_args()
+
+    if args.url:
+        klien = HttpClient(args.url)
+    else:
+        from main import app
+
+        klien = AsgiClient(app)
+
+    hasil = asyncio.run(
+        jalankan(
+            klien,
+            args.durasi,
+            {"berat": args.berat, "ringan": args.ringan, "health": args.health},
+            args.N,
+        )
+    )
+
+    print(f"{'jenis':<8} {'jumlah':>7} {'p50 (ms)':>10} {'p99 (ms)':>10}  status")
+    for jenis, r in hasil.items():
+        print(
+            f"{jenis:<8} {r['jumlah']:>7} {r['p50_ms']:>10} {r['p99_ms']:>10}  {r['status']}"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(hasil, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
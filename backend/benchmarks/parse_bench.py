@@ -0,0 +1,119 @@
+"""
+Benchmark cold start dan latensi hangat parsing LaTeX untuk API Metode Numerik.
+
+Setiap mode dijalankan di proses Python baru agar biaya import, start worker
+simbolik, dan inisialisasi parser ANTLR ikut terukur. Yang diukur:
+
+- import: waktu `import main`
+- startup: waktu lifespan aplikasi (termasuk pemanasan jika aktif)
+- pertama: permintaan pertama setelah startup
+- hangat_hit: permintaan berulang dengan LaTeX yang sama (cache hit), p50
+- hangat_miss: permintaan dengan LaTeX baru pada parser yang sudah panas, p50
+
+Contoh:
+    python benchmarks/parse_bench.py
+    python benchmarks/parse_bench.py --ulang 50 --output parse.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from asgi_client import AsgiClient  # noqa: E402
+from loadtest import persentil  # noqa: E402
+
+
+def permintaan_turunan(fungsi_latex: str) -> dict:
+    return {
+        "metode": "selisih-tengahan",
+        "fungsi_latex": fungsi_latex,
+        "x": 1,
+        "h": 0.01,
+    }
+
+
+async def ukur_permintaan(klien, data: dict) -> float:
+    mulai = time.perf_counter()
+    kode, _ = await klien.request("POST", "/turunan/", data)
+    if kode != 200:
+        raise RuntimeError(f"Permintaan gagal dengan status {kode}")
+    return time.perf_counter() - mulai
+
+
+async def ukur_proses(ulang: int) -> dict:
+    """
+    Mengukur satu proses baru dari import hingga permintaan hangat (dalam ms).
+    """
+    mulai = time.perf_counter()
+    from main import app
+
+    hasil = {"import_ms": (time.perf_counter() - mulai) * 1000}
+    klien = AsgiClient(app)
+
+    mulai = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        hasil["startup_ms"] = (time.perf_counter() - mulai) * 1000
+        hasil["pertama_ms"] = (
+            await ukur_permintaan(klien, permintaan_turunan("x^2"))
+        ) * 1000
+
+        latensi = [
+            await ukur_permintaan(klien, permintaan_turunan("x^2"))
+            for _ in range(ulang)
+        ]
+        hasil["hangat_hit_ms"] = persentil(latensi, 50) * 1000
+
+        # Koefisien berbeda agar setiap LaTeX belum pernah di-parse
+        latensi = [
+            await ukur_permintaan(klien, permintaan_turunan(f"x^2 + {i + 2}x"))
+            for i in range(ulang)
+        ]
+        hasil["hangat_miss_ms"] = persentil(latensi, 50) * 1000
+
+    return {k: round(v, 2) for k, v in hasil.items()}
+
+
+def jalankan_mode(warmup: bool, ulang: int) -> dict:
+    env = {**os.environ, "WARMUP_ON_STARTUP": "1" if warmup else "0"}
+    keluaran = subprocess.run(
+        [sys.executable, __file__, "--anak", "--ulang", str(ulang)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(keluaran.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ulang", type=int, default=20)
+    parser.add_argument("--output", help="Simpan hasil sebagai JSON ke file ini")
+    parser.add_argument("--anak", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.anak:
+        print(json.dumps(asyncio.run(ukur_proses(args.ulang))))
+        return
+
+    hasil = {
+        "tanpa_pemanasan": jalankan_mode(False, args.ulang),
+        "dengan_pemanasan": jalankan_mode(True, args.ulang),
+    }
+    kolom = list(next(iter(hasil.values())))
+    print(f"{'mode':<18}" + "".join(f"{k:>16}" for k in kolom))
+    for mode, r in hasil.items():
+        print(f"{mode:<18}" + "".join(f"{r[k]:>16}" for k in kolom))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(hasil, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
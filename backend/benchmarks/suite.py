@@ -0,0 +1,242 @@
+"""
+Benchmark suite metode numerik dan endpoint API Metode Numerik.
+
+Mengukur fungsi integral (riemann, trapezoida, simpson), turunan (selisih maju,
+tengahan, mundur), parse_latex_to_python, turunan_analitik, dan integral_analitik
+pada korpus fungsi (polinomial, trigonometri, eksponensial/logaritma, rasional)
+dengan N yang bertambah, ditambah load test in-process untuk /turunan/ dan
+/integral/. Hasil ditulis sebagai JSON dan dapat dibandingkan dengan baseline.
+
+Contoh:
+    # simpan baseline
+    python benchmarks/suite.py --output baseline.json
+
+    # bandingkan dengan baseline, exit code 1 jika ada regresi > 20%
+    python benchmarks/suite.py --baseline baseline.json --ambang 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np  # noqa: E402
+
+from asgi_client import AsgiClient  # noqa: E402
+from loadtest import jalankan  # noqa: E402
+
+# Korpus fungsi: nama -> (LaTeX, batas bawah, batas atas, x untuk turunan)
+KORPUS = {
+    "polinomial": ("x^3 - 2x + 1", 0.0, 2.0, 1.0),
+    "trigonometri": ("\\sin(x) + \\cos(2x)", 0.0, 3.0, 1.0),
+    "eksponensial_log": ("e^{x} + \\ln(x + 1)", 0.0, 2.0, 1.0),
+    "rasional": ("\\frac{1}{1 + x^2}", -1.0, 1.0, 0.5),
+}
+
+
+def ukur(fungsi, ulang: int) -> dict:
+    """
+    Menjalankan `fungsi()` sebanyak `ulang` kali dan meringkas waktunya (ms).
+    """
+    waktu = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        waktu.append((time.perf_counter() - mulai) * 1000)
+    return {
+        "median_ms": round(statistics.median(waktu), 4),
+        "min_ms": round(min(waktu), 4),
+        "ulang": ulang,
+    }
+
+
+def ulang_untuk(N: int, ulang: int) -> int:
+    # N besar cukup diulang lebih sedikit agar suite tetap cepat
+    return max(3, min(ulang, int(ulang * 1000 / N)))
+
+
+def benchmark_fungsi(daftar_N, ulang: int) -> dict:
+    """
+    Mengukur fungsi-fungsi di layer services untuk setiap fungsi di korpus.
+    """
+    from services import symbolic, utils
+    from services.derivative_module import (
+        selisih_maju,
+        selisih_mundur,
+        selisih_tengahan,
+        turunan_analitik,
+    )
+    from services.integral_module import (
+        integral_analitik,
+        riemann_integral,
+        simpson_integral,
+        trapezoida_integral,
+    )
+
+    hasil = {}
+    for nama, (latex, a, b, x0) in KORPUS.items():
+        # Parsing: cache dikosongkan agar setiap ulangan benar-benar mem-parsing
+        def parse_miss():
+            utils._parse_cache.memori.clear()
+            utils.parse_latex_to_python(latex)
+
+        hasil[f"parse.miss.{nama}"] = ukur(parse_miss, max(3, ulang // 10))
+        fungsi = utils.parse_latex_to_python(latex)
+        hasil[f"parse.hit.{nama}"] = ukur(
+            lambda: utils.parse_latex_to_python(latex), ulang
+        )
+
+        for N in daftar_N:
+            n_ulang = ulang_untuk(N, ulang)
+            h = (b - a) / N
+            hasil[f"integral.riemann.{nama}.N={N}"] = ukur(
+                lambda: riemann_integral(fungsi, h, a, b), n_ulang
+            )
+            hasil[f"integral.trapezoida.{nama}.N={N}"] = ukur(
+                lambda: trapezoida_integral(fungsi, N, a, b), n_ulang
+            )
+            hasil[f"integral.simpson.{nama}.N={N}"] = ukur(
+                lambda: simpson_integral(fungsi, N, a, b), n_ulang
+            )
+
+        for nama_metode, metode in [
+            ("selisih_maju", selisih_maju),
+            ("selisih_tengahan", selisih_tengahan),
+            ("selisih_mundur", selisih_mundur),
+        ]:
+            hasil[f"turunan.{nama_metode}.{nama}"] = ukur(
+                lambda: metode(fungsi, x0, 1e-3), ulang
+            )
+
+        # Analitik: dingin (cache simbolik kosong) dan hangat (cache terisi)
+        symbolic._symbolic_cache.memori.clear()
+        hasil[f"analitik.turunan.dingin.{nama}"] = ukur(
+            lambda: turunan_analitik(fungsi, x0), 1
+        )
+        hasil[f"analitik.turunan.hangat.{nama}"] = ukur(
+            lambda: turunan_analitik(fungsi, x0), ulang
+        )
+        hasil[f"analitik.integral.dingin.{nama}"] = ukur(
+            lambda: integral_analitik(fungsi, a, b), 1
+        )
+        hasil[f"analitik.integral.hangat.{nama}"] = ukur(
+            lambda: integral_analitik(fungsi, a, b), ulang
+        )
+    return hasil
+
+
+def benchmark_api(durasi: float, N: int) -> dict:
+    """
+    Load test in-process untuk /turunan/ (ringan) dan /integral/ (berat).
+    """
+    from main import app
+
+    async def dengan_lifespan():
+        async with app.router.lifespan_context(app):
+            return await jalankan(
+                AsgiClient(app), durasi, {"berat": 2, "ringan": 4, "health": 0}, N
+            )
+
+    ringkasan = asyncio.run(dengan_lifespan())
+    return {
+        f"api.{jenis}": {"median_ms": r["p50_ms"], **r}
+        for jenis, r in ringkasan.items()
+        if r["jumlah"]
+    }
+
+
+def bandingkan(
+    hasil: dict, baseline: dict, ambang: float, min_selisih_ms: float = 0.05
+) -> list:
+    """
+    Membandingkan median hasil dengan baseline.
+
+    Args:
+        hasil (dict): Hasil benchmark saat ini
+        baseline (dict): Hasil benchmark yang disimpan sebelumnya
+        ambang (float): Kenaikan relatif yang dianggap regresi (0.2 = 20%)
+        min_selisih_ms (float): Kenaikan absolut minimum agar dianggap regresi,
+            untuk mengabaikan derau pada pengukuran yang sangat singkat
+
+    Returns:
+        list[tuple]: (nama, baseline_ms, sekarang_ms, rasio) untuk setiap regresi
+    """
+    regresi = []
+    for nama, r in hasil["hasil"].items():
+        lama = baseline.get("hasil", {}).get(nama)
+        if lama is None or not lama["median_ms"]:
+            continue
+        rasio = r["median_ms"] / lama["median_ms"]
+        if rasio > 1 + ambang and r["median_ms"] - lama["median_ms"] > min_selisih_ms:
+            regresi.append((nama, lama["median_ms"], r["median_ms"], rasio))
+    return regresi
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--N",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000, 100_000, 1_000_000],
+        help="Daftar jumlah segmen untuk metode integral",
+    )
+    parser.add_argument("--ulang", type=int, default=50)
+    parser.add_argument(
+        "--durasi", type=float, default=5.0, help="Lama load test API (detik)"
+    )
+    parser.add_argument("--N-api", type=int, default=100_000)
+    parser.add_argument("--tanpa-api", action="store_true")
+    parser.add_argument("--output", help="Simpan hasil sebagai JSON ke file ini")
+    parser.add_argument("--baseline", help="File JSON hasil sebelumnya")
+    parser.add_argument(
+        "--ambang",
+        type=float,
+        default=0.2,
+        help="Kenaikan median relatif yang dianggap regresi",
+    )
+    parser.add_argument(
+        "--min-selisih-ms",
+        type=float,
+        default=0.05,
+        help="Kenaikan median absolut minimum yang dianggap regresi",
+    )
+    args = parser.parse_args()
+
+    hasil = {
+        "meta": {
+            "waktu": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu": os.cpu_count(),
+        },
+        "hasil": benchmark_fungsi(args.N, args.ulang),
+    }
+    if not args.tanpa_api:
+        hasil["hasil"].update(benchmark_api(args.durasi, args.N_api))
+
+    for nama, r in hasil["hasil"].items():
+        print(f"{nama:<52} {r['median_ms']:>12.4f} ms")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(hasil, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regresi = bandingkan(hasil, json.load(f), args.ambang, args.min_selisih_ms)
+        for nama, lama, baru, rasio in regresi:
+            print(f"REGRESI {nama}: {lama} ms -> {baru} ms ({rasio:.2f}x)")
+        if regresi:
+            sys.exit(1)
+        print("Tidak ada regresi terhadap baseline.")
+
+
+if __name__ == "__main__":
+    main()
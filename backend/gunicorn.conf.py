@@ -0,0 +1,34 @@
+import os
+import tempfile
+
+# --- Profil deployment multi-worker ---
+# Gunicorn sebagai proses master, uvicorn sebagai worker ASGI.
+# Jalankan dari direktori backend: gunicorn -c gunicorn.conf.py
+# Semua nilai di bawah dapat diubah melalui environment variable.
+
+# Cache parsing LaTeX dan hasil simbolik dibagi antar worker lewat satu file SQLite.
+# Di-set di sini karena config aplikasi dibaca saat aplikasi diimpor.
+os.environ.setdefault(
+    "SHARED_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "metode-numerik-cache.sqlite"),
+)
+# Worker simbolik di-fork dari forkserver yang sudah memuat sympy dan parser ANTLR
+os.environ.setdefault("SYMBOLIC_POOL_START_METHOD", "forkserver")
+
+wsgi_app = "main:app"
+chdir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Aplikasi (numpy, sympy, parser ANTLR) diimpor sekali di master sebelum fork,
+# sehingga memorinya dibagi copy-on-write oleh semua worker
+preload_app = True
+
+
+def on_starting(server):
+    # Mengisi cache di master (setelah aplikasi dipramuat) agar setiap worker
+    # yang di-fork, termasuk worker pengganti, langsung mulai dalam keadaan panas
+    from main import pramuat
+
+    pramuat()
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Komputasi simbolik dijalankan langsung (tanpa process pool) dan tanpa
+# pemanasan agar tes cepat; di-set sebelum config aplikasi diimpor
+os.environ.setdefault("SYMBOLIC_POOL_SIZE", "0")
+os.environ.setdefault("WARMUP_ON_STARTUP", "0")
+
+# Modul aplikasi diimpor seperti saat server dijalankan dari backend/app
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "app"))
@@ -0,0 +1,35 @@
+import pytest
+
+from services.analisis import analisis_fungsi, latex_polinomial, polinomial_fungsi
+
+
+@pytest.mark.parametrize(
+    "fungsi, kelas, derajat, mulus",
+    [
+        ("x**3 + 2*x", "polinomial", 3, True),
+        ("x/2", "polinomial", 1, True),
+        ("1/(x**2 + 1)", "rasional", None, False),
+        ("np.abs(x)", "piecewise", None, False),
+        ("np.sin(x)", "elementer", None, True),
+        ("np.log(x)", "elementer", None, False),
+    ],
+)
+def test_analisis_fungsi(fungsi, kelas, derajat, mulus):
+    analisis = analisis_fungsi(fungsi)
+    assert analisis.kelas == kelas
+    assert analisis.derajat == derajat
+    assert analisis.mulus is mulus
+    assert analisis.komposisi_transenden is False
+
+
+def test_komposisi_transenden():
+    assert analisis_fungsi("np.exp(np.sin(x))").komposisi_transenden is True
+
+
+def test_polinomial_fungsi():
+    assert list(polinomial_fungsi("x**2 + 3").coef) == [3.0, 0.0, 1.0]
+    assert polinomial_fungsi("np.sin(x)") is None
+    assert (
+        latex_polinomial(polinomial_fungsi("x**2 - 3*x + 0.5"))
+        == r"x^{2} - 3 x + \frac{1}{2}"
+    )
@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks")
+)
+
+import suite  # noqa: E402
+
+
+def _hasil(**median_ms):
+    return {"hasil": {nama: {"median_ms": nilai} for nama, nilai in median_ms.items()}}
+
+
+def test_bandingkan_mendeteksi_regresi():
+    baseline = _hasil(cepat=1.0, lambat=1.0, baru=1.0)
+    hasil = _hasil(cepat=1.1, lambat=2.0, lain=5.0)
+    assert suite.bandingkan(hasil, baseline, ambang=0.2) == [("lambat", 1.0, 2.0, 2.0)]
+
+
+def test_bandingkan_mengabaikan_derau_kecil():
+    # Naik 3x tetapi hanya 0.02 ms: di bawah min_selisih_ms
+    assert suite.bandingkan(_hasil(a=0.03), _hasil(a=0.01), ambang=0.2) == []
+
+
+def test_ukur():
+    ringkasan = suite.ukur(lambda: None, ulang=5)
+    assert ringkasan["ulang"] == 5
+    assert 0 <= ringkasan["min_ms"] <= ringkasan["median_ms"]
+
+
+def test_benchmark_fungsi_mencakup_korpus():
+    hasil = suite.benchmark_fungsi([10], ulang=1)
+    for nama in suite.KORPUS:
+        assert f"integral.simpson.{nama}.N=10" in hasil
+        assert hasil[f"parse.miss.{nama}"]["median_ms"] > 0
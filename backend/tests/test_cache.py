@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from services.cache import LRUCache, SQLiteCache, TieredCache, TTLCache
+
+
+def test_lru_membuang_entri_terlama():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # "a" menjadi yang terbaru dipakai sehingga "b" yang dibuang
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 0,
+        "evictions": 1,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_lru_miss_dan_default():
+    cache = LRUCache(maxsize=1)
+    assert cache.get("tidak-ada", "default") == "default"
+    assert cache.misses == 1
+
+
+def test_lru_maxsize_tidak_valid():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_sqlite_cache_persisten(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    SQLiteCache(path).set("kunci", "nilai")
+    # Instance baru (misal setelah restart) membaca file yang sama
+    assert SQLiteCache(path).get("kunci") == "nilai"
+    assert SQLiteCache(path).get("lain", "default") == "default"
+
+
+def test_sqlite_cache_tabel_terpisah(tmp_path):
+    # Satu file dipakai bersama oleh beberapa cache (misal parse dan simbolik)
+    path = str(tmp_path / "shared.sqlite")
+    SQLiteCache(path, tabel="parse").set("kunci", "parse")
+    SQLiteCache(path, tabel="simbolik").set("kunci", "simbolik")
+    assert SQLiteCache(path, tabel="parse").get("kunci") == "parse"
+    assert SQLiteCache(path, tabel="simbolik").get("kunci") == "simbolik"
+
+
+def test_tiered_cache_memuat_dari_disk(tmp_path):
+    disk = SQLiteCache(str(tmp_path / "cache.sqlite"))
+    TieredCache(LRUCache(), disk, serialize=str, deserialize=int).set("a", 1)
+
+    cache = TieredCache(LRUCache(), disk, serialize=str, deserialize=int)
+    assert cache.get("a") == 1
+    assert cache.stats()["disk_hits"] == 1
+    # Hit berikutnya dari memori
+    assert cache.get("a") == 1
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_tiered_cache_get_or_compute():
+    cache = TieredCache(LRUCache())
+    jumlah_hitung = []
+
+    def hitung():
+        jumlah_hitung.append(1)
+        return "hasil"
+
+    assert cache.get_or_compute("k", hitung) == "hasil"
+    assert cache.get_or_compute("k", hitung) == "hasil"
+    assert len(jumlah_hitung) == 1
+
+
+def test_ttl_cache_kedaluwarsa():
+    cache = TTLCache(maxsize=4, ttl=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.1)
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.expirations == 1
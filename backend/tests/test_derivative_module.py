@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from services.derivative_module import (
+    h_optimal,
+    koefisien_fornberg,
+    selisih_array,
+    selisih_maju,
+    selisih_mundur,
+    selisih_tengahan,
+    titik_stensil,
+    turunan_analitik,
+    turunan_analitik_array,
+    turunan_kompleks,
+    turunan_kompleks_array,
+    turunan_richardson,
+    turunan_stensil,
+)
+
+
+def test_selisih_hingga():
+    assert selisih_maju("x**2", 1.0, 0.1) == 2.1
+    assert selisih_mundur("x**2", 1.0, 0.1) == 1.9
+    assert selisih_tengahan("x**2", 1.0, 0.1) == 2.0
+
+
+def test_selisih_array_sama_dengan_skalar():
+    x = np.array([0.5, 1.0, 2.0])
+    for metode, fungsi in [
+        ("selisih-maju", selisih_maju),
+        ("selisih-tengahan", selisih_tengahan),
+        ("selisih-mundur", selisih_mundur),
+    ]:
+        hasil = selisih_array("np.sin(x)", metode, x, np.full(3, 0.01))
+        assert hasil.tolist() == [fungsi("np.sin(x)", x_i, 0.01) for x_i in x]
+
+
+def test_turunan_analitik_array():
+    nilai, turunan_latex = turunan_analitik_array("x**2", np.array([1.0, 2.0]))
+    np.testing.assert_array_equal(nilai, [2.0, 4.0])
+    assert turunan_latex == "2 x"
+
+
+@pytest.mark.parametrize(
+    "orde, titik, koefisien",
+    [
+        (1, [-1, 0, 1], [-1 / 2, 0, 1 / 2]),
+        (2, [-1, 0, 1], [1, -2, 1]),
+        (1, [-2, -1, 0, 1, 2], [1 / 12, -2 / 3, 0, 2 / 3, -1 / 12]),
+        (1, [0, 1, 2], [-3 / 2, 2, -1 / 2]),
+    ],
+)
+def test_koefisien_fornberg(orde, titik, koefisien):
+    np.testing.assert_allclose(koefisien_fornberg(orde, titik), koefisien, atol=1e-14)
+
+
+def test_koefisien_fornberg_titik_kurang():
+    with pytest.raises(ValueError):
+        koefisien_fornberg(2, [0, 1])
+
+
+def test_titik_stensil():
+    np.testing.assert_array_equal(titik_stensil(1, 4), [-2, -1, 0, 1, 2])
+    np.testing.assert_array_equal(titik_stensil(1, 2, "maju"), [0, 1, 2])
+    with pytest.raises(ValueError):
+        titik_stensil(1, 3)
+
+
+@pytest.mark.parametrize(
+    "fungsi, x, orde, hasil",
+    [("np.sin(x)", 0.0, 1, 1.0), ("x**3", 2.0, 2, 12.0), ("np.exp(x)", 0.0, 3, 1.0)],
+)
+def test_turunan_stensil(fungsi, x, orde, hasil):
+    assert turunan_stensil(fungsi, x, 1e-2, orde_turunan=orde, orde_akurasi=4) == hasil
+
+
+def test_turunan_richardson():
+    nilai, estimasi_error = turunan_richardson("np.exp(x)", 0.0, 0.1)
+    assert nilai == 1.0
+    assert estimasi_error < 1e-6
+
+
+def test_h_optimal_diskalakan_dengan_x():
+    assert h_optimal(100.0) == pytest.approx(100 * h_optimal(0.0))
+
+
+def test_turunan_kompleks():
+    assert turunan_kompleks("x**3", 2.0) == 12.0
+    assert turunan_kompleks("np.log(x)", 2.0) == 0.5
+    # Tanpa pengurangan, sehingga h sangat kecil tidak menimbulkan pembatalan
+    np.testing.assert_allclose(
+        turunan_kompleks_array("np.sin(x)", np.array([0.0, np.pi])), [1.0, -1.0]
+    )
+
+
+def test_turunan_analitik_array_titik_tidak_real():
+    hasil, _ = turunan_analitik_array("np.sqrt(x)", [-1.0, 4.0])
+    assert np.isnan(hasil[0])
+    assert hasil[1] == 0.25
+
+
+@pytest.mark.parametrize("fungsi, x", [("np.abs(x)", 1.0), ("np.abs(x)", -2.0)])
+def test_turunan_kompleks_nilai_mutlak_ditolak(fungsi, x):
+    # Regresi: Im|x + ih| / h = 0, bukan sign(x)
+    with pytest.raises(ValueError):
+        turunan_kompleks(fungsi, x)
+
+
+@pytest.mark.parametrize("fungsi", ["np.log(x)", "np.sqrt(x)"])
+def test_turunan_kompleks_di_luar_domain_real(fungsi):
+    with pytest.raises(ValueError):
+        turunan_kompleks(fungsi, -1.0)
+
+
+def test_turunan_kompleks_array_titik_tidak_valid():
+    hasil = turunan_kompleks_array("np.log(x)", np.array([-1.0, 2.0]))
+    assert np.isnan(hasil[0])
+    assert hasil[1] == pytest.approx(0.5)
+
+
+def test_turunan_analitik_tidak_hingga_ditolak():
+    with pytest.raises(ValueError, match="tidak bernilai real"):
+        turunan_analitik("np.log(x)", 0.0)
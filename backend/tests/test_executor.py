@@ -0,0 +1,36 @@
+import asyncio
+import threading
+
+import pytest
+
+from services import executor
+from services.executor import ComputeQueueFullError, compute_stats, run_compute
+
+
+def test_run_compute():
+    assert asyncio.run(run_compute(pow, 2, 10)) == 1024
+    assert compute_stats()["aktif"] == 0
+
+
+def test_antrian_penuh(monkeypatch):
+    monkeypatch.setattr(executor, "_aktif", compute_stats()["kapasitas"])
+    with pytest.raises(ComputeQueueFullError):
+        asyncio.run(run_compute(pow, 2, 10))
+
+
+def test_slot_dilepas_saat_thread_selesai():
+    # Regresi: pembatalan permintaan dulu melepas slot selagi thread masih menghitung
+    lanjut = threading.Event()
+
+    async def batalkan():
+        tugas = asyncio.ensure_future(run_compute(lanjut.wait, 5))
+        await asyncio.sleep(0.1)
+        tugas.cancel()
+        await asyncio.sleep(0.1)
+        aktif = compute_stats()["aktif"]
+        lanjut.set()
+        await asyncio.sleep(0.1)
+        return aktif
+
+    assert asyncio.run(batalkan()) == 1
+    assert compute_stats()["aktif"] == 0
@@ -0,0 +1,166 @@
+import math
+
+import numpy as np
+import pytest
+
+from services import integral_module
+from services.integral_module import (
+    adaptif_integral,
+    bobot_simpson,
+    bobot_trapezoida,
+    derajat_kuadratur_eksak,
+    gauss_legendre_integral,
+    grid_riemann,
+    integral_panel,
+    riemann_integral,
+    romberg_integral,
+    simpson_integral,
+    tabel_gauss_legendre,
+    tanh_sinh_integral,
+    trapezoida_integral,
+)
+from services.symbolic_pool import SymbolicTimeoutError
+
+
+def test_grid_riemann_menyertakan_batas_atas():
+    # 0.1 * 10 tidak tepat 1.0 dalam floating point, titik terakhir tetap ikut
+    x = grid_riemann(0.1, 0, 1)
+    assert x.size == 11
+    assert x[-1] == pytest.approx(1.0)
+
+
+def test_bobot():
+    np.testing.assert_array_equal(bobot_trapezoida(3), [0.5, 1, 1, 0.5])
+    np.testing.assert_allclose(bobot_simpson(4), np.array([1, 4, 2, 4, 1]) / 3)
+
+
+@pytest.mark.parametrize(
+    "hitung, hasil",
+    [
+        (lambda: riemann_integral("x**2", 0.01, 0, 1), 0.338),
+        (lambda: trapezoida_integral("x**2", 100, 0, 1), 0.333),
+        (lambda: simpson_integral("x**3", 2, 0, 2), 4.0),
+        (lambda: simpson_integral("np.sin(x)", 10, 0, np.pi), 2.0),
+    ],
+)
+def test_metode_dasar(hitung, hasil):
+    assert hitung() == hasil
+
+
+def test_h_nol():
+    with pytest.raises(ValueError):
+        riemann_integral("x", 0, 0, 1)
+
+
+def test_adaptif():
+    nilai, estimasi_error, jumlah_evaluasi = adaptif_integral("np.sin(x)", 0, np.pi)
+    assert nilai == 2.0
+    assert estimasi_error <= 1e-6
+    assert jumlah_evaluasi < 100
+
+
+def test_adaptif_berhenti_di_maks_evaluasi():
+    _, estimasi_error, jumlah_evaluasi = adaptif_integral(
+        "np.sin(1/x)", 0.001, 1, maks_evaluasi=50
+    )
+    assert jumlah_evaluasi <= 50
+    assert estimasi_error > 1e-6
+
+
+def test_adaptif_toleransi_tidak_positif():
+    with pytest.raises(ValueError):
+        adaptif_integral("x", 0, 1, toleransi=0)
+
+
+def test_romberg():
+    nilai, tabel, estimasi_error, jumlah_evaluasi = romberg_integral(
+        "np.sin(x)", 0, np.pi
+    )
+    assert nilai == 2.0
+    assert estimasi_error <= 1e-6
+    assert [len(baris) for baris in tabel] == list(range(1, len(tabel) + 1))
+    # Titik tingkat sebelumnya dipakai ulang: 2^k + 1 evaluasi untuk k+1 tingkat
+    assert jumlah_evaluasi == 2 ** (len(tabel) - 1) + 1
+
+
+def test_romberg_richardson():
+    # Kolom kedua (Simpson) sudah eksak untuk x^2
+    _, tabel, _, _ = romberg_integral("x**2", 0, 1)
+    assert tabel[0][0] == 0.5
+    assert tabel[1][1] == pytest.approx(1 / 3)
+
+
+def test_tabel_gauss_legendre():
+    titik, bobot = tabel_gauss_legendre(2)
+    np.testing.assert_allclose(titik, [-1 / np.sqrt(3), 1 / np.sqrt(3)])
+    np.testing.assert_allclose(bobot, [1, 1])
+    # Tabel disimpan di cache
+    assert tabel_gauss_legendre(2)[0] is titik
+
+
+def test_gauss_legendre():
+    assert gauss_legendre_integral("np.exp(x)", 5, 0, 1) == 1.718
+    # n titik eksak untuk polinomial derajat 2n - 1
+    assert gauss_legendre_integral("x**5 + x**4", 3, -1, 2) == 17.1
+    assert gauss_legendre_integral("np.sin(x)", 4, 0, np.pi, panel=8) == 2.0
+
+
+def test_gauss_legendre_n_tidak_valid():
+    with pytest.raises(ValueError):
+        gauss_legendre_integral("x", 0, 0, 1)
+
+
+@pytest.mark.parametrize("metode", ["trapezoida", "simpson"])
+def test_integral_panel_sama_dengan_grid_penuh(metode):
+    penuh = integral_panel("np.exp(x)", 1000, 0, 1, metode=metode, ukuran_chunk=2000)
+    # Batas panel jatuh di titik ganjil maupun genap
+    for ukuran_chunk in (7, 64, 333):
+        terbagi = integral_panel(
+            "np.exp(x)", 1000, 0, 1, metode=metode, ukuran_chunk=ukuran_chunk
+        )
+        assert terbagi == pytest.approx(penuh, rel=1e-14)
+
+
+def test_n_besar_memakai_panel(monkeypatch):
+    monkeypatch.setattr(integral_module, "INTEGRAL_CHUNK_SIZE", 100)
+    assert simpson_integral("np.sin(x)", 1000, 0, np.pi) == 2.0
+    assert trapezoida_integral("x**2", 1000, 0, 3) == 9.0
+
+
+def test_tanh_sinh_singularitas_ujung():
+    # 1/sqrt(x) tidak terdefinisi di x = 0, integralnya 2
+    nilai, estimasi_error, _ = tanh_sinh_integral("1/np.sqrt(x)", 0, 1)
+    assert nilai == 2.0
+    assert estimasi_error <= 1e-6
+
+
+def test_tanh_sinh_interval_tak_hingga():
+    nilai, _, _ = tanh_sinh_integral("np.exp(-x**2)", -np.inf, np.inf)
+    assert nilai == round(math.sqrt(math.pi), 3)
+
+
+def test_tanh_sinh_toleransi_tidak_positif():
+    with pytest.raises(ValueError):
+        tanh_sinh_integral("x", 0, 1, toleransi=0)
+
+
+@pytest.mark.parametrize(
+    "metode, kwargs, derajat",
+    [
+        ("trapezoida", {"N": 4}, 1),
+        ("simpson", {"N": 4}, 3),
+        ("simpson", {"N": 3}, None),
+        ("gauss-legendre", {"n_titik": 3}, 5),
+        ("romberg", {}, None),
+    ],
+)
+def test_derajat_kuadratur_eksak(metode, kwargs, derajat):
+    assert derajat_kuadratur_eksak(metode, **kwargs) == derajat
+
+
+def test_integral_analitik_batas_waktu_memakai_integral_tentu(monkeypatch):
+    def lambat(*args, **kwargs):
+        raise SymbolicTimeoutError("batas waktu")
+
+    monkeypatch.setattr(integral_module, "nilai_antiturunan_simbolik", lambat)
+    assert integral_module.integral_analitik("1/x", 1, 2)[0] == 0.693
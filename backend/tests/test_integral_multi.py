@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from services.integral_multi import (
+    barisan_halton,
+    barisan_sobol,
+    integral_grid,
+    qmc_integral,
+    titik_bobot_sumbu,
+)
+
+
+def test_barisan_sobol():
+    np.testing.assert_array_equal(
+        barisan_sobol(range(4), 2),
+        [[0.0, 0.0], [0.5, 0.5], [0.25, 0.75], [0.75, 0.25]],
+    )
+
+
+def test_barisan_halton():
+    np.testing.assert_allclose(
+        barisan_halton(range(4), 2),
+        [[0.0, 0.0], [0.5, 1 / 3], [0.25, 2 / 3], [0.75, 1 / 9]],
+    )
+
+
+@pytest.mark.parametrize("metode", ["sobol", "halton"])
+def test_qmc_integral(metode):
+    nilai, estimasi_error, riwayat = qmc_integral(
+        "x*y", [(0, 1), (0, 1)], metode, n_sampel=4096
+    )
+    assert abs(nilai - 0.25) <= 5e-3
+    assert estimasi_error < 1e-2
+    assert riwayat[-1][0] <= 4096
+
+
+@pytest.mark.parametrize(
+    "metode, n", [("trapezoida", 64), ("simpson", 4), ("gauss-legendre", 2)]
+)
+def test_integral_grid(metode, n):
+    assert integral_grid("x*y*z", [(0, 1), (0, 1), (0, 2)], metode, n) == 0.5
+
+
+@pytest.mark.parametrize("n", [1, 3])
+def test_simpson_n_ganjil_ditolak(n):
+    # Regresi: bobot Simpson untuk N ganjil menghasilkan integral yang salah
+    with pytest.raises(ValueError):
+        titik_bobot_sumbu("simpson", n, 0, 1)
@@ -0,0 +1,37 @@
+from services.metrics import Histogram, PengukurTahap, render_gauge
+
+
+def test_histogram_kumulatif():
+    histogram = Histogram("tes_detik", "Durasi tes.", ("tahap",), (0.1, 1))
+    histogram.observe(0.05, tahap="parse")
+    histogram.observe(0.5, tahap="parse")
+    histogram.observe(5, tahap="parse")
+    assert histogram.render().splitlines() == [
+        "# HELP tes_detik Durasi tes.",
+        "# TYPE tes_detik histogram",
+        'tes_detik_bucket{tahap="parse",le="0.1"} 1',
+        'tes_detik_bucket{tahap="parse",le="1"} 2',
+        'tes_detik_bucket{tahap="parse",le="+Inf"} 3',
+        'tes_detik_sum{tahap="parse"} 5.55',
+        'tes_detik_count{tahap="parse"} 3',
+    ]
+
+
+def test_render_gauge():
+    teks = render_gauge("tes_aktif", "Jumlah aktif.", {(("cache", 'a"b'),): 2, (): 1})
+    assert teks.splitlines()[2:] == ['tes_aktif{cache="a\\"b"} 2', "tes_aktif 1"]
+
+
+def test_pengukur_tahap():
+    pengukur = PengukurTahap()
+    with pengukur.tahap("parse", cache=True):
+        pass
+    with pengukur.tahap("numerik"):
+        pass
+    assert pengukur.cache == {"parse": "hit"}
+    assert [
+        bagian.split(";")[0] for bagian in pengukur.server_timing().split(", ")
+    ] == [
+        "parse",
+        "numerik",
+    ]
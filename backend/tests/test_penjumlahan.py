@@ -0,0 +1,45 @@
+import math
+
+import pytest
+
+from services.integral_module import trapezoida_integral
+from services.penjumlahan import Akumulator, jumlah_kahan, jumlah_naif, jumlahkan
+
+# Penjumlahan naif kehilangan kedua suku 1.0 karena diserap 1e100
+SUKU_SULIT = [1.0, 1e100, 1.0, -1e100]
+
+
+def test_jumlah_naif_kehilangan_presisi():
+    assert jumlah_naif(SUKU_SULIT) == 0.0
+
+
+def test_jumlah_kahan():
+    assert jumlah_kahan(SUKU_SULIT) == 2.0
+    assert jumlah_kahan([0.1] * 10) == math.fsum([0.1] * 10)
+    assert jumlah_kahan([]) == 0.0
+
+
+@pytest.mark.parametrize("mode", ["naif", "kahan", "berpasangan", "fsum"])
+def test_jumlahkan_batas_error(mode):
+    suku = [0.1] * 1000
+    total, batas = jumlahkan(suku, mode)
+    assert abs(total - 100.0) <= batas
+
+
+def test_akumulator_mengumpulkan_estimasi_error():
+    akumulator = Akumulator("fsum")
+    assert akumulator.jumlahkan(SUKU_SULIT) == 2.0
+    assert akumulator.estimasi_error > 0
+
+
+def test_mode_tidak_valid():
+    with pytest.raises(ValueError):
+        Akumulator("acak")
+    with pytest.raises(ValueError):
+        jumlahkan([1.0], "acak")
+
+
+def test_akumulator_pada_integral():
+    akumulator = Akumulator("kahan")
+    assert trapezoida_integral("x", 10, 0, 1, akumulator=akumulator) == 0.5
+    assert 0 < akumulator.estimasi_error < 1e-12
@@ -0,0 +1,79 @@
+import asyncio
+
+from fastapi.responses import JSONResponse
+
+from services.respons_cache import kunci_permintaan, respons_tercache
+
+
+def test_kunci_permintaan_kanonik():
+    kunci = kunci_permintaan("/integral/", "x^{2}", metode="simpson", N=4, h=None)
+    # Spasi LaTeX, urutan parameter, dan parameter None tidak memengaruhi kunci
+    assert kunci == kunci_permintaan("/integral/", " x^{2} ", N=4, metode="simpson")
+    assert kunci != kunci_permintaan("/integral/", "x^2", metode="simpson", N=6)
+    assert kunci != kunci_permintaan("/turunan/", "x^2", metode="simpson", N=4)
+
+
+def test_respons_tercache_single_flight():
+    kunci = kunci_permintaan("/tes/", "x", nama="single-flight")
+    jumlah_hitung = 0
+
+    async def hitung():
+        nonlocal jumlah_hitung
+        jumlah_hitung += 1
+        await asyncio.sleep(0.05)
+        return JSONResponse({"hasil": 1})
+
+    async def jalankan():
+        return await asyncio.gather(
+            *[respons_tercache(kunci, hitung) for _ in range(3)]
+        )
+
+    daftar = asyncio.run(jalankan())
+    assert jumlah_hitung == 1
+    assert sorted(r.headers["X-Cache"] for r in daftar) == [
+        "COALESCED",
+        "COALESCED",
+        "MISS",
+    ]
+
+    respons = asyncio.run(respons_tercache(kunci, hitung))
+    assert respons.headers["X-Cache"] == "HIT"
+    assert jumlah_hitung == 1
+
+    # If-None-Match yang cocok dibalas 304 tanpa isi
+    etag = respons.headers["ETag"]
+    respons = asyncio.run(respons_tercache(kunci, hitung, if_none_match=etag))
+    assert respons.status_code == 304
+
+
+def test_respons_tercache_error_tidak_disimpan():
+    kunci = kunci_permintaan("/tes/", "x", nama="error")
+    jumlah_hitung = 0
+
+    async def hitung():
+        nonlocal jumlah_hitung
+        jumlah_hitung += 1
+        raise ValueError("gagal")
+
+    for _ in range(2):
+        try:
+            asyncio.run(respons_tercache(kunci, hitung))
+        except ValueError:
+            pass
+    assert jumlah_hitung == 2
+
+
+def test_respons_no_store_tidak_disimpan():
+    kunci = kunci_permintaan("/tes/", "x", nama="no-store")
+    jumlah_hitung = 0
+
+    async def hitung():
+        nonlocal jumlah_hitung
+        jumlah_hitung += 1
+        return JSONResponse({"hasil": None}, headers={"Cache-Control": "no-store"})
+
+    for _ in range(2):
+        respons = asyncio.run(respons_tercache(kunci, hitung))
+        assert respons.headers["X-Cache"] == "MISS"
+        assert respons.headers["Cache-Control"] == "no-store"
+    assert jumlah_hitung == 2
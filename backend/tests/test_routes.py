@@ -0,0 +1,399 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from routers import derivative_routes, integral_routes
+from services import executor
+from services.executor import compute_stats
+from services.symbolic_pool import SymbolicUnavailableError
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_integral_simpson(client):
+    respons = client.post(
+        "/integral/",
+        data={
+            "metode": "simpson",
+            "fungsi_latex": "x^2",
+            "batas_bawah": 0,
+            "batas_atas": 3,
+            "N": 6,
+        },
+    )
+    assert respons.status_code == 200
+    assert respons.json()["hasil_numerik"] == 9.0
+    assert respons.json()["hasil_analitik"] == 9.0
+
+
+@pytest.mark.parametrize("akumulasi", ["berpasangan", "kahan"])
+def test_integral_kuadratur_eksak_melaporkan_metode_terpilih(client, akumulasi):
+    respons = client.post(
+        "/integral/",
+        data={
+            "metode": "simpson",
+            "fungsi_latex": "x^3",
+            "batas_bawah": 0,
+            "batas_atas": 2,
+            "N": 10,
+            "akumulasi": akumulasi,
+        },
+    ).json()
+    assert respons["hasil_numerik"] == 4.0
+    # Jumlah evaluasi selalu milik Metode Simpson (N + 1 titik)
+    assert respons["jumlah_evaluasi"] == 11
+    if akumulasi == "berpasangan":
+        assert respons["jalur_numerik"] == "kuadratur-eksak"
+    else:
+        assert respons["jalur_numerik"] == "metode"
+        assert respons["estimasi_error_pembulatan"] > 0
+
+
+def test_turunan(client):
+    respons = client.post(
+        "/turunan/",
+        data={"metode": "selisih-tengahan", "fungsi_latex": "x^3", "x": 2, "h": 0.01},
+    )
+    assert respons.status_code == 200
+    assert respons.json()["hasil_numerik"] == 12.0
+
+
+def test_turunan_metode_tidak_valid_menyertakan_detail(client):
+    # Regresi: detail HTTPException dari dalam perhitungan dulu dibuang
+    respons = client.post(
+        "/turunan/",
+        data={"metode": "acak", "fungsi_latex": "x^2", "x": 1, "h": 0.1},
+    )
+    assert respons.status_code == 400
+    assert "Metode 'acak' tidak valid" in respons.json()["detail"]
+
+
+def test_turunan_tercache(client):
+    data = {"metode": "selisih-maju", "fungsi_latex": "x^3", "x": 2, "h": 0.001}
+    pertama = client.post("/turunan/", data=data)
+    kedua = client.post("/turunan/", data=data)
+    assert pertama.headers["X-Cache"] == "MISS"
+    assert kedua.headers["X-Cache"] == "HIT"
+    assert kedua.json() == pertama.json()
+
+    respons = client.get("/turunan/", params=data)
+    assert respons.headers["X-Cache"] == "HIT"
+    respons = client.get(
+        "/turunan/",
+        params=data,
+        headers={"If-None-Match": pertama.headers["ETag"]},
+    )
+    assert respons.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "modul, nama, endpoint, data",
+    [
+        (
+            derivative_routes,
+            "turunan_analitik_cepat",
+            "/turunan/",
+            {"metode": "selisih-maju", "fungsi_latex": "x^4", "x": 2, "h": 0.001},
+        ),
+        (
+            integral_routes,
+            "integral_analitik_cepat",
+            "/integral/",
+            {
+                "metode": "trapezoida",
+                "fungsi_latex": "x^4",
+                "batas_bawah": 0,
+                "batas_atas": 1,
+                "N": 8,
+            },
+        ),
+    ],
+)
+def test_respons_tanpa_hasil_analitik_tidak_dicache(
+    client, monkeypatch, modul, nama, endpoint, data
+):
+    # Regresi: respons saat worker simbolik timeout dulu tersimpan selama TTL
+    def timeout(*args, **kwargs):
+        raise SymbolicUnavailableError("Komputasi simbolik melebihi batas waktu.")
+
+    monkeypatch.setattr(modul, nama, timeout)
+    for _ in range(2):
+        respons = client.post(endpoint, data=data)
+        assert respons.headers["X-Cache"] == "MISS"
+        assert respons.headers["Cache-Control"] == "no-store"
+        assert respons.json()["hasil_analitik"] is None
+        assert respons.json()["alasan_analitik"]
+
+    monkeypatch.undo()
+    respons = client.post(endpoint, data=data)
+    assert respons.headers["X-Cache"] == "MISS"
+    assert respons.json()["hasil_analitik"] is not None
+    assert client.post(endpoint, data=data).headers["X-Cache"] == "HIT"
+
+
+def test_integral_multi_tanpa_hasil_analitik_tidak_dicache(client, monkeypatch):
+    def timeout(*args, **kwargs):
+        raise SymbolicUnavailableError("Komputasi simbolik melebihi batas waktu.")
+
+    monkeypatch.setattr(integral_routes, "integral_lipat_simbolik", timeout)
+    permintaan = {
+        "fungsi_latex": "x^2 y",
+        "batas": [[0, 1], [0, 1]],
+        "metode": "simpson",
+        "N": 4,
+    }
+    for _ in range(2):
+        respons = client.post("/integral/multi", json=permintaan)
+        assert respons.headers["X-Cache"] == "MISS"
+        assert respons.headers["Cache-Control"] == "no-store"
+        assert respons.json()["alasan_analitik"]
+
+
+def test_antrian_penuh_dibalas_503(client, monkeypatch):
+    monkeypatch.setattr(executor, "_aktif", compute_stats()["kapasitas"])
+    respons = client.post(
+        "/turunan/",
+        data={"metode": "selisih-maju", "fungsi_latex": "x", "x": 1, "h": 0.1},
+    )
+    assert respons.status_code == 503
+    assert "Retry-After" in respons.headers
+
+
+def test_worker_simbolik_tidak_tersedia_dibalas_503(client, monkeypatch):
+    def tidak_tersedia(fungsi_latex):
+        raise SymbolicUnavailableError("Antrian komputasi simbolik sedang penuh.")
+
+    monkeypatch.setattr(derivative_routes, "parse_latex_to_python", tidak_tersedia)
+    respons = client.post(
+        "/turunan/",
+        data={"metode": "selisih-maju", "fungsi_latex": "x^5", "x": 1, "h": 0.1},
+    )
+    assert respons.status_code == 503
+    assert "Retry-After" in respons.headers
+
+
+def test_turunan_batch(client):
+    respons = client.post(
+        "/turunan/batch",
+        json={
+            "fungsi_latex": "x^2",
+            "metode": ["selisih-maju", "selisih-tengahan"],
+            "x": [1, 2],
+            "h": [0.1],
+        },
+    )
+    assert respons.status_code == 200
+    hasil = respons.json()
+    # Satu hasil per kombinasi metode x x x h
+    assert hasil["metode"] == ["selisih-maju"] * 2 + ["selisih-tengahan"] * 2
+    assert hasil["hasil_numerik"] == [2.1, 4.1, 2.0, 4.0]
+    assert hasil["hasil_analitik"] == [2.0, 4.0, 2.0, 4.0]
+
+
+def test_turunan_batch_titik_tidak_valid(client):
+    # Regresi: satu titik di luar domain dulu membuat seluruh batch dibalas 400
+    respons = client.post(
+        "/turunan/batch",
+        json={
+            "fungsi_latex": "\\ln(x)",
+            "metode": ["selisih-tengahan"],
+            "x": [-1, 2],
+            "h": [0.001],
+        },
+    )
+    assert respons.status_code == 200
+    hasil = respons.json()
+    assert hasil["hasil_numerik"][0] is None
+    assert hasil["alasan_titik"][0]
+    assert hasil["hasil_numerik"][1] == 0.5
+
+
+def test_integral_batch(client):
+    respons = client.post(
+        "/integral/batch",
+        json={
+            "fungsi_latex": "x^2",
+            "metode": ["trapezoida", "simpson"],
+            "interval": [[0, 3], [0, 1]],
+            "N": [6],
+        },
+    )
+    assert respons.status_code == 200
+    hasil = respons.json()
+    assert hasil["hasil_numerik"] == [9.125, 9.0, 0.338, 0.333]
+    assert hasil["hasil_analitik"] == [9.0, 9.0, 0.333, 0.333]
+
+
+def test_turunan_stensil_h_otomatis(client):
+    respons = client.post(
+        "/turunan/",
+        data={
+            "metode": "stensil",
+            "fungsi_latex": "x^3",
+            "x": 2,
+            "orde_turunan": 2,
+            "orde_akurasi": 4,
+        },
+    )
+    assert respons.status_code == 200
+    hasil = respons.json()
+    assert hasil["hasil_numerik"] == hasil["hasil_analitik"] == 12.0
+    assert hasil["input_h"] > 0
+
+
+def test_turunan_referensi_kompleks(client):
+    respons = client.post(
+        "/turunan/",
+        data={
+            "metode": "selisih-tengahan",
+            "fungsi_latex": "x^3",
+            "x": 2,
+            "h": 0.01,
+            "referensi": "kompleks",
+        },
+    )
+    assert respons.status_code == 200
+    hasil = respons.json()
+    assert hasil["hasil_analitik"] == 12.0
+    # Acuan langkah kompleks tidak memakai sympy
+    assert hasil["turunan_fungsi"] is None
+
+
+def test_turunan_langkah_kompleks_nilai_mutlak(client):
+    # Regresi: langkah kompleks pada |x| memberi 0 alih-alih sign(x)
+    respons = client.post(
+        "/turunan/",
+        data={"metode": "langkah-kompleks", "fungsi_latex": "|x|", "x": 2},
+    )
+    assert respons.status_code == 400
+
+
+def test_turunan_referensi_kompleks_kembali_ke_simbolik(client):
+    respons = client.post(
+        "/turunan/",
+        data={
+            "metode": "selisih-tengahan",
+            "fungsi_latex": "|x|",
+            "x": 2,
+            "h": 0.1,
+            "referensi": "kompleks",
+        },
+    )
+    assert respons.status_code == 200
+    assert respons.json()["hasil_numerik"] == 1.0
+    assert respons.json()["jalur_analitik"] != "kompleks"
+
+
+def test_metrics(client):
+    client.post(
+        "/integral/",
+        data={
+            "metode": "trapezoida",
+            "fungsi_latex": "x",
+            "batas_bawah": 0,
+            "batas_atas": 1,
+            "N": 4,
+        },
+    )
+    respons = client.get("/metrics")
+    assert respons.status_code == 200
+    assert (
+        'metode_numerik_evaluasi_fungsi_count{endpoint="/integral/",metode="trapezoida"}'
+        in respons.text
+    )
+    assert 'tahap="numerik"' in respons.text
+
+
+def test_konvergensi_integral_ndjson(client):
+    respons = client.post(
+        "/integral/konvergensi",
+        data={
+            "metode": "trapezoida",
+            "fungsi_latex": "x^2",
+            "batas_bawah": 0,
+            "batas_atas": 1,
+            "maks_level": 4,
+        },
+    )
+    assert respons.status_code == 200
+    assert respons.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(baris) for baris in respons.text.splitlines()]
+    assert [e["jenis"] for e in events] == ["mulai"] + ["langkah"] * 5 + ["selesai"]
+    assert [e["N"] for e in events[1:-1]] == [1, 2, 4, 8, 16]
+    # Titik N sebelumnya dipakai ulang: N + 1 evaluasi total, bukan jumlah semua N + 1
+    assert events[-1]["jumlah_evaluasi"] == 17
+    assert events[-1]["alasan"] == "maks_level"
+
+
+def test_konvergensi_turunan_sse_berhenti_di_toleransi(client):
+    respons = client.post(
+        "/turunan/konvergensi",
+        data={
+            "metode": "selisih-tengahan",
+            "fungsi_latex": "x^3",
+            "x": 2,
+            "h": 0.1,
+            "toleransi": 1e-4,
+            "format": "sse",
+        },
+    )
+    assert respons.status_code == 200
+    assert respons.headers["content-type"].startswith("text/event-stream")
+    data = [
+        json.loads(baris[len("data: ") :])
+        for baris in respons.text.splitlines()
+        if baris.startswith("data: ")
+    ]
+    assert data[0]["hasil_analitik"] == 12.0
+    assert data[-1]["jenis"] == "selesai"
+    assert data[-1]["alasan"] == "toleransi"
+
+
+def test_konvergensi_metode_tidak_valid(client):
+    respons = client.post(
+        "/turunan/konvergensi",
+        data={"metode": "stensil", "fungsi_latex": "x^3", "x": 2, "h": 0.1},
+    )
+    assert respons.status_code == 400
+
+
+@pytest.mark.parametrize("akumulasi, status", [("fsum", 200), ("acak", 400)])
+def test_integral_akumulasi(client, akumulasi, status):
+    respons = client.post(
+        "/integral/",
+        data={
+            "metode": "trapezoida",
+            "fungsi_latex": "x",
+            "batas_bawah": 0,
+            "batas_atas": 1,
+            "N": 10,
+            "akumulasi": akumulasi,
+        },
+    )
+    assert respons.status_code == status
+    if status == 200:
+        assert respons.json()["akumulasi"] == "fsum"
+        assert respons.json()["estimasi_error_pembulatan"] > 0
+
+
+@pytest.mark.parametrize("N, status", [(1, 400), (3, 400), (4, 200)])
+def test_integral_multi_simpson_n_ganjil(client, N, status):
+    # Regresi: N ganjil memberi 0.166 (bukan 0.25) untuk x*y pada [0, 1]^2
+    respons = client.post(
+        "/integral/multi",
+        json={
+            "fungsi_latex": "x y",
+            "batas": [[0, 1], [0, 1]],
+            "metode": "simpson",
+            "N": N,
+        },
+    )
+    assert respons.status_code == status
+    if status == 200:
+        assert respons.json()["hasil_numerik"] == 0.25
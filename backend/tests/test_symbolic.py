@@ -0,0 +1,109 @@
+import warnings
+
+import numpy as np
+from sympy import I, Symbol, log, sqrt
+
+from services import symbolic
+from services.integral_module import integral_analitik
+from services.symbolic import (
+    antiturunan_simbolik,
+    evaluasi_simbolik,
+    fungsi_numerik,
+    nilai_antiturunan_simbolik,
+    pemanasan_simbolik,
+    symbolic_cache_stats,
+    turunan_simbolik,
+)
+
+
+def test_turunan_simbolik_memakai_cache():
+    hasil = turunan_simbolik("np.sin(x)")
+    assert hasil["latex"] == r"\cos{\left(x \right)}"
+    assert turunan_simbolik("np.sin(x)") is hasil
+
+
+def test_antiturunan_simbolik():
+    hasil = antiturunan_simbolik("x**2")
+    assert hasil["latex"] == r"\frac{x^{3}}{3}"
+    assert hasil["latex_fungsi"] == "x^{2}"
+
+
+def test_integral_analitik():
+    nilai, latex_integral = integral_analitik("x**2", 0, 3)
+    assert nilai == 9.0
+    assert latex_integral.startswith(r"\int_{0}^{3} x^{2}dx")
+    assert integral_analitik("1/x", 1, 2)[0] == 0.693
+
+
+def test_evaluasi_simbolik():
+    turunan = turunan_simbolik("x**3")["expr"]
+    np.testing.assert_array_equal(
+        evaluasi_simbolik(turunan, [1.0, 2.0]), np.array([3.0, 12.0])
+    )
+    assert evaluasi_simbolik(turunan, 2.0).shape == ()
+    # Callable hasil lambdify disimpan di cache
+    assert fungsi_numerik(turunan) is fungsi_numerik(turunan)
+
+
+def test_evaluasi_simbolik_konstan():
+    # Turunan konstan menghasilkan skalar yang di-broadcast ke bentuk input
+    turunan = turunan_simbolik("2*x")["expr"]
+    np.testing.assert_array_equal(evaluasi_simbolik(turunan, [1.0, 5.0]), [2.0, 2.0])
+
+
+def test_pemanasan_simbolik_mengisi_cache():
+    pemanasan_simbolik(["x^{7}"])
+    hits = symbolic_cache_stats()["hits"]
+    assert turunan_simbolik("x**7")["latex"] == "7 x^{6}"
+    assert antiturunan_simbolik("x**7")["latex"] == r"\frac{x^{8}}{8}"
+    assert symbolic_cache_stats()["hits"] == hits + 2
+
+
+def test_pemanasan_simbolik_melewati_latex_tidak_valid():
+    pemanasan_simbolik(["\\frac{", "x^{9}"])
+    assert turunan_simbolik("x**9")["latex"] == "9 x^{8}"
+
+
+def test_nilai_antiturunan_simbolik():
+    x = Symbol("x")
+    # 1/x singular di x = 0, sehingga teorema dasar kalkulus tidak dipakai
+    assert nilai_antiturunan_simbolik(1 / x, log(x), -1, 1) is None
+    assert nilai_antiturunan_simbolik(x, x**2 / 2, 0, 2) == 2.0
+    # Fungsi mulus dengan nilai cepat tidak perlu dihitung ulang
+    assert nilai_antiturunan_simbolik(x, x**2 / 2, 0, 2, False, 2.5) == 2.5
+
+
+def test_evaluasi_simbolik_nilai_tidak_hingga_dan_kompleks():
+    # Regresi: titik non-finite dulu dihitung ulang dengan subs/evalf di thread
+    # permintaan (tanpa batas waktu) dan nilai kompleks memicu TypeError
+    x = Symbol("x")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        np.testing.assert_array_equal(
+            evaluasi_simbolik(1 / x, [0.0, 2.0]), [np.inf, 0.5]
+        )
+        np.testing.assert_array_equal(
+            evaluasi_simbolik(1 / (2 * sqrt(x)), [-1.0, 4.0]), [np.nan, 0.25]
+        )
+        np.testing.assert_array_equal(
+            evaluasi_simbolik(1 + I * x, [1.0, 0.0]), [np.nan, 1.0]
+        )
+
+
+def test_evaluasi_simbolik_callable_gagal_lewat_pool(monkeypatch):
+    x = Symbol("x")
+    dipanggil = []
+
+    def gagal(expr):
+        raise NameError("erf")
+
+    def run_symbolic(fungsi, *args):
+        dipanggil.append(fungsi)
+        return fungsi(*args)
+
+    monkeypatch.setattr(symbolic, "fungsi_numerik", gagal)
+    monkeypatch.setattr(symbolic, "run_symbolic", run_symbolic)
+    np.testing.assert_array_equal(
+        evaluasi_simbolik(1 / sqrt(x), [[-1.0, 4.0]]), [[np.nan, 0.5]]
+    )
+    assert len(dipanggil) == 1
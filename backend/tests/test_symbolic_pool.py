@@ -0,0 +1,41 @@
+import math
+import threading
+import time
+
+import pytest
+
+from services import symbolic_pool
+from services.symbolic_pool import SymbolicTimeoutError, run_symbolic
+
+
+def test_tanpa_pool_dijalankan_langsung():
+    assert run_symbolic(math.sqrt, 4.0) == 2.0
+
+
+def test_batas_waktu(monkeypatch):
+    monkeypatch.setattr(symbolic_pool, "SYMBOLIC_POOL_SIZE", 1)
+    with pytest.raises(SymbolicTimeoutError):
+        run_symbolic(time.sleep, 10, timeout=0.5)
+    # Worker yang macet dihentikan; tugas berikutnya tetap dilayani
+    assert run_symbolic(math.sqrt, 4.0) == 2.0
+
+
+def test_batas_waktu_tidak_menghentikan_worker_lain(monkeypatch):
+    # Regresi: batas waktu dulu mematikan seluruh pool beserta tugas di worker lain
+    monkeypatch.setattr(symbolic_pool, "SYMBOLIC_POOL_SIZE", 2)
+    hasil = []
+
+    def tugas_lain():
+        try:
+            run_symbolic(time.sleep, 3)
+            hasil.append(run_symbolic(math.sqrt, 9.0))
+        except Exception as e:
+            hasil.append(e)
+
+    thread = threading.Thread(target=tugas_lain)
+    thread.start()
+    time.sleep(0.2)
+    with pytest.raises(SymbolicTimeoutError):
+        run_symbolic(time.sleep, 10, timeout=0.5)
+    thread.join()
+    assert hasil == [3.0]
@@ -0,0 +1,32 @@
+import numpy as np
+
+from services.integral_module import trapezoida_integral
+from services.tracing import Tracer
+
+
+def test_tracer_membatasi_buffer():
+    tracer = Tracer(kapasitas=3)
+    tracer.catat(np.arange(5.0), np.arange(5.0) ** 2, 0.5)
+    assert tracer.total_baris == 5
+    assert tracer.terpotong
+    assert [(b.i, b.x, b.f_x, b.bobot) for b in tracer.tabel()] == [
+        (0, 0.0, 0.0, 0.5),
+        (1, 1.0, 1.0, 0.5),
+        (2, 2.0, 4.0, 0.5),
+    ]
+
+
+def test_tracer_nilai_tidak_hingga_menjadi_none():
+    tracer = Tracer()
+    tracer.catat([0.0, 1.0], [np.inf, 1.0])
+    assert tracer.tabel()[0].f_x is None
+    assert tracer.tabel()[1].bobot is None
+
+
+def test_trace_integral():
+    tracer = Tracer()
+    assert trapezoida_integral("x", 4, 0, 1, tracer=tracer) == 0.5
+    tabel = tracer.tabel()
+    assert len(tabel) == 5 and not tracer.terpotong
+    # Bobot trapezoida sudah dikali h = 0.25
+    assert [b.bobot for b in tabel] == [0.125, 0.25, 0.25, 0.25, 0.125]
@@ -0,0 +1,136 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from services import utils
+from services.utils import (
+    compile_func,
+    compiled_cache_stats,
+    eval_func,
+    eval_func_array,
+    eval_func_grid,
+    normalisasi_latex,
+    parse_cache_stats,
+    parse_latex_to_python,
+    pemanasan,
+    validasi_ekspresi,
+)
+
+
+def test_compile_func_memakai_cache():
+    fungsi = compile_func("x**2 + 1")
+    sebelum = compiled_cache_stats()["hits"]
+    # Spasi tidak memengaruhi kunci cache
+    assert compile_func(" x ** 2 + 1 ") is fungsi
+    assert compiled_cache_stats()["hits"] == sebelum + 1
+
+
+def test_eval_func():
+    assert eval_func("x**2 + 1", 2.0) == 5.0
+    np.testing.assert_allclose(
+        eval_func("np.sin(x)", np.array([0.0, np.pi / 2])), [0, 1]
+    )
+
+
+def test_sintaks_tidak_valid():
+    with pytest.raises(ValueError):
+        compile_func("x +* 2")
+
+
+def test_eval_func_array():
+    x = np.linspace(0, 1, 5)
+    np.testing.assert_allclose(eval_func_array("x**2", x), x**2)
+    # Hasil skalar (fungsi konstan) di-broadcast ke bentuk x
+    np.testing.assert_array_equal(eval_func_array("3", x), np.full(5, 3.0))
+
+
+def test_eval_func_array_hanya_titik_tak_hingga_diulang(monkeypatch):
+    # Regresi: satu titik NaN/inf dulu memicu evaluasi ulang seluruh array
+    # per titik, di luar np.errstate sehingga muncul RuntimeWarning
+    jumlah_panggil = []
+    compile_asli = utils.compile_func
+
+    def compile_terhitung(*args, **kwargs):
+        f = compile_asli(*args, **kwargs)
+
+        def terhitung(*nilai):
+            jumlah_panggil.append(1)
+            return f(*nilai)
+
+        return terhitung
+
+    monkeypatch.setattr(utils, "compile_func", compile_terhitung)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        hasil = eval_func_array("np.log(x)", [0.0, 1.0, -1.0, np.e])
+        np.testing.assert_array_equal(hasil, [-np.inf, 0.0, np.nan, 1.0])
+        # Satu pemanggilan vektor + dua titik non-finite
+        assert len(jumlah_panggil) == 3
+
+        hasil = eval_func_grid(
+            "np.sqrt(x*y)", [[-1.0, 1.0], [[1.0], [4.0]]], variabel=("x", "y")
+        )
+        np.testing.assert_array_equal(hasil, [[np.nan, 1.0], [np.nan, 2.0]])
+
+
+def test_eval_func_array_error_domain_tetap_dilaporkan():
+    with pytest.raises(ValueError, match="x=0.0"):
+        eval_func_array("1/x", [0.0, 1.0])
+
+
+@pytest.mark.parametrize(
+    "fungsi", ["np.sin(x) + x**2", "sqrt(x) * pi", "np.log(x, 2)", "e**x"]
+)
+def test_ekspresi_diizinkan(fungsi):
+    validasi_ekspresi(fungsi)
+
+
+@pytest.mark.parametrize(
+    "fungsi",
+    [
+        "__import__('os').system('ls')",
+        "np.os",
+        "(lambda: 1)()",
+        "x.__class__",
+        "open('f')",
+        "np.sin(x=1)",
+        "'teks'",
+        "y + 1",
+        "[x for x in range(3)]",
+        "x**10**10",
+    ],
+)
+def test_ekspresi_ditolak(fungsi):
+    with pytest.raises(ValueError):
+        validasi_ekspresi(fungsi)
+    # compile_func memakai validasi yang sama sebelum mengkompilasi
+    with pytest.raises(ValueError):
+        compile_func(fungsi)
+
+
+def test_normalisasi_latex():
+    assert normalisasi_latex(" $x^{2}$ ") == "x^{2}"
+    # Spasi di tengah dipertahankan, hanya diringkas
+    assert normalisasi_latex(r"\sin   x") == r"\sin x"
+
+
+def test_parse_latex_memakai_cache():
+    assert parse_latex_to_python("x^{4} + 1") == "x**4 + 1"
+    sebelum = parse_cache_stats()
+    assert parse_latex_to_python(" x^{4} + 1 ") == "x**4 + 1"
+    sesudah = parse_cache_stats()
+    assert sesudah["hits"] == sebelum["hits"] + 1
+    assert sesudah["parse_count"] == sebelum["parse_count"]
+
+
+def test_pemanasan_mengisi_cache():
+    pemanasan(["x^{5} - x"])
+    sebelum = parse_cache_stats()["parse_count"]
+    parse_latex_to_python("x^{5} - x")
+    assert parse_cache_stats()["parse_count"] == sebelum
+
+
+def test_latex_tidak_valid():
+    with pytest.raises(ValueError):
+        parse_latex_to_python(r"\frac{")